@@ -0,0 +1,273 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Load generator for the RPC stack: an echo or compute service is served in process by an InMemoryRpcServer
+# over a LoopbackUTransport and driven by an InMemoryRpcClient, so that every call goes through the library
+# request building, attribute validation, listener dispatch and response correlation.
+#
+# Each scenario (service, client kind, concurrency, payload size) reports the throughput, the p50/p99/p999
+# latencies and the allocations per call: the difference in the number of memory blocks traced by tracemalloc
+# across the measured calls divided by the number of calls (a leak indicator). The tracemalloc peak bytes
+# allocated by one call are reported too.
+#
+# Usage: python -m benchmarks.rpc.bench_rpcload [--service echo compute] [--client sync async]
+#        [--concurrency 1 8] [--payload-sizes 16 1024] [--methods N] [--requests N] [--transport-threads N]
+#        [--json] [--output FILE]
+
+import argparse
+import asyncio
+import gc
+import hashlib
+import json
+import platform
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+from google.protobuf.wrappers_pb2 import BytesValue
+
+from uprotocol.proto.uattributes_pb2 import CallOptions
+from uprotocol.proto.uri_pb2 import UEntity, UUri
+from uprotocol.proto.ustatus_pb2 import UCode
+from uprotocol.rpc.inmemoryrpcclient import InMemoryRpcClient
+from uprotocol.rpc.inmemoryrpcserver import InMemoryRpcServer
+from uprotocol.rpc.requesthandler import RequestHandler
+from uprotocol.rpc.rpcmapper import RpcMapper
+from uprotocol.transport.builder.upayloadbuilder import UPayloadBuilder
+from uprotocol.transport.loopbackutransport import LoopbackUTransport
+from uprotocol.uri.factory.uresourcebuilder import UResourceBuilder
+
+SERVICE_ENTITY = UEntity(name="bench.service", id=0x100, version_major=1)
+CLIENT_ENTITY = UEntity(name="bench.client", id=0x101, version_major=1)
+
+
+class EchoHandler(RequestHandler):
+    def handle_request(self, request):
+        return request.payload
+
+
+class ComputeHandler(RequestHandler):
+    def __init__(self, rounds: int):
+        self.rounds = rounds
+
+    def handle_request(self, request):
+        digest = UPayloadBuilder.unpack(request.payload, BytesValue).value
+        for _ in range(self.rounds):
+            digest = hashlib.sha256(digest).digest()
+        return UPayloadBuilder.pack_to_any(BytesValue(value=digest))
+
+
+class Deployment:
+    """
+    Server, client and transport of one scenario.
+    """
+
+    def __init__(self, service: str, methods: int, transport_threads: int, compute_rounds: int):
+        self.executor = ThreadPoolExecutor(transport_threads) if transport_threads > 0 else None
+        self.transport = LoopbackUTransport(self.executor)
+        self.server = InMemoryRpcServer(self.transport)
+        handler = EchoHandler() if service == "echo" else ComputeHandler(compute_rounds)
+        self.method_uris = []
+        for index in range(methods):
+            method_uri = UUri(
+                entity=SERVICE_ENTITY, resource=UResourceBuilder.for_rpc_request(f"Method{index}", index + 1)
+            )
+            status = self.server.register_request_handler(method_uri, handler)
+            if status.code != UCode.OK:
+                raise RuntimeError(f"Failed to register {method_uri}: {status.message}")
+            self.method_uris.append(method_uri)
+        source = UUri(entity=CLIENT_ENTITY, resource=UResourceBuilder.for_rpc_response())
+        self.client = InMemoryRpcClient(self.transport, source)
+
+    def close(self):
+        self.client.close()
+        if self.executor is not None:
+            self.executor.shutdown()
+
+
+def percentile(ordered, fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run_sync(deployment: Deployment, payload, options, requests: int, concurrency: int):
+    client = deployment.client
+    method_uris = deployment.method_uris
+
+    def worker(offset: int, count: int):
+        latencies = []
+        errors = 0
+        for index in range(offset, offset + count):
+            start = time.perf_counter()
+            response = client.invoke_method(method_uris[index % len(method_uris)], payload, options).result()
+            latencies.append(time.perf_counter() - start)
+            errors += RpcMapper.is_failure_response(response)
+        return latencies, errors
+
+    per_worker = max(1, requests // concurrency)
+    with ThreadPoolExecutor(concurrency) as pool:
+        futures = [pool.submit(worker, index * per_worker, per_worker) for index in range(concurrency)]
+        return [future.result() for future in futures]
+
+
+def run_async(deployment: Deployment, payload, options, requests: int, concurrency: int):
+    client = deployment.client
+    method_uris = deployment.method_uris
+
+    async def worker(offset: int, count: int):
+        latencies = []
+        errors = 0
+        for index in range(offset, offset + count):
+            start = time.perf_counter()
+            future = client.invoke_method(method_uris[index % len(method_uris)], payload, options)
+            response = await asyncio.wrap_future(future)
+            latencies.append(time.perf_counter() - start)
+            errors += RpcMapper.is_failure_response(response)
+        return latencies, errors
+
+    async def main():
+        per_worker = max(1, requests // concurrency)
+        return await asyncio.gather(*(worker(index * per_worker, per_worker) for index in range(concurrency)))
+
+    return asyncio.run(main())
+
+
+def measure_allocations(deployment: Deployment, payload, options, samples: int):
+    client = deployment.client
+    method_uri = deployment.method_uris[0]
+
+    tracemalloc.start()
+    try:
+        total = 0
+        for _ in range(samples):
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            client.invoke_method(method_uri, payload, options).result()
+            total += tracemalloc.get_traced_memory()[1] - baseline
+
+        gc.collect()
+        blocks = len(tracemalloc.take_snapshot().traces)
+        for _ in range(samples):
+            client.invoke_method(method_uri, payload, options).result()
+        gc.collect()
+        allocations = len(tracemalloc.take_snapshot().traces) - blocks
+    finally:
+        tracemalloc.stop()
+    return total / samples, allocations / samples
+
+
+def run_scenario(args, service: str, client_kind: str, concurrency: int, payload_size: int):
+    deployment = Deployment(service, args.methods, args.transport_threads, args.compute_rounds)
+    try:
+        payload = UPayloadBuilder.pack_to_any(BytesValue(value=b"x" * payload_size))
+        options = CallOptions(ttl=args.ttl)
+        runner = run_sync if client_kind == "sync" else run_async
+
+        runner(deployment, payload, options, min(args.requests, 1000), concurrency)
+        start = time.perf_counter()
+        outcomes = runner(deployment, payload, options, args.requests, concurrency)
+        elapsed = time.perf_counter() - start
+        peak_bytes, allocations = measure_allocations(deployment, payload, options, args.allocation_samples)
+    finally:
+        deployment.close()
+
+    latencies = sorted(latency for worker_latencies, _ in outcomes for latency in worker_latencies)
+    return {
+        "service": service,
+        "client": client_kind,
+        "concurrency": concurrency,
+        "payload_bytes": payload_size,
+        "methods": args.methods,
+        "requests": len(latencies),
+        "errors": sum(errors for _, errors in outcomes),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "latency_us": {
+            "p50": round(percentile(latencies, 0.50) * 1e6, 1),
+            "p99": round(percentile(latencies, 0.99) * 1e6, 1),
+            "p999": round(percentile(latencies, 0.999) * 1e6, 1),
+            "mean": round(sum(latencies) / len(latencies) * 1e6, 1),
+            "max": round(latencies[-1] * 1e6, 1),
+        },
+        "allocations_per_call": round(allocations, 2),
+        "peak_bytes_per_call": round(peak_bytes, 1),
+    }
+
+
+def run(args):
+    results = []
+    for service in args.service:
+        for client_kind in args.client:
+            for concurrency in args.concurrency:
+                for payload_size in args.payload_sizes:
+                    results.append(run_scenario(args, service, client_kind, concurrency, payload_size))
+    return {
+        "environment": {"python": platform.python_version(), "implementation": platform.python_implementation()},
+        "config": {
+            "requests": args.requests,
+            "methods": args.methods,
+            "transport_threads": args.transport_threads,
+            "compute_rounds": args.compute_rounds,
+            "ttl": args.ttl,
+        },
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure RPC throughput, latency and allocations per call.")
+    parser.add_argument("--service", nargs="+", choices=("echo", "compute"), default=["echo", "compute"])
+    parser.add_argument("--client", nargs="+", choices=("sync", "async"), default=["sync", "async"])
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 8])
+    parser.add_argument("--payload-sizes", nargs="+", type=int, default=[16, 1024])
+    parser.add_argument("--methods", type=int, default=4, help="number of methods served by the service")
+    parser.add_argument("--requests", type=int, default=20000, help="requests per scenario")
+    parser.add_argument(
+        "--transport-threads", type=int, default=0, help="threads delivering messages, 0 to deliver inline"
+    )
+    parser.add_argument("--compute-rounds", type=int, default=16, help="sha256 rounds done by the compute service")
+    parser.add_argument("--ttl", type=int, default=5000, help="ttl of the requests in milliseconds")
+    parser.add_argument("--allocation-samples", type=int, default=200)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    parser.add_argument("--output", help="write the JSON report to a file")
+    args = parser.parse_args()
+
+    report = run(args)
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print(
+        f"{'service':<9}{'client':<7}{'conc':>5}{'bytes':>7}{'req/s':>11}{'p50 us':>9}{'p99 us':>9}"
+        f"{'p999 us':>9}{'allocs':>8}{'peak B':>9}{'errors':>8}"
+    )
+    for r in report["results"]:
+        latency = r["latency_us"]
+        print(
+            f"{r['service']:<9}{r['client']:<7}{r['concurrency']:>5}{r['payload_bytes']:>7}{r['throughput_rps']:>11}"
+            f"{latency['p50']:>9}{latency['p99']:>9}{latency['p999']:>9}{r['allocations_per_call']:>8}"
+            f"{r['peak_bytes_per_call']:>9}{r['errors']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Compare the Any unpacking done by RpcMapper and UPayloadBuilder before and after the TypeRegistry.
+#
+# The legacy path builds an Any message, parses it, checks Any.Is() (which splits the type_url) and parses the
+# copied value into a fresh instance. The registry path scans the serialized Any in place, resolves the class
+# with a dictionary lookup and parses the value once. Without an expected class, legacy_resolve parses the Any,
+# resolves the class of its type_url and unpacks it with Any.Unpack(), where registry_resolve reads the class
+# from the leading type_url. Times are the best of --repeat rounds of --iterations calls, peak bytes are the
+# Python heap bytes traced by tracemalloc while unpacking one response.
+#
+# Usage: python -m benchmarks.rpc.bench_typeregistry [--iterations N] [--repeat N] [--json]
+
+import argparse
+import json
+import time
+import tracemalloc
+
+from google.protobuf.any_pb2 import Any
+from google.protobuf.api_pb2 import Api, Method
+from google.protobuf.wrappers_pb2 import Int32Value, StringValue
+
+from uprotocol.transport.builder.typeregistry import TypeRegistry
+
+
+def legacy_unpack(data: bytes, expected_cls):
+    any_message = Any()
+    any_message.ParseFromString(data)
+    if any_message.Is(expected_cls.DESCRIPTOR):
+        message = expected_cls()
+        message.ParseFromString(any_message.value)
+        return message
+    return None
+
+
+def legacy_resolve_unpack(data: bytes, expected_cls, registry=TypeRegistry.default()):
+    any_message = Any()
+    any_message.ParseFromString(data)
+    clazz = registry.resolve(any_message.type_url)
+    if clazz is None:
+        return None
+    message = clazz()
+    any_message.Unpack(message)
+    return message
+
+
+def registry_unpack(data: bytes, expected_cls, registry=TypeRegistry.default()):
+    return registry.unpack(data, expected_cls)
+
+
+def registry_resolve_unpack(data: bytes, expected_cls, registry=TypeRegistry.default()):
+    return registry.unpack(data)
+
+
+def build_corpus():
+    api = Api(name="uprotocol.core.Service", version="1")
+    for index in range(32):
+        api.methods.append(Method(name=f"Method{index}", request_type_url="req", response_type_url="resp"))
+    corpus = {}
+    for label, message in (
+        ("int32", Int32Value(value=42)),
+        ("string_1k", StringValue(value="x" * 1024)),
+        ("api_32_methods", api),
+    ):
+        any_message = Any()
+        any_message.Pack(message)
+        corpus[label] = (any_message.SerializeToString(), type(message))
+    return corpus
+
+
+def time_per_call(function, data, clazz, iterations, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            function(data, clazz)
+        best = min(best, time.perf_counter() - start)
+    return best / iterations * 1e9
+
+
+def peak_bytes_per_call(function, data, clazz, samples=200):
+    tracemalloc.start()
+    try:
+        total = 0
+        for _ in range(samples):
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            function(data, clazz)
+            total += tracemalloc.get_traced_memory()[1] - baseline
+        return total / samples
+    finally:
+        tracemalloc.stop()
+
+
+def run(iterations: int, repeat: int):
+    results = []
+    paths = (
+        ("legacy", legacy_unpack),
+        ("registry", registry_unpack),
+        ("legacy_resolve", legacy_resolve_unpack),
+        ("registry_resolve", registry_resolve_unpack),
+    )
+    for label, (data, clazz) in build_corpus().items():
+        for path, function in paths:
+            assert function(data, clazz) == legacy_unpack(data, clazz)
+            function(data, clazz)
+            result = {
+                "payload": label,
+                "payload_bytes": len(data),
+                "path": path,
+                "ns_per_call": round(time_per_call(function, data, clazz, iterations, repeat), 1),
+                "peak_bytes_per_call": round(peak_bytes_per_call(function, data, clazz), 1),
+            }
+            results.append(result)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare legacy Any unpacking with the TypeRegistry.")
+    parser.add_argument("--iterations", type=int, default=50000, help="calls per round")
+    parser.add_argument("--repeat", type=int, default=5, help="rounds, the best one is reported")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.iterations, args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'payload':<16}{'bytes':>7}  {'path':<18}{'ns/call':>10}{'peak B/call':>13}")
+    for r in results:
+        print(
+            f"{r['payload']:<16}{r['payload_bytes']:>7}  {r['path']:<18}{r['ns_per_call']:>10}"
+            f"{r['peak_bytes_per_call']:>13}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Compare the long URI parsing of LongUriSerializer before and after the single-pass parser.
+#
+# The legacy path splits the URI on "/", copies the parts to drop the trailing empty ones, splits the resource
+# on "#" and "." the same way, builds standalone UAuthority, UEntity and UResource messages and copies them into
+# the UUri. The single-pass path finds the boundaries of each part with str.find() and fills the UUri in place.
+#
+# Usage: python -m benchmarks.uri.bench_longuriserializer [--iterations N] [--json]
+
+import argparse
+import json
+import time
+
+from uprotocol.proto.uri_pb2 import UAuthority, UEntity, UResource, UUri
+from uprotocol.uri.serializer.longuriserializer import LongUriSerializer
+
+CORPUS = {
+    "local_entity": "/body.access/1",
+    "local_topic": "/body.access/1/door.front_left#Door",
+    "local_rpc": "/core.usubscription/3/rpc.Subscribe",
+    "remote_topic": "//vcu.veh.gm.com/body.access/1/door.front_left#Door",
+    "remote_response": "//vcu.veh.gm.com/petapp/1/rpc.response",
+    "scheme_prefix": "up://vcu.veh.gm.com/body.access/1/door.front_left#Door",
+}
+
+
+def _remove_empty(parts):
+    result = parts[:]
+    while result and result[-1] == "":
+        result.pop()
+    return result
+
+
+def _legacy_parse_from_string(resource_string: str) -> UResource:
+    if resource_string is None or resource_string.strip() == "":
+        raise ValueError("Resource must have a command name.")
+    parts = _remove_empty(resource_string.split("#"))
+    name_and_instance_parts = _remove_empty(parts[0].split("."))
+    resource_name = name_and_instance_parts[0]
+    resource_instance = name_and_instance_parts[1] if len(name_and_instance_parts) > 1 else None
+    resource_message = parts[1] if len(parts) > 1 else None
+    u_resource = UResource(name=resource_name)
+    if resource_instance is not None:
+        u_resource.instance = resource_instance
+    if resource_message is not None:
+        u_resource.message = resource_message
+    if "rpc" in resource_name and resource_instance is not None and "response" in resource_instance:
+        u_resource.id = 0
+    return u_resource
+
+
+def legacy_deserialize(u_protocol_uri: str) -> UUri:
+    """
+    LongUriSerializer.deserialize() as it was before the single-pass parser.
+    """
+    if u_protocol_uri is None or u_protocol_uri.strip() == "":
+        return UUri()
+    uri = (
+        u_protocol_uri[u_protocol_uri.index(":") + 1 :] if ":" in u_protocol_uri else u_protocol_uri.replace("\\", "/")
+    )
+    is_local = not uri.startswith("//")
+    uri_parts = _remove_empty(uri.split("/"))
+    number_of_parts_in_uri = len(uri_parts)
+    if number_of_parts_in_uri == 0 or number_of_parts_in_uri == 1:
+        return UUri()
+
+    use_name = ""
+    use_version = ""
+    u_resource = None
+    u_authority = None
+    if is_local:
+        use_name = uri_parts[1]
+        if number_of_parts_in_uri > 2:
+            use_version = uri_parts[2]
+            if number_of_parts_in_uri > 3:
+                u_resource = _legacy_parse_from_string(uri_parts[3])
+    else:
+        if uri_parts[2].strip() == "":
+            return UUri()
+        u_authority = UAuthority(name=uri_parts[2])
+        if len(uri_parts) > 3:
+            use_name = uri_parts[3]
+            if number_of_parts_in_uri > 4:
+                use_version = uri_parts[4]
+                if number_of_parts_in_uri > 5:
+                    u_resource = _legacy_parse_from_string(uri_parts[5])
+        else:
+            return UUri(authority=u_authority)
+
+    use_version_int = None
+    try:
+        if use_version.strip() != "":
+            use_version_int = int(use_version)
+    except ValueError:
+        return UUri()
+    u_entity_builder = UEntity(name=use_name)
+    if use_version_int is not None:
+        u_entity_builder.version_major = use_version_int
+    new_uri = UUri(entity=u_entity_builder)
+    if u_authority is not None:
+        new_uri.authority.CopyFrom(u_authority)
+    if u_resource is not None:
+        new_uri.resource.CopyFrom(u_resource)
+    return new_uri
+
+
+def time_per_call(function, uri: str, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function(uri)
+    return (time.perf_counter() - start) / iterations * 1e9
+
+
+def run(iterations: int):
+    results = []
+    serializer = LongUriSerializer()
+    for label, uri in CORPUS.items():
+        assert serializer.deserialize(uri) == legacy_deserialize(uri), uri
+        legacy = time_per_call(legacy_deserialize, uri, iterations)
+        single_pass = time_per_call(serializer.deserialize, uri, iterations)
+        results.append(
+            {
+                "uri": label,
+                "length": len(uri),
+                "legacy_ns_per_call": round(legacy, 1),
+                "single_pass_ns_per_call": round(single_pass, 1),
+                "speedup": round(legacy / single_pass, 2),
+            }
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the legacy and single-pass long URI parsers.")
+    parser.add_argument("--iterations", type=int, default=100000)
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.iterations)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'uri':<18}{'length':>7}{'legacy ns':>12}{'single-pass ns':>16}{'speedup':>9}")
+    for r in results:
+        print(
+            f"{r['uri']:<18}{r['length']:>7}{r['legacy_ns_per_call']:>12}{r['single_pass_ns_per_call']:>16}"
+            f"{r['speedup']:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
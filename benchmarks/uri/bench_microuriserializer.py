@@ -0,0 +1,223 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Compare MicroUriSerializer before and after the struct based encoding, and the batch API.
+#
+# The legacy path appends the micro URI to a bytearray one byte at a time and looks the address type up with
+# an AddressType enum scan when decoding. The struct path packs and unpacks the 8 byte header in one call.
+# The batch section encodes and decodes a buffer of back to back micro URIs with serialize_many() and
+# deserialize_many(), against one serialize() or deserialize() call per URI, and reads the same buffer as a stream
+# of raw fields with iter_fields() and as an offset table with index().
+#
+# Usage: python -m benchmarks.uri.bench_microuriserializer [--iterations N] [--batch-size N] [--json]
+
+import argparse
+import json
+import socket
+import time
+
+from uprotocol.proto.uri_pb2 import UAuthority, UEntity, UUri
+from uprotocol.uri.factory.uresourcebuilder import UResourceBuilder
+from uprotocol.uri.serializer.microuriserializer import AddressType, MicroUriSerializer
+from uprotocol.uri.validator.urivalidator import UriValidator
+
+CORPUS = {
+    "local": UUri(entity=UEntity(id=29999, version_major=254), resource=UResourceBuilder.from_id(19999)),
+    "ipv4": UUri(
+        authority=UAuthority(ip=socket.inet_pton(socket.AF_INET, "192.168.1.100")),
+        entity=UEntity(id=29999, version_major=254),
+        resource=UResourceBuilder.from_id(0x8001),
+    ),
+    "ipv6": UUri(
+        authority=UAuthority(ip=socket.inet_pton(socket.AF_INET6, "2001:db8:85a3::8a2e:370:7334")),
+        entity=UEntity(id=29999, version_major=254),
+        resource=UResourceBuilder.for_rpc_response(),
+    ),
+    "id": UUri(
+        authority=UAuthority(id=b"vcu.my_car_vin"),
+        entity=UEntity(id=29999, version_major=254),
+        resource=UResourceBuilder.from_id(19999),
+    ),
+}
+
+
+def legacy_serialize(uri: UUri) -> bytes:
+    """
+    MicroUriSerializer.serialize() as it was before the struct based encoding.
+    """
+    if uri is None or UriValidator.is_empty(uri) or not UriValidator.is_micro_form(uri):
+        return bytearray()
+    maybe_ue_id = uri.entity.id
+    maybe_uresource_id = uri.resource.id
+    byte_arr = bytearray()
+    byte_arr.append(MicroUriSerializer.UP_VERSION)
+    address_type = AddressType.LOCAL
+    if uri.authority.HasField("ip"):
+        length = len(uri.authority.ip)
+        if length == 4:
+            address_type = AddressType.IPv4
+        elif length == 16:
+            address_type = AddressType.IPv6
+        else:
+            return bytearray()
+    elif uri.authority.HasField("id"):
+        address_type = AddressType.ID
+    byte_arr.append(address_type.value)
+    if maybe_uresource_id > 0xFFFF or maybe_ue_id > 0xFFFF:
+        return bytearray()
+    byte_arr.append((maybe_uresource_id >> 8) & 0xFF)
+    byte_arr.append(maybe_uresource_id & 0xFF)
+    byte_arr.append((maybe_ue_id >> 8) & 0xFF)
+    byte_arr.append(maybe_ue_id & 0xFF)
+    byte_arr.append(uri.entity.version_major & 0xFF)
+    byte_arr.append(0x0)
+    if address_type != AddressType.LOCAL:
+        if address_type == AddressType.ID:
+            if len(uri.authority.id) > MicroUriSerializer.MAX_ID_LENGTH:
+                return bytearray()
+            byte_arr.append(len(uri.authority.id) & 0xFF)
+        if uri.authority.HasField("ip"):
+            byte_arr.extend(bytearray(uri.authority.ip))
+        elif uri.authority.HasField("id"):
+            byte_arr.extend(bytearray(uri.authority.id))
+    return byte_arr
+
+
+def legacy_deserialize(micro_uri: bytes) -> UUri:
+    """
+    MicroUriSerializer.deserialize() as it was before the struct based decoding.
+    """
+    if micro_uri is None or len(micro_uri) < MicroUriSerializer.LOCAL_MICRO_URI_LENGTH:
+        return UUri()
+    if micro_uri[0] != MicroUriSerializer.UP_VERSION:
+        return UUri()
+    u_resource_id = ((micro_uri[2] & 0xFF) << 8) | (micro_uri[3] & 0xFF)
+    address_type = AddressType.from_value(micro_uri[1])
+    if address_type is None:
+        return UUri()
+    if address_type == AddressType.LOCAL and len(micro_uri) != MicroUriSerializer.LOCAL_MICRO_URI_LENGTH:
+        return UUri()
+    elif address_type == AddressType.IPv4 and len(micro_uri) != MicroUriSerializer.IPV4_MICRO_URI_LENGTH:
+        return UUri()
+    elif address_type == AddressType.IPv6 and len(micro_uri) != MicroUriSerializer.IPV6_MICRO_URI_LENGTH:
+        return UUri()
+    ue_id = ((micro_uri[4] & 0xFF) << 8) | (micro_uri[5] & 0xFF)
+    ui_version = micro_uri[6]
+    u_authority = None
+    if address_type in (AddressType.IPv4, AddressType.IPv6):
+        length = 4 if address_type == AddressType.IPv4 else 16
+        u_authority = UAuthority(ip=bytes(micro_uri[8 : 8 + length]))
+    elif address_type == AddressType.ID:
+        length = micro_uri[8]
+        u_authority = UAuthority(id=bytes(micro_uri[9 : 9 + length]))
+    uri = UUri(entity=UEntity(id=ue_id, version_major=ui_version), resource=UResourceBuilder.from_id(u_resource_id))
+    if u_authority is not None:
+        uri.authority.CopyFrom(u_authority)
+    return uri
+
+
+def time_per_call(function, argument, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function(argument)
+    return (time.perf_counter() - start) / iterations * 1e9
+
+
+def run(iterations: int, batch_size: int):
+    serializer = MicroUriSerializer()
+    per_uri = []
+    for label, uri in CORPUS.items():
+        micro_uri = bytes(serializer.serialize(uri))
+        assert micro_uri == legacy_serialize(uri), label
+        assert serializer.deserialize(micro_uri) == legacy_deserialize(micro_uri) == uri, label
+        legacy_serialize_ns = time_per_call(legacy_serialize, uri, iterations)
+        struct_serialize_ns = time_per_call(serializer.serialize, uri, iterations)
+        legacy_deserialize_ns = time_per_call(legacy_deserialize, micro_uri, iterations)
+        struct_deserialize_ns = time_per_call(serializer.deserialize, micro_uri, iterations)
+        per_uri.append(
+            {
+                "uri": label,
+                "length": len(micro_uri),
+                "legacy_serialize_ns": round(legacy_serialize_ns, 1),
+                "struct_serialize_ns": round(struct_serialize_ns, 1),
+                "legacy_deserialize_ns": round(legacy_deserialize_ns, 1),
+                "struct_deserialize_ns": round(struct_deserialize_ns, 1),
+            }
+        )
+
+    uris = [list(CORPUS.values())[i % len(CORPUS)] for i in range(batch_size)]
+    buffer = bytes(serializer.serialize_many(uris))
+    rounds = max(1, iterations // batch_size)
+
+    def serialize_loop(batch):
+        return b"".join(legacy_serialize(uri) for uri in batch)
+
+    def deserialize_loop(data):
+        uris, offset = [], 0
+        while offset < len(data):
+            uri, size = serializer.deserialize_from(data, offset)
+            uris.append(legacy_deserialize(data[offset : offset + size]))
+            offset += size
+        return uris
+
+    def read_fields(data):
+        return list(serializer.iter_fields(data))
+
+    assert serialize_loop(uris) == buffer
+    assert serializer.deserialize_many(buffer) == uris
+    batch = {
+        "batch_size": batch_size,
+        "legacy_serialize_ns_per_uri": round(time_per_call(serialize_loop, uris, rounds) / batch_size, 1),
+        "serialize_many_ns_per_uri": round(time_per_call(serializer.serialize_many, uris, rounds) / batch_size, 1),
+        "legacy_deserialize_ns_per_uri": round(time_per_call(deserialize_loop, buffer, rounds) / batch_size, 1),
+        "deserialize_many_ns_per_uri": round(
+            time_per_call(serializer.deserialize_many, buffer, rounds) / batch_size, 1
+        ),
+        "iter_fields_ns_per_uri": round(time_per_call(read_fields, buffer, rounds) / batch_size, 1),
+        "index_ns_per_uri": round(time_per_call(serializer.index, buffer, rounds) / batch_size, 1),
+    }
+    return {"per_uri": per_uri, "batch": batch}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the legacy and struct based micro URI serializers.")
+    parser.add_argument("--iterations", type=int, default=100000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.iterations, args.batch_size)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'uri':<8}{'length':>7}{'legacy ser ns':>15}{'struct ser ns':>15}{'legacy de ns':>14}{'struct de ns':>14}")
+    for r in results["per_uri"]:
+        print(
+            f"{r['uri']:<8}{r['length']:>7}{r['legacy_serialize_ns']:>15}{r['struct_serialize_ns']:>15}"
+            f"{r['legacy_deserialize_ns']:>14}{r['struct_deserialize_ns']:>14}"
+        )
+    for key, value in results["batch"].items():
+        print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Compare the IP authority handling of ShortUriSerializer before and after the cached authority codec.
+#
+# The legacy path validates an authority with inet_pton for IPv4 then IPv6 and converts it again, running
+# inet_pton up to four times, and serializes a packed address by trying inet_ntop for both families and catching
+# the failures. The codec picks the family from the content or the length once and memoizes the conversions.
+#
+# Usage: python -m benchmarks.uri.bench_shorturiserializer [--iterations N] [--json]
+
+import argparse
+import json
+import re
+import socket
+import time
+
+from uprotocol.proto.uri_pb2 import UAuthority, UEntity, UResource, UUri
+from uprotocol.uri.serializer.shorturiserializer import ShortUriSerializer
+
+DESERIALIZE_CORPUS = {
+    "local": "/29999/1/19999",
+    "ipv4": "//192.168.1.100/29999/1/19999",
+    "id": "//vcu.my_car_vin/29999/1/19999",
+}
+
+SERIALIZE_CORPUS = {
+    "ipv4": UUri(
+        authority=UAuthority(ip=socket.inet_pton(socket.AF_INET, "192.168.1.100")),
+        entity=UEntity(id=29999, version_major=1),
+        resource=UResource(id=19999),
+    ),
+    "ipv6": UUri(
+        authority=UAuthority(ip=socket.inet_pton(socket.AF_INET6, "2001:db8:85a3::8a2e:370:7334")),
+        entity=UEntity(id=29999, version_major=1),
+        resource=UResource(id=19999),
+    ),
+    "id": UUri(
+        authority=UAuthority(id=b"vcu.my_car_vin"),
+        entity=UEntity(id=29999, version_major=1),
+        resource=UResource(id=19999),
+    ),
+}
+
+
+def _legacy_is_valid_ipv4_address(ip_address):
+    try:
+        return len(ip_address.split(".")) == 4 and socket.inet_pton(socket.AF_INET, ip_address)
+    except OSError:
+        return False
+
+
+def _legacy_is_valid_ipv6_address(ip_address):
+    try:
+        return len(ip_address.split(":")) <= 8 and socket.inet_pton(socket.AF_INET6, ip_address)
+    except OSError:
+        return False
+
+
+def _legacy_ip_to_bytes(ip_address):
+    if _legacy_is_valid_ipv4_address(ip_address):
+        return bytes(socket.inet_pton(socket.AF_INET, ip_address))
+    elif _legacy_is_valid_ipv6_address(ip_address):
+        return bytes(socket.inet_pton(socket.AF_INET6, ip_address))
+    return b""
+
+
+def _legacy_packed_to_string(packed_ipaddr: bytes):
+    for address_type in [socket.AF_INET, socket.AF_INET6]:
+        try:
+            return socket.inet_ntop(address_type, packed_ipaddr)
+        except ValueError:
+            pass
+    raise Exception("Could not find correct address family to unpack ip address", "from bytes to str")
+
+
+def legacy_serialize(uri: UUri) -> str:
+    """
+    ShortUriSerializer.serialize() as it was before the cached authority codec.
+    """
+    string_builder = []
+    if uri.HasField("authority"):
+        if uri.authority.HasField("ip"):
+            try:
+                string_builder.append("//")
+                string_builder.append(_legacy_packed_to_string(uri.authority.ip))
+            except Exception:
+                return ""
+        elif uri.authority.HasField("id"):
+            string_builder.append("//")
+            string_builder.append(uri.authority.id.decode("utf-8"))
+        else:
+            return ""
+    string_builder.append("/")
+    string_builder.append(ShortUriSerializer.build_software_entity_part_of_uri(uri.entity))
+    string_builder.append(ShortUriSerializer.build_resource_part_of_uri(uri))
+    return re.sub("/+$", "", "".join(string_builder))
+
+
+def legacy_deserialize(uprotocol_uri: str) -> UUri:
+    """
+    ShortUriSerializer.deserialize() as it was before the cached authority codec.
+    """
+    uri = uprotocol_uri[uprotocol_uri.index(":") + 1 :] if ":" in uprotocol_uri else uprotocol_uri.replace("\\", "/")
+    is_local = not uri.startswith("//")
+    uri_parts = uri.split("/")
+    number_of_parts_in_uri = len(uri_parts)
+    if number_of_parts_in_uri < 2:
+        return UUri()
+    ue_id = ""
+    ue_version = ""
+    resource = None
+    authority = None
+    if is_local:
+        ue_id = uri_parts[1]
+        if number_of_parts_in_uri > 2:
+            ue_version = uri_parts[2]
+            if number_of_parts_in_uri > 3:
+                resource = ShortUriSerializer.parse_from_string(uri_parts[3])
+            if number_of_parts_in_uri > 4:
+                return UUri()
+    else:
+        if uri_parts[2].strip() == "":
+            return UUri()
+        if _legacy_is_valid_ipv4_address(uri_parts[2]) or _legacy_is_valid_ipv6_address(uri_parts[2]):
+            authority = UAuthority(ip=_legacy_ip_to_bytes(uri_parts[2]))
+        else:
+            authority = UAuthority(id=bytes(uri_parts[2], "utf-8"))
+        if len(uri_parts) > 3:
+            ue_id = uri_parts[3]
+            if number_of_parts_in_uri > 4:
+                ue_version = uri_parts[4]
+                if number_of_parts_in_uri > 5:
+                    resource = ShortUriSerializer.parse_from_string(uri_parts[5])
+                if number_of_parts_in_uri > 6:
+                    return UUri()
+        else:
+            return UUri(authority=authority)
+    try:
+        ue_version_int = int(ue_version) if ue_version.strip() != "" else None
+        ue_id_int = int(ue_id) if ue_id.strip() != "" else None
+    except Exception:
+        return UUri()
+    entity = UEntity()
+    new_uri = UUri()
+    if ue_id_int is not None:
+        entity.id = ue_id_int
+        new_uri.entity.CopyFrom(entity)
+    if ue_version_int is not None:
+        entity.version_major = ue_version_int
+        new_uri.entity.CopyFrom(entity)
+    if authority is not None:
+        new_uri.authority.CopyFrom(authority)
+    if resource is not None:
+        new_uri.resource.CopyFrom(resource)
+    return new_uri
+
+
+def time_per_call(function, argument, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function(argument)
+    return (time.perf_counter() - start) / iterations * 1e9
+
+
+def run(iterations: int):
+    serializer = ShortUriSerializer()
+    results = []
+    for label, uri in DESERIALIZE_CORPUS.items():
+        assert serializer.deserialize(uri) == legacy_deserialize(uri), label
+        legacy = time_per_call(legacy_deserialize, uri, iterations)
+        cached = time_per_call(serializer.deserialize, uri, iterations)
+        results.append(
+            {
+                "operation": "deserialize",
+                "authority": label,
+                "legacy_ns_per_call": round(legacy, 1),
+                "cached_ns_per_call": round(cached, 1),
+                "speedup": round(legacy / cached, 2),
+            }
+        )
+    for label, uri in SERIALIZE_CORPUS.items():
+        assert serializer.serialize(uri) == legacy_serialize(uri), label
+        legacy = time_per_call(legacy_serialize, uri, iterations)
+        cached = time_per_call(serializer.serialize, uri, iterations)
+        results.append(
+            {
+                "operation": "serialize",
+                "authority": label,
+                "legacy_ns_per_call": round(legacy, 1),
+                "cached_ns_per_call": round(cached, 1),
+                "speedup": round(legacy / cached, 2),
+            }
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the legacy and cached IP authority handling.")
+    parser.add_argument("--iterations", type=int, default=100000)
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.iterations)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'operation':<13}{'authority':<11}{'legacy ns':>11}{'cached ns':>11}{'speedup':>9}")
+    for r in results:
+        print(
+            f"{r['operation']:<13}{r['authority']:<11}{r['legacy_ns_per_call']:>11}{r['cached_ns_per_call']:>11}"
+            f"{r['speedup']:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Compare UEntityFactory and UResourceBuilder before and after caching the entities and dropping multimethod.
+#
+# The legacy UEntityFactory.from_proto() reads four service options on every call, the cached one copies the
+# UEntity built the first time a descriptor is seen. The legacy UResourceBuilder dispatches for_rpc_request()
+# and from_id() through multimethod and splits topic names with a regular expression.
+#
+# Usage: python -m benchmarks.uri.bench_urifactories [--iterations N] [--json]
+
+import argparse
+import json
+import re
+import time
+from typing import Union
+
+from multimethod import multimethod
+
+from uprotocol.proto.core.usubscription.v3.usubscription_pb2 import DESCRIPTOR as USUBSCRIPTION_DESCRIPTOR
+from uprotocol.proto.uprotocol_options_pb2 import UServiceTopic, id, name, version_major, version_minor
+from uprotocol.proto.uri_pb2 import UEntity, UResource
+from uprotocol.uri.factory.uentityfactory import UEntityFactory
+from uprotocol.uri.factory.uresourcebuilder import UResourceBuilder
+
+
+def legacy_from_proto(service_descriptor) -> UEntity:
+    """
+    UEntityFactory.from_proto() as it was before the entity cache.
+    """
+    options = service_descriptor.GetOptions()
+    uentity = UEntity()
+    uentity.name = options.Extensions[name]
+    uentity.version_major = options.Extensions[version_major]
+    uentity.version_minor = options.Extensions[version_minor]
+    uentity.id = options.Extensions[id]
+    return uentity
+
+
+class LegacyUResourceBuilder:
+    """
+    UResourceBuilder as it was before dropping multimethod.
+    """
+
+    @multimethod
+    def for_rpc_request(method: Union[str, None], id: int = None):  # noqa: N805
+        uresource = UResource(name="rpc")
+        if method is not None:
+            uresource.instance = method
+        if id is not None:
+            uresource.id = id
+        return uresource
+
+    @multimethod
+    def for_rpc_request(id: int):  # noqa: N805
+        return LegacyUResourceBuilder.for_rpc_request(None, id)
+
+    @staticmethod
+    def from_id(id):
+        if id == 0:
+            return UResource(name="rpc", instance="response", id=0)
+        return LegacyUResourceBuilder.for_rpc_request(id) if id < UResourceBuilder.MIN_TOPIC_ID else UResource(id=id)
+
+    @staticmethod
+    def from_uservice_topic(topic):
+        parts = re.split(r"[\\.]", topic.name)
+        resource = UResource(name=parts[0], id=topic.id, message=topic.message)
+        if len(parts) > 1:
+            resource.instance = parts[1]
+        return resource
+
+
+SERVICE = USUBSCRIPTION_DESCRIPTOR.services_by_name["uSubscription"]
+TOPIC = UServiceTopic(name="door.front_left", id=0x8000, message="Door")
+
+CASES = {
+    "from_proto": (legacy_from_proto, UEntityFactory.from_proto, SERVICE),
+    "from_id_rpc": (LegacyUResourceBuilder.from_id, UResourceBuilder.from_id, 5),
+    "from_id_topic": (LegacyUResourceBuilder.from_id, UResourceBuilder.from_id, 0x8001),
+    "for_rpc_request": (
+        lambda method: LegacyUResourceBuilder.for_rpc_request(method, 5),
+        lambda method: UResourceBuilder.for_rpc_request(method, 5),
+        "UpdateDoor",
+    ),
+    "from_uservice_topic": (LegacyUResourceBuilder.from_uservice_topic, UResourceBuilder.from_uservice_topic, TOPIC),
+}
+
+
+def time_per_call(function, argument, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function(argument)
+    return (time.perf_counter() - start) / iterations * 1e9
+
+
+def run(iterations: int):
+    results = []
+    for label, (legacy_function, function, argument) in CASES.items():
+        assert legacy_function(argument) == function(argument), label
+        legacy = time_per_call(legacy_function, argument, iterations)
+        cached = time_per_call(function, argument, iterations)
+        results.append(
+            {
+                "call": label,
+                "legacy_ns_per_call": round(legacy, 1),
+                "cached_ns_per_call": round(cached, 1),
+                "speedup": round(legacy / cached, 2),
+            }
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the legacy and cached UEntity and UResource factories.")
+    parser.add_argument("--iterations", type=int, default=100000)
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.iterations)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'call':<21}{'legacy ns':>11}{'cached ns':>11}{'speedup':>9}")
+    for r in results:
+        print(f"{r['call']:<21}{r['legacy_ns_per_call']:>11}{r['cached_ns_per_call']:>11}{r['speedup']:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Measure the memory of a routing table of URIs with and without the UriPool.
+#
+# A table of --routes entries is built from --distinct different URIs, as fresh UUri messages, as UUris interned
+# in a UriPool, as UriKeys and as interned UriKeys. The Python allocations are traced with tracemalloc. The
+# protobuf messages of the upb backend live in arenas outside of the Python allocator, so the growth of the
+# resident set size is reported as well where /proc is available. Memory released by a table is reused by the
+# next one, so measure a single --table per process for a meaningful resident set size.
+#
+# Usage: python -m benchmarks.uri.bench_uripool [--routes N] [--distinct N] [--table NAME] [--json]
+
+import argparse
+import gc
+import json
+import os
+import tracemalloc
+
+from uprotocol.proto.uri_pb2 import UAuthority, UEntity, UResource, UUri
+from uprotocol.uri.factory.urikey import UriKey
+from uprotocol.uri.factory.uripool import UriPool
+
+
+def build_uri(index: int) -> UUri:
+    return UUri(
+        authority=UAuthority(name=f"vcu{index % 16}.my_car_vin"),
+        entity=UEntity(name="body.access", id=29999, version_major=1),
+        resource=UResource(name="door", instance=f"front_left{index}", message="Door", id=index % 0x8000),
+    )
+
+
+def _rss() -> int:
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return 0
+
+
+def measure(build_table, routes: int, distinct: int) -> dict:
+    gc.collect()
+    rss = _rss()
+    tracemalloc.start()
+    table = build_table(routes, distinct)
+    traced, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    result = {
+        "traced_bytes": traced,
+        "rss_bytes": _rss() - rss,
+    }
+    assert len(table) == routes
+    del table
+    gc.collect()
+    return result
+
+
+def fresh_uris(routes: int, distinct: int):
+    return [build_uri(i % distinct) for i in range(routes)]
+
+
+def interned_uris(routes: int, distinct: int):
+    pool = UriPool()
+    table = [pool.intern(build_uri(i % distinct)) for i in range(routes)]
+    assert len(pool) == distinct
+    return table
+
+
+def fresh_keys(routes: int, distinct: int):
+    return [UriKey.from_uri(build_uri(i % distinct)) for i in range(routes)]
+
+
+def interned_keys(routes: int, distinct: int):
+    pool = UriPool()
+    table = [pool.intern_key(build_uri(i % distinct)) for i in range(routes)]
+    assert len(pool) == distinct
+    return table
+
+
+TABLES = {
+    "uuri": fresh_uris,
+    "uuri_interned": interned_uris,
+    "urikey": fresh_keys,
+    "urikey_interned": interned_keys,
+}
+
+
+def run(routes: int, distinct: int, tables=tuple(TABLES)):
+    results = []
+    for label in tables:
+        build_table = TABLES[label]
+        result = measure(build_table, routes, distinct)
+        results.append(
+            {
+                "table": label,
+                "routes": routes,
+                "distinct": distinct,
+                "traced_bytes_per_route": round(result["traced_bytes"] / routes, 1),
+                "rss_bytes_per_route": round(result["rss_bytes"] / routes, 1),
+            }
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the memory of URI tables with and without interning.")
+    parser.add_argument("--routes", type=int, default=1000000)
+    parser.add_argument("--distinct", type=int, default=1000)
+    parser.add_argument("--table", choices=list(TABLES), action="append", help="table to measure, all by default")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.routes, args.distinct, args.table or tuple(TABLES))
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'table':<17}{'routes':>9}{'distinct':>10}{'traced B/route':>16}{'rss B/route':>13}")
+    for r in results:
+        print(
+            f"{r['table']:<17}{r['routes']:>9}{r['distinct']:>10}{r['traced_bytes_per_route']:>16}"
+            f"{r['rss_bytes_per_route']:>13}"
+        )
+
+
+if __name__ == "__main__":
+    main()
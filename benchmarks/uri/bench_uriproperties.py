@@ -0,0 +1,104 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Compare the URI checks of the validators with and without the UriPropertiesCache.
+#
+# UAttributesValidator and CloudEventValidator used to run the UriValidator checks of every source and sink on
+# every message, CloudEventValidator after deserializing the URI string through a CachingUriSerializer. With the
+# cache the properties of a URI are computed once and each check costs one lookup.
+#
+# Usage: python -m benchmarks.uri.bench_uriproperties [--iterations N] [--json]
+
+import argparse
+import json
+import time
+
+from uprotocol.uri.serializer.cachinguriserializer import CachingUriSerializer
+from uprotocol.uri.serializer.longuriserializer import LongUriSerializer
+from uprotocol.uri.validator.uriproperties import UriProperties, UriPropertiesCache
+from uprotocol.uri.validator.urivalidator import UriValidator
+
+CORPUS = {
+    "rpc_method": "/body.access/1/rpc.UpdateDoor",
+    "rpc_response": "//vcu.my_car_vin/hartley/1/rpc.response",
+    "topic": "//vcu.my_car_vin/body.access/1/door.front_left#Door",
+}
+
+CHECKS = {
+    "rpc_method": (UriValidator.validate_rpc_method, UriProperties.VALID | UriProperties.RPC_METHOD),
+    "rpc_response": (UriValidator.validate_rpc_response, UriProperties.VALID | UriProperties.RPC_RESPONSE),
+    "topic": (UriValidator.validate, UriProperties.VALID),
+}
+
+
+def time_per_call(function, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    return (time.perf_counter() - start) / iterations * 1e9
+
+
+def run(iterations: int):
+    serializer = CachingUriSerializer(LongUriSerializer())
+    cache = UriPropertiesCache(serializer=serializer)
+    results = []
+    for label, uri in CORPUS.items():
+        validate, properties = CHECKS[label]
+        uuri = LongUriSerializer().deserialize(uri)
+        assert validate(uuri).is_success() == cache.check(uuri, properties), label
+        for form, checked in (("uuri", uuri), ("string", uri)):
+            if form == "uuri":
+                legacy = time_per_call(lambda: validate(checked), iterations)
+            else:
+                legacy = time_per_call(lambda: validate(serializer.deserialize(checked)), iterations)
+            cached = time_per_call(lambda: cache.check(checked, properties), iterations)
+            results.append(
+                {
+                    "check": label,
+                    "form": form,
+                    "legacy_ns_per_call": round(legacy, 1),
+                    "cached_ns_per_call": round(cached, 1),
+                    "speedup": round(legacy / cached, 2),
+                }
+            )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the URI checks with and without the properties cache.")
+    parser.add_argument("--iterations", type=int, default=100000)
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.iterations)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'check':<14}{'form':<8}{'legacy ns':>11}{'cached ns':>11}{'speedup':>9}")
+    for r in results:
+        print(
+            f"{r['check']:<14}{r['form']:<8}{r['legacy_ns_per_call']:>11}{r['cached_ns_per_call']:>11}{r['speedup']:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Regression suite for the URI serializers and the URI validator.
+#
+# A corpus of resolved URIs (names and ids) is generated from a seed: local and remote URIs with IPv4, IPv6 or
+# id authorities, addressing RPC methods, RPC responses and topics. It is serialized in long, short and micro
+# form, then the throughput of serialize() and deserialize() of LongUriSerializer, ShortUriSerializer and
+# MicroUriSerializer and of the UriValidator checks is measured over the corpora, as the best of --repeat runs.
+#
+# --save-baseline writes the results to a JSON file, --baseline compares the results with such a file and exits
+# with status 1 when an operation is slower than the baseline by more than --tolerance (a fraction). The results
+# are compared with urisuite_baseline.json, committed next to this module, unless another baseline is given.
+#
+# Usage: python -m benchmarks.uri.bench_urisuite [--size N] [--seed N] [--rounds N] [--repeat N]
+#        [--baseline FILE] [--save-baseline FILE] [--tolerance F] [--json]
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from typing import List
+
+import google.protobuf
+
+from uprotocol.proto.uri_pb2 import UAuthority, UEntity, UResource, UUri
+from uprotocol.uri.factory.uresourcebuilder import UResourceBuilder
+from uprotocol.uri.serializer.longuriserializer import LongUriSerializer
+from uprotocol.uri.serializer.microuriserializer import MicroUriSerializer
+from uprotocol.uri.serializer.shorturiserializer import ShortUriSerializer
+from uprotocol.uri.validator.urivalidator import UriValidator
+
+ENTITIES = ["body.access", "vehicle.exterior", "chassis.braking", "core.usubscription", "hartley"]
+METHODS = ["UpdateDoor", "OpenWindow", "SetLights", "Subscribe", "Raise"]
+TOPICS = [("door", "front_left", "Door"), ("window", "rear_right", "Window"), ("lights", "", "Lights")]
+
+
+def build_corpus(size: int, seed: int) -> List[UUri]:
+    """
+    Build resolved URIs, serializable in long, short and micro form.
+    """
+    rng = random.Random(seed)
+    uris = []
+    for _ in range(size):
+        kind = rng.random()
+        authority = UAuthority(name=f"vcu{rng.randrange(100)}.veh.example.com")
+        if kind < 0.5:
+            authority = None
+        elif kind < 0.7:
+            authority.ip = bytes(rng.randrange(256) for _ in range(4))
+        elif kind < 0.8:
+            authority.ip = bytes(rng.randrange(256) for _ in range(16))
+        else:
+            authority.id = b"VIN%014d" % rng.randrange(10**14)
+
+        entity_index = rng.randrange(len(ENTITIES))
+        entity = UEntity(name=ENTITIES[entity_index], id=entity_index + 1, version_major=rng.randrange(1, 4))
+
+        kind = rng.random()
+        if kind < 0.4:
+            method_id = rng.randrange(1, UResourceBuilder.MIN_TOPIC_ID)
+            resource = UResourceBuilder.for_rpc_request(rng.choice(METHODS), method_id)
+        elif kind < 0.5:
+            resource = UResourceBuilder.for_rpc_response()
+        else:
+            name, instance, message = rng.choice(TOPICS)
+            topic_id = rng.randrange(UResourceBuilder.MIN_TOPIC_ID, 0x10000)
+            resource = UResource(name=name, instance=instance or None, message=message, id=topic_id)
+
+        uris.append(UUri(authority=authority, entity=entity, resource=resource))
+    return uris
+
+
+def build_operations(uris: List[UUri]):
+    long_serializer = LongUriSerializer()
+    short_serializer = ShortUriSerializer()
+    micro_serializer = MicroUriSerializer()
+    long_uris = [long_serializer.serialize(uri) for uri in uris]
+    short_uris = [short_serializer.serialize(uri) for uri in uris]
+    micro_uris = [bytes(micro_serializer.serialize(uri)) for uri in uris]
+    assert all(long_uris) and all(short_uris) and all(micro_uris), "the corpus must be serializable in all forms"
+    return {
+        "long.serialize": (long_serializer.serialize, uris),
+        "long.deserialize": (long_serializer.deserialize, long_uris),
+        "short.serialize": (short_serializer.serialize, uris),
+        "short.deserialize": (short_serializer.deserialize, short_uris),
+        "micro.serialize": (micro_serializer.serialize, uris),
+        "micro.deserialize": (micro_serializer.deserialize, micro_uris),
+        "validator.validate": (UriValidator.validate, uris),
+        "validator.is_micro_form": (UriValidator.is_micro_form, uris),
+        "validator.is_long_form": (UriValidator.is_long_form, uris),
+        "validator.is_rpc_method": (UriValidator.is_rpc_method, uris),
+    }
+
+
+def ops_per_second(function, items, rounds: int, repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for item in items:
+                function(item)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return len(items) * rounds / best
+
+
+def run(size: int, seed: int, rounds: int, repeat: int):
+    operations = build_operations(build_corpus(size, seed))
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "protobuf": google.protobuf.__version__,
+        },
+        "config": {"size": size, "seed": seed, "rounds": rounds, "repeat": repeat},
+        "ops_per_second": {
+            name: round(ops_per_second(function, items, rounds, repeat), 1)
+            for name, (function, items) in operations.items()
+        },
+    }
+
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "urisuite_baseline.json")
+
+
+def compare(report, baseline, tolerance: float):
+    """
+    Compare the throughput of a report with a baseline report.<br><br>
+    @return:Returns one row per operation of the baseline, flagged as a regression when the throughput dropped
+    by more than the tolerance.
+    """
+    rows = []
+    for name, expected in baseline["ops_per_second"].items():
+        actual = report["ops_per_second"].get(name)
+        if actual is None:
+            continue
+        change = actual / expected - 1
+        rows.append(
+            {
+                "operation": name,
+                "baseline_ops_per_second": expected,
+                "ops_per_second": actual,
+                "change": round(change, 3),
+                "regression": change < -tolerance,
+            }
+        )
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the URI serializers and validator against a baseline.")
+    parser.add_argument("--size", type=int, default=1000, help="number of URIs in each corpus")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the corpus generator")
+    parser.add_argument("--rounds", type=int, default=20, help="passes over the corpus per run")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per operation, the best one is kept")
+    parser.add_argument(
+        "--baseline", default=BASELINE, help="JSON report to compare the results with, an empty path to skip it"
+    )
+    parser.add_argument("--save-baseline", help="write the JSON report to a file")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="accepted slowdown, as a fraction")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    report = run(args.size, args.seed, args.rounds, args.repeat)
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as output:
+            json.dump(report, output, indent=2)
+    if args.baseline:
+        with open(args.baseline) as baseline:
+            report["comparison"] = compare(report, json.load(baseline), args.tolerance)
+
+    regressions = [row["operation"] for row in report.get("comparison", []) if row["regression"]]
+    if args.json:
+        print(json.dumps(report, indent=2))
+    elif "comparison" in report:
+        print(f"{'operation':<25}{'baseline ops/s':>16}{'ops/s':>12}{'change':>9}")
+        for r in report["comparison"]:
+            flag = "  REGRESSION" if r["regression"] else ""
+            print(
+                f"{r['operation']:<25}{r['baseline_ops_per_second']:>16}{r['ops_per_second']:>12}"
+                f"{r['change']:>+9.1%}{flag}"
+            )
+    else:
+        print(f"{'operation':<25}{'ops/s':>12}")
+        for name, value in report["ops_per_second"].items():
+            print(f"{name:<25}{value:>12}")
+    if regressions:
+        sys.exit(f"Slower than the baseline by more than {args.tolerance:.0%}: {', '.join(regressions)}")
+
+
+if __name__ == "__main__":
+    main()
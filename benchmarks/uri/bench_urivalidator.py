@@ -0,0 +1,213 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+# Compare the per-call cost of UriValidator before and after the allocation-free fast paths.
+#
+# The legacy checks compare URIs and authorities against freshly allocated UUri(), UAuthority() and rpc response
+# UResource messages, and dispatch is_rpc_method(), is_micro_form() and is_long_form() with multimethod. The
+# fast paths use field presence checks and isinstance() instead, and share a single ValidationResult success.
+#
+# Usage: python -m benchmarks.uri.bench_urivalidator [--iterations N] [--json]
+
+import argparse
+import json
+import time
+
+from multimethod import multimethod
+
+from uprotocol.proto.uri_pb2 import UAuthority, UEntity, UResource, UUri
+from uprotocol.uri.factory.uresourcebuilder import UResourceBuilder
+from uprotocol.uri.validator.urivalidator import UriValidator
+from uprotocol.validation.validationresult import Success, ValidationResult
+
+URIS = {
+    "local_rpc": UUri(
+        entity=UEntity(name="body.access", id=3, version_major=1), resource=UResource(name="rpc", instance="Run", id=4)
+    ),
+    "remote_topic": UUri(
+        authority=UAuthority(name="vcu.vin"),
+        entity=UEntity(name="body.access", version_major=1),
+        resource=UResource(name="door", instance="front_left", message="Door"),
+    ),
+    "response": UUri(entity=UEntity(name="petapp", version_major=1), resource=UResourceBuilder.for_rpc_response()),
+}
+
+
+class LegacyUriValidator:
+    """
+    The UriValidator checks as they were before the fast paths.
+    """
+
+    @staticmethod
+    def validate(uri: UUri) -> ValidationResult:
+        if LegacyUriValidator.is_empty(uri):
+            return ValidationResult.failure("Uri is empty.")
+        if uri.HasField("authority") and not LegacyUriValidator.is_remote(uri.authority):
+            return ValidationResult.failure("Uri is remote missing u_authority.")
+        if uri.entity.name.strip() == "":
+            return ValidationResult.failure("Uri is missing uSoftware Entity name.")
+        return Success()
+
+    @staticmethod
+    def validate_rpc_method(uri: UUri) -> ValidationResult:
+        status = LegacyUriValidator.validate(uri)
+        if status.is_failure():
+            return status
+        if not LegacyUriValidator.is_rpc_method(uri):
+            return ValidationResult.failure(
+                "Invalid RPC method uri. Uri should be the method to be called, or method from response."
+            )
+        return Success()
+
+    @staticmethod
+    def is_empty(uri: UUri) -> bool:
+        return uri is None or uri == UUri()
+
+    @multimethod
+    def is_rpc_method(uri: UUri) -> bool:  # noqa: N805
+        return uri is not None and LegacyUriValidator.is_rpc_method(uri.resource)
+
+    @multimethod
+    def is_rpc_method(uri: None) -> bool:  # noqa: N805
+        return False
+
+    @multimethod
+    def is_rpc_method(resource: UResource) -> bool:  # noqa: N805
+        return (
+            resource is not None
+            and resource.name == "rpc"
+            and (
+                resource.HasField("instance")
+                and resource.instance.strip() != ""
+                or (resource.HasField("id") and resource.id < UResourceBuilder.MIN_TOPIC_ID)
+            )
+        )
+
+    @staticmethod
+    def is_resolved(uri: UUri) -> bool:
+        return LegacyUriValidator.is_long_form(uri) and LegacyUriValidator.is_micro_form(uri)
+
+    @staticmethod
+    def is_rpc_response(uri: UUri) -> bool:
+        return uri is not None and uri.resource == UResourceBuilder.for_rpc_response()
+
+    @multimethod
+    def is_micro_form(uri: UUri) -> bool:  # noqa: N805
+        return (
+            uri is not None
+            and not LegacyUriValidator.is_empty(uri)
+            and uri.entity.HasField("id")
+            and uri.resource.HasField("id")
+            and LegacyUriValidator.is_micro_form(uri.authority)
+        )
+
+    @multimethod
+    def is_micro_form(authority: UAuthority) -> bool:  # noqa: N805
+        return LegacyUriValidator.is_local(authority) or (authority.HasField("ip") or (authority.HasField("id")))
+
+    @multimethod
+    def is_long_form(uri: UUri) -> bool:  # noqa: N805
+        return (
+            uri is not None
+            and not LegacyUriValidator.is_empty(uri)
+            and LegacyUriValidator.is_long_form(uri.authority)
+            and uri.entity.name.strip() != ""
+            and uri.resource.name.strip() != ""
+        )
+
+    @multimethod
+    def is_long_form(authority: UAuthority) -> bool:  # noqa: N805
+        return authority is not None and (
+            LegacyUriValidator.is_local(authority) or (authority.HasField("name") and authority.name.strip() != "")
+        )
+
+    @staticmethod
+    def is_local(authority: UAuthority) -> bool:
+        return (authority is not None) and (authority == UAuthority())
+
+    @staticmethod
+    def is_remote(authority: UAuthority) -> bool:
+        return (authority is not None) and (not authority == UAuthority())
+
+
+CHECKS = [
+    "validate",
+    "validate_rpc_method",
+    "is_empty",
+    "is_rpc_method",
+    "is_rpc_response",
+    "is_micro_form",
+    "is_long_form",
+    "is_resolved",
+]
+
+
+def time_per_call(function, uri: UUri, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function(uri)
+    return (time.perf_counter() - start) / iterations * 1e9
+
+
+def run(iterations: int):
+    results = []
+    for check in CHECKS:
+        legacy_check = getattr(LegacyUriValidator, check)
+        fast_check = getattr(UriValidator, check)
+        for label, uri in URIS.items():
+            legacy_result, fast_result = legacy_check(uri), fast_check(uri)
+            if isinstance(legacy_result, ValidationResult):
+                legacy_result, fast_result = legacy_result.get_message(), fast_result.get_message()
+            assert legacy_result == fast_result, (check, label)
+            legacy = time_per_call(legacy_check, uri, iterations)
+            fast = time_per_call(fast_check, uri, iterations)
+            results.append(
+                {
+                    "check": check,
+                    "uri": label,
+                    "legacy_ns_per_call": round(legacy, 1),
+                    "fast_ns_per_call": round(fast, 1),
+                    "speedup": round(legacy / fast, 2),
+                }
+            )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the legacy and fast UriValidator checks.")
+    parser.add_argument("--iterations", type=int, default=100000)
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.iterations)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'check':<21}{'uri':<14}{'legacy ns':>11}{'fast ns':>10}{'speedup':>9}")
+    for r in results:
+        print(
+            f"{r['check']:<21}{r['uri']:<14}{r['legacy_ns_per_call']:>11}{r['fast_ns_per_call']:>10}{r['speedup']:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from google.protobuf.wrappers_pb2 import Int32Value
+
+from uprotocol.proto.uattributes_pb2 import CallOptions, UPriority
+from uprotocol.proto.ustatus_pb2 import UCode, UStatus
+from uprotocol.rpc.admissioncontroller import AdmissionController
+from uprotocol.rpc.inmemoryrpcclient import InMemoryRpcClient
+from uprotocol.rpc.inmemoryrpcserver import InMemoryRpcServer
+from uprotocol.rpc.messagehandler import MessageHandler
+from uprotocol.rpc.requesthandler import RequestHandler
+from uprotocol.transport.builder.uattributesbuilder import UAttributesBuilder
+from uprotocol.transport.builder.upayloadbuilder import UPayloadBuilder
+from uprotocol.transport.loopbackutransport import LoopbackUTransport
+from uprotocol.uri.serializer.longuriserializer import LongUriSerializer
+
+
+def build_source():
+    return LongUriSerializer().deserialize("/hartley/1/rpc.response")
+
+
+def build_method(resource="rpc.LookupUri"):
+    return LongUriSerializer().deserialize(f"/core.udiscovery/3/{resource}")
+
+
+def build_attributes(priority=UPriority.UPRIORITY_CS4, ttl=1000):
+    return UAttributesBuilder.request(build_source(), build_method(), priority, ttl).build()
+
+
+class Recorder:
+    def __init__(self):
+        self.started = []
+        self.rejected = []
+
+    def start(self, name):
+        return lambda: self.started.append(name)
+
+    def reject(self, name):
+        return lambda code, reason: self.rejected.append((name, code))
+
+
+class EchoHandler(RequestHandler):
+    def handle_request(self, request):
+        return request.payload
+
+
+class BlockingHandler(RequestHandler):
+    def __init__(self):
+        self.release = threading.Event()
+
+    def handle_request(self, request):
+        self.release.wait(5)
+        return request.payload
+
+
+class IncrementMessageHandler(MessageHandler):
+    def handle_message(self, request, attributes):
+        return Int32Value(value=request.value + 1)
+
+
+class TestAdmissionController(unittest.TestCase):
+    def test_caps_in_flight_requests(self):
+        controller = AdmissionController(max_in_flight=2)
+        recorder = Recorder()
+        for name in ("a", "b", "c"):
+            controller.submit(build_attributes(), recorder.start(name), recorder.reject(name))
+        self.assertEqual(["a", "b"], recorder.started)
+        self.assertEqual(1, controller.stats().queued)
+        controller.release(1)
+        self.assertEqual(["a", "b", "c"], recorder.started)
+        self.assertEqual(2, controller.stats().in_flight)
+        controller.release(1)
+        controller.release(1)
+        self.assertEqual(0, controller.stats().in_flight)
+
+    def test_queue_is_ordered_by_priority_then_deadline(self):
+        controller = AdmissionController(max_in_flight=1)
+        recorder = Recorder()
+        for name, priority, ttl in (
+            ("running", UPriority.UPRIORITY_CS4, 1000),
+            ("low", UPriority.UPRIORITY_CS1, 1000),
+            ("late", UPriority.UPRIORITY_CS4, 5000),
+            ("soon", UPriority.UPRIORITY_CS4, 2000),
+            ("high", UPriority.UPRIORITY_CS6, 9000),
+        ):
+            controller.submit(build_attributes(priority, ttl), recorder.start(name), recorder.reject(name))
+        for _ in range(4):
+            controller.release(0.1)
+        self.assertEqual(["running", "high", "soon", "late", "low"], recorder.started)
+
+    def test_rejects_when_remaining_time_cannot_cover_service_time(self):
+        controller = AdmissionController(max_in_flight=1)
+        recorder = Recorder()
+        controller.submit(build_attributes(), recorder.start("first"), recorder.reject("first"))
+        controller.release(2000)
+        controller.submit(build_attributes(ttl=1000), recorder.start("short"), recorder.reject("short"))
+        controller.submit(build_attributes(ttl=60000), recorder.start("long"), recorder.reject("long"))
+        self.assertEqual(["first", "long"], recorder.started)
+        self.assertEqual([("short", UCode.RESOURCE_EXHAUSTED)], recorder.rejected)
+
+    def test_rejects_queued_requests_that_can_no_longer_make_it(self):
+        controller = AdmissionController(max_in_flight=1)
+        recorder = Recorder()
+        controller.submit(build_attributes(), recorder.start("running"), recorder.reject("running"))
+        controller.submit(build_attributes(ttl=1000), recorder.start("queued"), recorder.reject("queued"))
+        controller.release(5000)
+        self.assertEqual([("queued", UCode.RESOURCE_EXHAUSTED)], recorder.rejected)
+        self.assertEqual(0, controller.stats().in_flight)
+
+    def test_failing_reject_callback_does_not_leak_the_slot(self):
+        controller = AdmissionController(max_in_flight=1)
+        recorder = Recorder()
+
+        def reject(code, reason):
+            raise RuntimeError("Boom")
+
+        controller.submit(build_attributes(), recorder.start("running"), recorder.reject("running"))
+        controller.submit(build_attributes(ttl=1000), recorder.start("failing"), reject)
+        controller.submit(build_attributes(ttl=60000), recorder.start("next"), recorder.reject("next"))
+        controller.release(5000)
+        self.assertEqual(["running", "next"], recorder.started)
+        self.assertEqual(1, controller.stats().in_flight)
+        self.assertEqual(0, controller.stats().queued)
+
+    def test_release_without_service_time_keeps_the_average(self):
+        controller = AdmissionController(max_in_flight=1)
+        recorder = Recorder()
+        controller.submit(build_attributes(), recorder.start("first"), recorder.reject("first"))
+        controller.release(100)
+        controller.submit(build_attributes(), recorder.start("skipped"), recorder.reject("skipped"))
+        controller.submit(build_attributes(), recorder.start("next"), recorder.reject("next"))
+        controller.release(None)
+        self.assertEqual(["first", "skipped", "next"], recorder.started)
+        self.assertEqual(100, controller.stats().service_time)
+        self.assertEqual(1, controller.stats().in_flight)
+
+    def test_requests_without_ttl_are_never_rejected_for_time(self):
+        controller = AdmissionController(max_in_flight=1)
+        recorder = Recorder()
+        controller.submit(build_attributes(), recorder.start("first"), recorder.reject("first"))
+        controller.release(5000)
+        controller.submit(build_attributes(ttl=0), recorder.start("no_ttl"), recorder.reject("no_ttl"))
+        self.assertEqual(["first", "no_ttl"], recorder.started)
+
+    def test_rejects_when_queue_is_full(self):
+        controller = AdmissionController(max_in_flight=1, max_queued=1)
+        recorder = Recorder()
+        for name in ("a", "b", "c"):
+            controller.submit(build_attributes(), recorder.start(name), recorder.reject(name))
+        self.assertEqual([("c", UCode.RESOURCE_EXHAUSTED)], recorder.rejected)
+        self.assertEqual(1, controller.stats().rejected)
+
+    def test_inline_release_does_not_recurse(self):
+        controller = AdmissionController(max_in_flight=1, max_queued=5000)
+        served = []
+
+        def serve():
+            served.append(1)
+            controller.release(0.001)
+
+        blocker = []
+        controller.submit(build_attributes(), lambda: blocker.append(1), None)
+        for _ in range(3000):
+            controller.submit(build_attributes(ttl=60000), serve, None)
+        controller.release(0.001)
+        self.assertEqual(3000, len(served))
+        self.assertEqual(0, controller.stats().in_flight)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            AdmissionController(max_in_flight=0)
+        with self.assertRaises(ValueError):
+            AdmissionController(max_in_flight=1, max_queued=-1)
+        with self.assertRaises(ValueError):
+            AdmissionController(max_in_flight=1, smoothing=0)
+
+    def test_server_rejects_with_resource_exhausted(self):
+        transport = LoopbackUTransport()
+        controller = AdmissionController(max_in_flight=1)
+        server = InMemoryRpcServer(transport, admission_controller=controller)
+        client = InMemoryRpcClient(transport, build_source())
+        server.register_request_handler(build_method(), EchoHandler())
+        payload = UPayloadBuilder.pack_to_any(Int32Value(value=3))
+
+        response = client.invoke_method(build_method(), payload, CallOptions(ttl=1000)).result(1)
+        self.assertEqual(Int32Value(value=3), UPayloadBuilder.unpack(response.payload, Int32Value))
+        # Pretend the service became slower than the ttl of the next request
+        controller.submit(build_attributes(), lambda: None, None)
+        controller.release(50000)
+        response = client.invoke_method(build_method(), payload, CallOptions(ttl=1000)).result(1)
+        self.assertEqual(UCode.RESOURCE_EXHAUSTED, response.attributes.commstatus)
+        self.assertEqual(UCode.RESOURCE_EXHAUSTED, UPayloadBuilder.unpack(response.payload, UStatus).code)
+        client.close()
+
+    def test_cancelled_local_call_rejected_from_the_queue_frees_its_slot(self):
+        transport = LoopbackUTransport()
+        controller = AdmissionController(max_in_flight=1)
+        client = InMemoryRpcClient(transport, build_source())
+        blocking = BlockingHandler()
+        with ThreadPoolExecutor(1) as executor:
+            server = InMemoryRpcServer(transport, executor, controller)
+            server.register_request_handler(build_method(), blocking)
+            server.register_message_handler(build_method("rpc.Increment"), Int32Value, IncrementMessageHandler())
+            payload = UPayloadBuilder.pack_to_any(Int32Value(value=3))
+            running = client.invoke_method(build_method(), payload, CallOptions(ttl=60000))
+            queued = client.invoke_message(
+                build_method("rpc.Increment"), Int32Value(value=3), CallOptions(ttl=50), Int32Value
+            )
+            following = client.invoke_message(
+                build_method("rpc.Increment"), Int32Value(value=4), CallOptions(ttl=60000), Int32Value
+            )
+            self.assertTrue(queued.cancel())
+            # Serve the running request for longer than the queued one can wait
+            time.sleep(0.1)
+            blocking.release.set()
+            self.assertEqual(UCode.OK, running.result(1).attributes.commstatus)
+            self.assertEqual(Int32Value(value=5), following.result(1))
+        self.assertEqual(1, controller.stats().rejected)
+        self.assertEqual(0, controller.stats().in_flight)
+        self.assertEqual(0, controller.stats().queued)
+        client.close()
+
+    def test_cancelled_request_is_not_sampled(self):
+        transport = LoopbackUTransport()
+        controller = AdmissionController(max_in_flight=1, smoothing=1)
+        client = InMemoryRpcClient(transport, build_source())
+        blocking = BlockingHandler()
+        with ThreadPoolExecutor(1) as executor:
+            server = InMemoryRpcServer(transport, executor, controller)
+            server.register_request_handler(build_method(), blocking)
+            payload = UPayloadBuilder.pack_to_any(Int32Value(value=3))
+            running = client.invoke_method(build_method(), payload, CallOptions(ttl=60000))
+            cancelled = client.invoke_method(build_method(), payload, CallOptions(ttl=60000))
+            self.assertTrue(cancelled.cancel())
+            time.sleep(0.05)
+            blocking.release.set()
+            self.assertEqual(UCode.OK, running.result(1).attributes.commstatus)
+        # The cancelled request was skipped right away, the average still reflects the request that was served
+        self.assertGreaterEqual(controller.stats().service_time, 40)
+        self.assertEqual(0, controller.stats().in_flight)
+        client.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,185 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import random
+import unittest
+from concurrent.futures import Future
+
+from google.protobuf.wrappers_pb2 import Int32Value
+
+from uprotocol.proto.uattributes_pb2 import CallOptions
+from uprotocol.proto.umessage_pb2 import UMessage
+from uprotocol.proto.upayload_pb2 import UPayload
+from uprotocol.proto.uri_pb2 import UAuthority, UUri
+from uprotocol.proto.ustatus_pb2 import UCode
+from uprotocol.rpc.balancingrpcclient import BalancingRpcClient, BalancingStrategy
+from uprotocol.rpc.rpcclient import RpcClient
+from uprotocol.transport.builder.umessagebuilder import UMessageBuilder
+from uprotocol.transport.builder.upayloadbuilder import UPayloadBuilder
+from uprotocol.uri.serializer.longuriserializer import LongUriSerializer
+
+AUTHORITIES = [UAuthority(name="vcu.a"), UAuthority(name="vcu.b"), UAuthority(name="vcu.c")]
+
+
+def build_method():
+    return LongUriSerializer().deserialize("/core.udiscovery/3/rpc.LookupUri")
+
+
+def build_payload():
+    return UPayloadBuilder.pack_to_any(Int32Value(value=3))
+
+
+def resolve(method_uri):
+    return AUTHORITIES
+
+
+class DeferredRpcClient(RpcClient):
+    """
+    RpcClient recording the authority of each call and keeping its Future pending until completed.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def invoke_method(self, method_uri: UUri, request_payload: UPayload, options: CallOptions):
+        future = Future()
+        self.calls.append((method_uri.authority.name, future))
+        return future
+
+    def complete(self, index, code=None):
+        future = self.calls[index][1]
+        future.set_result(UMessage(payload=build_payload()) if code is None else UMessageBuilder.status(code))
+
+
+class TestBalancingRpcClient(unittest.TestCase):
+    def test_least_outstanding_spreads_requests(self):
+        delegate = DeferredRpcClient()
+        client = BalancingRpcClient(delegate, resolve)
+        for _ in range(3):
+            client.invoke_method(build_method(), build_payload(), CallOptions(ttl=1000))
+        self.assertEqual(["vcu.a", "vcu.b", "vcu.c"], sorted(name for name, _ in delegate.calls))
+        delegate.complete(1)
+        client.invoke_method(build_method(), build_payload(), CallOptions(ttl=1000))
+        self.assertEqual(delegate.calls[1][0], delegate.calls[3][0])
+
+    def test_request_is_sent_to_the_instance_uri(self):
+        delegate = DeferredRpcClient()
+        client = BalancingRpcClient(delegate, lambda method_uri: AUTHORITIES[:1])
+        method = build_method()
+        future = client.invoke_method(method, build_payload(), CallOptions(ttl=1000))
+        self.assertIs(delegate.calls[0][1], future)
+        self.assertFalse(method.HasField("authority"))
+        delegate.complete(0)
+        self.assertEqual(Int32Value(value=3), UPayloadBuilder.unpack(future.result(1).payload, Int32Value))
+        stats = client.stats()[0]
+        self.assertEqual(0, stats.in_flight)
+        self.assertFalse(stats.ejected)
+
+    def test_power_of_two_choices_avoids_the_busiest_instance(self):
+        delegate = DeferredRpcClient()
+        client = BalancingRpcClient(delegate, resolve, BalancingStrategy.POWER_OF_TWO_CHOICES, rng=random.Random(7))
+        for _ in range(30):
+            client.invoke_method(build_method(), build_payload(), CallOptions(ttl=1000))
+        counts = {name: 0 for name in ("vcu.a", "vcu.b", "vcu.c")}
+        for name, _ in delegate.calls:
+            counts[name] += 1
+        self.assertTrue(max(counts.values()) - min(counts.values()) <= 2)
+
+    def test_failing_instance_is_ejected(self):
+        delegate = DeferredRpcClient()
+        client = BalancingRpcClient(delegate, lambda method_uri: AUTHORITIES[:1], failure_threshold=2)
+        client.invoke_method(build_method(), build_payload(), CallOptions(ttl=1000))
+        delegate.complete(0, UCode.UNAVAILABLE)
+        self.assertFalse(client.stats()[0].ejected)
+        client.invoke_method(build_method(), build_payload(), CallOptions(ttl=1000))
+        delegate.complete(1, UCode.UNAVAILABLE)
+        self.assertTrue(client.stats()[0].ejected)
+
+    def test_ejected_instance_receives_no_requests(self):
+        delegate = DeferredRpcClient()
+        client = BalancingRpcClient(delegate, resolve, failure_threshold=1)
+        client.invoke_method(build_method(), build_payload(), CallOptions(ttl=1000))
+        delegate.complete(0, UCode.UNAVAILABLE)
+        for _ in range(6):
+            client.invoke_method(build_method(), build_payload(), CallOptions(ttl=1000))
+        self.assertNotIn(delegate.calls[0][0], [name for name, _ in delegate.calls[1:]])
+
+    def test_service_failures_do_not_eject(self):
+        delegate = DeferredRpcClient()
+        client = BalancingRpcClient(delegate, lambda method_uri: AUTHORITIES[:2], failure_threshold=1)
+        client.invoke_method(build_method(), build_payload(), CallOptions(ttl=1000))
+        delegate.complete(0, UCode.INVALID_ARGUMENT)
+        self.assertFalse(any(s.ejected for s in client.stats()))
+
+    def test_all_ejected_still_serves(self):
+        delegate = DeferredRpcClient()
+        client = BalancingRpcClient(delegate, lambda method_uri: AUTHORITIES[:1], failure_threshold=1)
+        client.invoke_method(build_method(), build_payload(), CallOptions(ttl=1000))
+        delegate.complete(0, UCode.DEADLINE_EXCEEDED)
+        self.assertTrue(client.stats()[0].ejected)
+        client.invoke_method(build_method(), build_payload(), CallOptions(ttl=1000))
+        self.assertEqual(2, len(delegate.calls))
+
+    def test_cancelled_calls_are_not_scored(self):
+        delegate = DeferredRpcClient()
+        client = BalancingRpcClient(delegate, lambda method_uri: AUTHORITIES[:1], failure_threshold=1)
+        client.invoke_method(build_method(), build_payload(), CallOptions(ttl=1000)).cancel()
+        stats = client.stats()[0]
+        self.assertEqual(0, stats.in_flight)
+        self.assertEqual(0, stats.failures)
+        self.assertEqual(0, stats.latency)
+        self.assertFalse(stats.ejected)
+
+    def test_instances_are_bounded(self):
+        delegate = DeferredRpcClient()
+        authorities = [UAuthority(name=f"vcu.{index}") for index in range(10)]
+        client = BalancingRpcClient(delegate, lambda method_uri: authorities[:1], max_instances=3)
+        pending = client.invoke_method(build_method(), build_payload(), CallOptions(ttl=1000))
+        for authority in authorities[1:]:
+            client.resolver = lambda method_uri, authority=authority: [authority]
+            client.invoke_method(build_method(), build_payload(), CallOptions(ttl=1000))
+            delegate.complete(len(delegate.calls) - 1)
+        names = [stats.authority.name for stats in client.stats()]
+        # The instance with a request in flight is kept
+        self.assertEqual(["vcu.0", "vcu.8", "vcu.9"], names)
+        self.assertFalse(pending.done())
+
+    def test_no_instance(self):
+        client = BalancingRpcClient(DeferredRpcClient(), lambda method_uri: [])
+        response = client.invoke_method(build_method(), build_payload(), CallOptions(ttl=1000)).result(1)
+        self.assertEqual(UCode.UNAVAILABLE, response.attributes.commstatus)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            BalancingRpcClient(None, resolve)
+        with self.assertRaises(ValueError):
+            BalancingRpcClient(DeferredRpcClient(), None)
+        with self.assertRaises(ValueError):
+            BalancingRpcClient(DeferredRpcClient(), resolve, smoothing=0)
+        with self.assertRaises(ValueError):
+            BalancingRpcClient(DeferredRpcClient(), resolve, failure_threshold=0)
+        with self.assertRaises(ValueError):
+            BalancingRpcClient(DeferredRpcClient(), resolve, max_instances=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
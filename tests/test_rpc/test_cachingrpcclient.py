@@ -0,0 +1,187 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import time
+import unittest
+from concurrent.futures import Future
+
+from google.protobuf.wrappers_pb2 import Int32Value, StringValue
+
+from uprotocol.proto.uattributes_pb2 import CallOptions
+from uprotocol.proto.umessage_pb2 import UMessage
+from uprotocol.proto.upayload_pb2 import UPayload
+from uprotocol.proto.uri_pb2 import UUri
+from uprotocol.proto.ustatus_pb2 import UCode, UStatus
+from uprotocol.rpc.cachingrpcclient import CachingRpcClient
+from uprotocol.rpc.rpcclient import RpcClient
+from uprotocol.rpc.rpcmapper import RpcMapper
+from uprotocol.transport.builder.upayloadbuilder import UPayloadBuilder
+from uprotocol.uri.serializer.longuriserializer import LongUriSerializer
+
+
+def build_method(name="rpc.GetConfig"):
+    return LongUriSerializer().deserialize(f"//vcu.vin/core.config/1/{name}")
+
+
+def build_calloptions():
+    return CallOptions(ttl=1000)
+
+
+class CountingRpcClient(RpcClient):
+    def __init__(self, response=None):
+        self.calls = 0
+        self.response = response
+
+    def invoke_method(self, method_uri: UUri, request_payload: UPayload, options: CallOptions):
+        self.calls += 1
+        future = Future()
+        if isinstance(self.response, Exception):
+            future.set_exception(self.response)
+        else:
+            payload = UPayloadBuilder.pack_to_any(
+                self.response if self.response is not None else Int32Value(value=self.calls)
+            )
+            future.set_result(UMessage(payload=payload))
+        return future
+
+
+class TestCachingRpcClient(unittest.TestCase):
+    def test_uncached_method_goes_to_delegate(self):
+        delegate = CountingRpcClient()
+        client = CachingRpcClient(delegate)
+        payload = UPayloadBuilder.pack_to_any(StringValue(value="key"))
+        client.invoke_method(build_method(), payload, build_calloptions())
+        client.invoke_method(build_method(), payload, build_calloptions())
+        self.assertEqual(2, delegate.calls)
+        self.assertEqual(0, client.stats().hits)
+
+    def test_cached_method_is_served_from_cache(self):
+        delegate = CountingRpcClient()
+        client = CachingRpcClient(delegate).cache_method(build_method(), 10000)
+        payload = UPayloadBuilder.pack_to_any(StringValue(value="key"))
+        first = RpcMapper.map_response(client.invoke_method(build_method(), payload, build_calloptions()), Int32Value)
+        second = RpcMapper.map_response(client.invoke_method(build_method(), payload, build_calloptions()), Int32Value)
+        self.assertEqual(1, delegate.calls)
+        self.assertEqual(first.result(), second.result())
+        stats = client.stats()
+        self.assertEqual(1, stats.hits)
+        self.assertEqual(1, stats.misses)
+        self.assertEqual(1, stats.entries)
+
+    def test_different_payloads_are_cached_separately(self):
+        delegate = CountingRpcClient()
+        client = CachingRpcClient(delegate).cache_method(build_method(), 10000)
+        client.invoke_method(build_method(), UPayloadBuilder.pack_to_any(StringValue(value="a")), build_calloptions())
+        client.invoke_method(build_method(), UPayloadBuilder.pack_to_any(StringValue(value="b")), build_calloptions())
+        self.assertEqual(2, delegate.calls)
+        self.assertEqual(2, client.stats().entries)
+
+    def test_default_ttl_caches_every_method(self):
+        delegate = CountingRpcClient()
+        client = CachingRpcClient(delegate, default_ttl=10000)
+        client.invoke_method(build_method("rpc.Other"), None, build_calloptions())
+        client.invoke_method(build_method("rpc.Other"), None, build_calloptions())
+        self.assertEqual(1, delegate.calls)
+
+    def test_expired_entry_is_not_served(self):
+        delegate = CountingRpcClient()
+        client = CachingRpcClient(delegate).cache_method(build_method(), 1)
+        client.invoke_method(build_method(), None, build_calloptions())
+        time.sleep(0.01)
+        client.invoke_method(build_method(), None, build_calloptions())
+        self.assertEqual(2, delegate.calls)
+
+    def test_exception_is_not_cached(self):
+        delegate = CountingRpcClient(RuntimeError("Boom"))
+        client = CachingRpcClient(delegate).cache_method(build_method(), 10000)
+        client.invoke_method(build_method(), None, build_calloptions())
+        client.invoke_method(build_method(), None, build_calloptions())
+        self.assertEqual(2, delegate.calls)
+        self.assertEqual(0, client.stats().entries)
+
+    def test_failed_status_is_not_cached(self):
+        delegate = CountingRpcClient(UStatus(code=UCode.UNAVAILABLE, message="down"))
+        client = CachingRpcClient(delegate).cache_method(build_method(), 10000)
+        client.invoke_method(build_method(), None, build_calloptions())
+        client.invoke_method(build_method(), None, build_calloptions())
+        self.assertEqual(2, delegate.calls)
+
+    def test_ok_status_is_cached(self):
+        delegate = CountingRpcClient(UStatus(code=UCode.OK))
+        client = CachingRpcClient(delegate).cache_method(build_method(), 10000)
+        client.invoke_method(build_method(), None, build_calloptions())
+        client.invoke_method(build_method(), None, build_calloptions())
+        self.assertEqual(1, delegate.calls)
+
+    def test_lru_eviction_when_size_bound_is_exceeded(self):
+        delegate = CountingRpcClient()
+        method = build_method()
+        entry_size = (
+            len(method.SerializeToString())
+            + len(UPayloadBuilder.pack_to_any(StringValue(value="a")).SerializeToString())
+            + UMessage(payload=UPayloadBuilder.pack_to_any(Int32Value(value=1))).ByteSize()
+        )
+        client = CachingRpcClient(delegate, max_bytes=entry_size * 2).cache_method(method, 10000)
+        for key in ["a", "b", "a", "c"]:
+            client.invoke_method(method, UPayloadBuilder.pack_to_any(StringValue(value=key)), build_calloptions())
+
+        stats = client.stats()
+        self.assertEqual(1, stats.evictions)
+        self.assertEqual(2, stats.entries)
+        self.assertLessEqual(stats.size_bytes, entry_size * 2)
+
+        # "b" was the least recently used entry and must have been evicted
+        calls = delegate.calls
+        client.invoke_method(method, UPayloadBuilder.pack_to_any(StringValue(value="a")), build_calloptions())
+        self.assertEqual(calls, delegate.calls)
+        client.invoke_method(method, UPayloadBuilder.pack_to_any(StringValue(value="b")), build_calloptions())
+        self.assertEqual(calls + 1, delegate.calls)
+
+    def test_cached_response_is_a_copy(self):
+        delegate = CountingRpcClient()
+        client = CachingRpcClient(delegate).cache_method(build_method(), 10000)
+        client.invoke_method(build_method(), None, build_calloptions())
+        client.invoke_method(build_method(), None, build_calloptions()).result().ClearField("payload")
+        self.assertTrue(client.invoke_method(build_method(), None, build_calloptions()).result().HasField("payload"))
+
+    def test_invalidate(self):
+        delegate = CountingRpcClient()
+        client = CachingRpcClient(delegate, default_ttl=10000)
+        client.invoke_method(build_method(), None, build_calloptions())
+        client.invoke_method(build_method("rpc.Other"), None, build_calloptions())
+        client.invalidate(build_method())
+        self.assertEqual(1, client.stats().entries)
+        client.invalidate()
+        self.assertEqual(0, client.stats().entries)
+        self.assertEqual(0, client.stats().size_bytes)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            CachingRpcClient(None)
+        with self.assertRaises(ValueError):
+            CachingRpcClient(CountingRpcClient(), max_bytes=0)
+        with self.assertRaises(ValueError):
+            CachingRpcClient(CountingRpcClient()).cache_method(build_method(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
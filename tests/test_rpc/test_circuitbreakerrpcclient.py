@@ -0,0 +1,238 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import time
+import unittest
+from concurrent.futures import Future
+
+from google.protobuf.wrappers_pb2 import Int32Value
+
+from uprotocol.proto.uattributes_pb2 import CallOptions
+from uprotocol.proto.umessage_pb2 import UMessage
+from uprotocol.proto.upayload_pb2 import UPayload
+from uprotocol.proto.uri_pb2 import UUri
+from uprotocol.proto.ustatus_pb2 import UCode
+from uprotocol.rpc.circuitbreakerrpcclient import (
+    CIRCUIT_OPEN,
+    CircuitBreaker,
+    CircuitBreakerRpcClient,
+    CircuitState,
+)
+from uprotocol.rpc.retrybudget import RetryBudget
+from uprotocol.rpc.rpcclient import RpcClient
+from uprotocol.rpc.rpcmapper import RpcMapper
+from uprotocol.transport.builder.umessagebuilder import UMessageBuilder
+from uprotocol.transport.builder.upayloadbuilder import UPayloadBuilder
+from uprotocol.uri.serializer.longuriserializer import LongUriSerializer
+
+
+def build_method(name="LookupUri"):
+    return LongUriSerializer().deserialize(f"/core.udiscovery/3/rpc.{name}")
+
+
+def build_payload():
+    return UPayloadBuilder.pack_to_any(Int32Value(value=3))
+
+
+class ScriptedRpcClient(RpcClient):
+    """
+    RpcClient answering each call with the next code of a script, None meaning success.
+    """
+
+    def __init__(self, *codes):
+        self.codes = list(codes)
+        self.calls = []
+
+    def invoke_method(self, method_uri: UUri, request_payload: UPayload, options: CallOptions):
+        self.calls.append(options)
+        code = self.codes.pop(0) if self.codes else None
+        future = Future()
+        future.set_result(UMessage(payload=build_payload()) if code is None else UMessageBuilder.status(code))
+        return future
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_opens_on_failure_rate(self):
+        breaker = CircuitBreaker(failure_rate=0.5, window_size=4, minimum_calls=4)
+        for code in (None, UCode.UNAVAILABLE, None):
+            breaker.record(breaker.allow(), code)
+        self.assertEqual(CircuitState.CLOSED, breaker.state())
+        breaker.record(breaker.allow(), UCode.INTERNAL)
+        self.assertEqual(CircuitState.OPEN, breaker.state())
+        self.assertIsNone(breaker.allow())
+
+    def test_opens_on_timeout_rate(self):
+        breaker = CircuitBreaker(timeout_rate=0.25, window_size=4, minimum_calls=4)
+        for code in (None, None, None, UCode.DEADLINE_EXCEEDED):
+            breaker.record(breaker.allow(), code)
+        self.assertEqual(CircuitState.OPEN, breaker.state())
+
+    def test_old_outcomes_leave_the_window(self):
+        breaker = CircuitBreaker(failure_rate=0.5, window_size=2, minimum_calls=2)
+        breaker.record(breaker.allow(), UCode.UNAVAILABLE)
+        breaker.record(breaker.allow(), None)
+        self.assertEqual(CircuitState.OPEN, breaker.state())
+        breaker = CircuitBreaker(failure_rate=0.75, window_size=2, minimum_calls=2)
+        for code in (UCode.UNAVAILABLE, None, None, UCode.UNAVAILABLE):
+            breaker.record(breaker.allow(), code)
+        self.assertEqual(CircuitState.CLOSED, breaker.state())
+
+    def test_service_failures_do_not_open(self):
+        breaker = CircuitBreaker(window_size=2, minimum_calls=2)
+        breaker.record(breaker.allow(), UCode.INVALID_ARGUMENT)
+        breaker.record(breaker.allow(), UCode.NOT_FOUND)
+        self.assertEqual(CircuitState.CLOSED, breaker.state())
+
+    def test_half_open_probes(self):
+        breaker = CircuitBreaker(window_size=1, minimum_calls=1, open_time=10, probes=1)
+        breaker.record(breaker.allow(), UCode.UNAVAILABLE)
+        self.assertIsNone(breaker.allow())
+        time.sleep(0.02)
+        self.assertEqual(CircuitState.HALF_OPEN, breaker.state())
+        probe = breaker.allow()
+        self.assertIsNotNone(probe)
+        self.assertIsNone(breaker.allow())
+        breaker.record(probe, UCode.UNAVAILABLE)
+        self.assertEqual(CircuitState.OPEN, breaker.state())
+        time.sleep(0.02)
+        probe = breaker.allow()
+        self.assertIsNotNone(probe)
+        breaker.record(probe, None)
+        self.assertEqual(CircuitState.CLOSED, breaker.state())
+        self.assertIsNotNone(breaker.allow())
+
+    def test_cancelled_probe_releases_its_slot(self):
+        breaker = CircuitBreaker(window_size=1, minimum_calls=1, open_time=10, probes=1)
+        breaker.record(breaker.allow(), UCode.UNAVAILABLE)
+        time.sleep(0.02)
+        breaker.record(breaker.allow(), UCode.CANCELLED)
+        self.assertEqual(CircuitState.HALF_OPEN, breaker.state())
+        probe = breaker.allow()
+        self.assertIsNotNone(probe)
+        breaker.record(probe, UCode.UNAVAILABLE)
+        self.assertEqual(CircuitState.OPEN, breaker.state())
+
+    def test_outcomes_of_an_earlier_generation_are_ignored(self):
+        breaker = CircuitBreaker(window_size=1, minimum_calls=1, open_time=10, probes=1)
+        closed = [breaker.allow() for _ in range(3)]
+        breaker.record(closed[0], UCode.UNAVAILABLE)
+        time.sleep(0.02)
+        probe = breaker.allow()
+        # Calls sent while the circuit was closed complete during the probe
+        breaker.record(closed[1], None)
+        breaker.record(closed[2], UCode.CANCELLED)
+        self.assertEqual(CircuitState.HALF_OPEN, breaker.state())
+        self.assertEqual([None, None, None], [breaker.allow() for _ in range(3)])
+        breaker.record(probe, None)
+        self.assertEqual(CircuitState.CLOSED, breaker.state())
+        # A probe completing once the circuit closed is not counted either
+        breaker.record(probe, UCode.UNAVAILABLE)
+        self.assertEqual(CircuitState.CLOSED, breaker.state())
+
+    def test_cancelled_calls_are_not_counted(self):
+        breaker = CircuitBreaker(failure_rate=0.5, window_size=2, minimum_calls=2)
+        breaker.record(breaker.allow(), UCode.UNAVAILABLE)
+        breaker.record(breaker.allow(), UCode.CANCELLED)
+        self.assertEqual(CircuitState.CLOSED, breaker.state())
+        breaker.record(breaker.allow(), None)
+        self.assertEqual(CircuitState.OPEN, breaker.state())
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            CircuitBreaker(failure_rate=0)
+        with self.assertRaises(ValueError):
+            CircuitBreaker(window_size=5, minimum_calls=6)
+        with self.assertRaises(ValueError):
+            CircuitBreaker(probes=0)
+
+
+class TestCircuitBreakerRpcClient(unittest.TestCase):
+    def test_retries_unserved_failures(self):
+        delegate = ScriptedRpcClient(UCode.UNAVAILABLE, UCode.RESOURCE_EXHAUSTED)
+        client = CircuitBreakerRpcClient(delegate)
+        future = client.invoke_method(build_method(), build_payload(), CallOptions(ttl=1000))
+        self.assertEqual(Int32Value(value=3), RpcMapper.map_response(future, Int32Value).result(1))
+        self.assertEqual(3, len(delegate.calls))
+        self.assertTrue(all(0 < options.ttl <= 1000 for options in delegate.calls))
+
+    def test_does_not_retry_served_failures(self):
+        delegate = ScriptedRpcClient(UCode.INTERNAL)
+        client = CircuitBreakerRpcClient(delegate)
+        response = client.invoke_method(build_method(), build_payload(), CallOptions(ttl=1000)).result(1)
+        self.assertEqual(UCode.INTERNAL, response.attributes.commstatus)
+        self.assertEqual(1, len(delegate.calls))
+
+    def test_retries_are_capped_by_budget(self):
+        delegate = ScriptedRpcClient(*([UCode.UNAVAILABLE] * 10))
+        client = CircuitBreakerRpcClient(delegate, RetryBudget(ratio=0, capacity=1), max_attempts=5)
+        response = client.invoke_method(build_method(), build_payload(), CallOptions(ttl=1000)).result(1)
+        self.assertEqual(UCode.UNAVAILABLE, response.attributes.commstatus)
+        self.assertEqual(2, len(delegate.calls))
+
+    def test_retries_stop_once_ttl_is_spent(self):
+        class SlowScriptedRpcClient(ScriptedRpcClient):
+            def invoke_method(self, method_uri, request_payload, options):
+                time.sleep(0.02)
+                return super().invoke_method(method_uri, request_payload, options)
+
+        delegate = SlowScriptedRpcClient(*([UCode.UNAVAILABLE] * 10))
+        client = CircuitBreakerRpcClient(delegate, RetryBudget(capacity=10), max_attempts=10)
+        client.invoke_method(build_method(), build_payload(), CallOptions(ttl=30)).result(1)
+        self.assertEqual(2, len(delegate.calls))
+
+    def test_open_circuit_short_circuits_recognisably(self):
+        delegate = ScriptedRpcClient(*([UCode.INTERNAL] * 10))
+        client = CircuitBreakerRpcClient(
+            delegate, breaker_factory=lambda: CircuitBreaker(window_size=2, minimum_calls=2, open_time=60000)
+        )
+        for _ in range(2):
+            client.invoke_method(build_method(), build_payload(), CallOptions(ttl=1000))
+        self.assertEqual(CircuitState.OPEN, client.breaker(build_method()).state())
+
+        future = client.invoke_method(build_method(), build_payload(), CallOptions(ttl=1000))
+        self.assertEqual(CIRCUIT_OPEN, future.result(1).attributes.commstatus)
+        self.assertTrue(CircuitBreakerRpcClient.is_circuit_open(future.result()))
+        self.assertEqual(2, len(delegate.calls))
+        result = RpcMapper.map_response_to_result(future, Int32Value)
+        self.assertTrue(result.is_failure())
+        self.assertEqual(CIRCUIT_OPEN, result.failure_value().code)
+
+        # Circuits are per method
+        client.invoke_method(build_method("FindUri"), build_payload(), CallOptions(ttl=1000))
+        self.assertEqual(3, len(delegate.calls))
+
+    def test_server_failure_is_not_circuit_open(self):
+        delegate = ScriptedRpcClient(UCode.FAILED_PRECONDITION)
+        client = CircuitBreakerRpcClient(delegate, max_attempts=1)
+        response = client.invoke_method(build_method(), build_payload(), CallOptions(ttl=1000)).result(1)
+        self.assertEqual(CIRCUIT_OPEN, response.attributes.commstatus)
+        self.assertFalse(CircuitBreakerRpcClient.is_circuit_open(response))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            CircuitBreakerRpcClient(None)
+        with self.assertRaises(ValueError):
+            CircuitBreakerRpcClient(ScriptedRpcClient(), max_attempts=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
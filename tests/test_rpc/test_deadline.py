@@ -0,0 +1,150 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import time
+import unittest
+
+from google.protobuf.wrappers_pb2 import Int32Value
+
+from uprotocol.proto.uattributes_pb2 import CallOptions, UPriority
+from uprotocol.proto.umessage_pb2 import UMessage
+from uprotocol.proto.upayload_pb2 import UPayload
+from uprotocol.proto.ustatus_pb2 import UCode
+from uprotocol.rpc.deadline import Deadline
+from uprotocol.rpc.inmemoryrpcclient import InMemoryRpcClient
+from uprotocol.rpc.inmemoryrpcserver import InMemoryRpcServer
+from uprotocol.rpc.requesthandler import RequestHandler
+from uprotocol.transport.builder.uattributesbuilder import UAttributesBuilder
+from uprotocol.transport.builder.upayloadbuilder import UPayloadBuilder
+from uprotocol.transport.loopbackutransport import LoopbackUTransport
+from uprotocol.uri.serializer.longuriserializer import LongUriSerializer
+
+
+def build_source():
+    return LongUriSerializer().deserialize("/hartley/1/rpc.response")
+
+
+def build_method_a():
+    return LongUriSerializer().deserialize("/service.a/1/rpc.Run")
+
+
+def build_method_b():
+    return LongUriSerializer().deserialize("/service.b/1/rpc.Run")
+
+
+class TtlRecordingHandler(RequestHandler):
+    def __init__(self):
+        self.ttls = []
+
+    def handle_request(self, request: UMessage) -> UPayload:
+        self.ttls.append(request.attributes.ttl)
+        return request.payload
+
+
+class NestedCallHandler(RequestHandler):
+    def __init__(self, client: InMemoryRpcClient, sleep: float = 0):
+        self.client = client
+        self.sleep = sleep
+        self.responses = []
+
+    def handle_request(self, request: UMessage) -> UPayload:
+        time.sleep(self.sleep)
+        response = self.client.invoke_method(build_method_b(), request.payload, CallOptions(ttl=60000)).result(1)
+        self.responses.append(response)
+        return response.payload
+
+
+class TestDeadline(unittest.TestCase):
+    def test_after(self):
+        deadline = Deadline.after(1000)
+        self.assertTrue(900 < deadline.remaining() <= 1000)
+        self.assertFalse(deadline.is_expired())
+        self.assertTrue(Deadline.after(0).is_expired())
+
+    def test_from_attributes(self):
+        attributes = UAttributesBuilder.request(build_source(), build_method_a(), UPriority.UPRIORITY_CS4, 1000).build()
+        self.assertTrue(900 < Deadline.from_attributes(attributes).remaining() <= 1000)
+        attributes.ttl = 0
+        self.assertIsNone(Deadline.from_attributes(attributes))
+        self.assertIsNone(Deadline.from_attributes(None))
+
+    def test_scope_only_tightens(self):
+        self.assertIsNone(Deadline.current())
+        outer = Deadline.after(1000)
+        with Deadline.scope(outer):
+            self.assertIs(outer, Deadline.current())
+            with Deadline.scope(Deadline.after(5000)):
+                self.assertIs(outer, Deadline.current())
+            inner = Deadline.after(100)
+            with Deadline.scope(inner):
+                self.assertIs(inner, Deadline.current())
+            with Deadline.scope(None):
+                self.assertIs(outer, Deadline.current())
+        self.assertIsNone(Deadline.current())
+
+    def test_call_options(self):
+        options = CallOptions(ttl=60000, token="s3cr3t")
+        self.assertIs(options, Deadline.call_options(options))
+        with Deadline.scope(Deadline.after(1000)):
+            capped = Deadline.call_options(options)
+            self.assertTrue(900 < capped.ttl <= 1000)
+            self.assertEqual("s3cr3t", capped.token)
+            self.assertEqual(60000, options.ttl)
+            short = CallOptions(ttl=10)
+            self.assertIs(short, Deadline.call_options(short))
+            self.assertTrue(900 < Deadline.call_options(None).ttl <= 1000)
+        with Deadline.scope(Deadline.after(0)):
+            self.assertEqual(0, Deadline.call_options(options).ttl)
+
+    def test_nested_call_inherits_deadline(self):
+        transport = LoopbackUTransport()
+        server = InMemoryRpcServer(transport)
+        client = InMemoryRpcClient(transport, build_source())
+        recorder = TtlRecordingHandler()
+        server.register_request_handler(build_method_a(), NestedCallHandler(client))
+        server.register_request_handler(build_method_b(), recorder)
+
+        payload = UPayloadBuilder.pack_to_any(Int32Value(value=3))
+        response = client.invoke_method(build_method_a(), payload, CallOptions(ttl=1000)).result(1)
+        self.assertEqual(Int32Value(value=3), UPayloadBuilder.unpack(response.payload, Int32Value))
+        self.assertEqual(1, len(recorder.ttls))
+        self.assertTrue(0 < recorder.ttls[0] <= 1000)
+        client.close()
+
+    def test_nested_call_fails_fast_once_budget_is_exhausted(self):
+        transport = LoopbackUTransport()
+        server = InMemoryRpcServer(transport)
+        client = InMemoryRpcClient(transport, build_source())
+        recorder = TtlRecordingHandler()
+        handler = NestedCallHandler(client, sleep=0.1)
+        server.register_request_handler(build_method_a(), handler)
+        server.register_request_handler(build_method_b(), recorder)
+
+        payload = UPayloadBuilder.pack_to_any(Int32Value(value=3))
+        client.invoke_method(build_method_a(), payload, CallOptions(ttl=50))
+        self.assertEqual([], recorder.ttls)
+        self.assertEqual(UCode.DEADLINE_EXCEEDED, handler.responses[0].attributes.commstatus)
+        client.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
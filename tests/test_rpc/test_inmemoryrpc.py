@@ -0,0 +1,427 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from google.protobuf.wrappers_pb2 import Int32Value, StringValue
+
+from uprotocol.proto.uattributes_pb2 import CallOptions, UAttributes
+from uprotocol.proto.umessage_pb2 import UMessage
+from uprotocol.proto.upayload_pb2 import UPayload
+from uprotocol.proto.uri_pb2 import UUri
+from uprotocol.proto.ustatus_pb2 import UCode, UStatus
+from uprotocol.rpc.cachingrpcclient import CachingRpcClient
+from uprotocol.rpc.circuitbreakerrpcclient import CircuitBreakerRpcClient
+from uprotocol.rpc.inmemoryrpcclient import InMemoryRpcClient
+from uprotocol.rpc.inmemoryrpcserver import InMemoryRpcServer
+from uprotocol.rpc.messagehandler import MessageHandler
+from uprotocol.rpc.requesthandler import RequestHandler
+from uprotocol.rpc.responsestream import ResponseStream
+from uprotocol.rpc.rpcmapper import RpcMapper
+from uprotocol.rpc.singleflightrpcclient import SingleFlightRpcClient
+from uprotocol.rpc.streamhandler import StreamHandler
+from uprotocol.transport.builder.umessagebuilder import UMessageBuilder
+from uprotocol.transport.builder.upayloadbuilder import UPayloadBuilder
+from uprotocol.transport.loopbackutransport import LoopbackUTransport
+from uprotocol.transport.ulistener import UListener
+from uprotocol.uri.serializer.longuriserializer import LongUriSerializer
+
+
+def build_source():
+    return LongUriSerializer().deserialize("/hartley/1/rpc.response")
+
+
+def build_method(resource="rpc.LookupUri"):
+    return LongUriSerializer().deserialize(f"/core.udiscovery/3/{resource}")
+
+
+class RecordingListener(UListener):
+    def __init__(self, messages):
+        self.messages = messages
+
+    def on_receive(self, umsg: UMessage) -> None:
+        self.messages.append(umsg)
+
+
+class IncrementHandler(RequestHandler):
+    def handle_request(self, request: UMessage) -> UPayload:
+        value = UPayloadBuilder.unpack(request.payload, Int32Value).value
+        return UPayloadBuilder.pack_to_any(Int32Value(value=value + 1))
+
+
+class ThatThrows(RequestHandler):
+    def handle_request(self, request: UMessage) -> UPayload:
+        raise RuntimeError("Boom")
+
+
+class BlockingHandler(RequestHandler):
+    def __init__(self):
+        self.release = threading.Event()
+        self.calls = 0
+
+    def handle_request(self, request: UMessage) -> UPayload:
+        self.calls += 1
+        self.release.wait(5)
+        return request.payload
+
+
+class CountingStreamHandler(StreamHandler):
+    def __init__(self, fail_after=None):
+        self.fail_after = fail_after
+        self.produced = 0
+
+    def handle_request(self, request: UMessage):
+        count = UPayloadBuilder.unpack(request.payload, Int32Value).value
+        for index in range(count):
+            if index == self.fail_after:
+                raise RuntimeError("Boom")
+            self.produced += 1
+            yield UPayloadBuilder.pack_to_any(Int32Value(value=index))
+
+
+class IncrementMessageHandler(MessageHandler):
+    def __init__(self):
+        self.requests = []
+
+    def handle_message(self, request, attributes):
+        self.requests.append(request)
+        if request.value < 0:
+            raise ValueError("Negative value")
+        return Int32Value(value=request.value + 1)
+
+
+class TestInMemoryRpc(unittest.TestCase):
+    def setUp(self):
+        self.transport = LoopbackUTransport()
+        self.server = InMemoryRpcServer(self.transport)
+        self.client = InMemoryRpcClient(self.transport, build_source())
+
+    def tearDown(self):
+        self.client.close()
+        self.server.close()
+
+    def invoke(self, value=3, options=None):
+        payload = UPayloadBuilder.pack_to_any(Int32Value(value=value))
+        return self.client.invoke_method(build_method(), payload, options or CallOptions(ttl=1000))
+
+    def test_round_trip(self):
+        self.assertEqual(UCode.OK, self.server.register_request_handler(build_method(), IncrementHandler()).code)
+        result = RpcMapper.map_response(self.invoke(), Int32Value).result(1)
+        self.assertEqual(Int32Value(value=4), result)
+        self.assertEqual(0, self.client.pending())
+
+    def test_round_trip_on_executors(self):
+        with ThreadPoolExecutor(2) as transport_executor, ThreadPoolExecutor(2) as server_executor:
+            transport = LoopbackUTransport(transport_executor)
+            server = InMemoryRpcServer(transport, server_executor)
+            client = InMemoryRpcClient(transport, build_source())
+            server.register_request_handler(build_method(), IncrementHandler())
+            payload = UPayloadBuilder.pack_to_any(Int32Value(value=41))
+            futures = [client.invoke_method(build_method(), payload, CallOptions(ttl=1000)) for _ in range(20)]
+            for future in futures:
+                self.assertEqual(Int32Value(value=42), UPayloadBuilder.unpack(future.result(1).payload, Int32Value))
+            client.close()
+
+    def test_handler_exception_fails_with_internal(self):
+        self.server.register_request_handler(build_method(), ThatThrows())
+        result = RpcMapper.map_response_to_result(self.invoke(), Int32Value)
+        self.assertTrue(result.is_failure())
+        self.assertEqual(UCode.INTERNAL, result.failure_value().code)
+        self.assertEqual("Boom", result.failure_value().message)
+
+    def test_no_server(self):
+        response = self.invoke().result(1)
+        self.assertTrue(RpcMapper.is_failure_response(response))
+        self.assertEqual(UCode.NOT_FOUND, UPayloadBuilder.unpack(response.payload, UStatus).code)
+        self.assertEqual(0, self.client.pending())
+
+    def test_invalid_method_uri(self):
+        response = self.client.invoke_method(UUri(), UPayload(), CallOptions(ttl=1000)).result(1)
+        self.assertEqual(UCode.INVALID_ARGUMENT, UPayloadBuilder.unpack(response.payload, UStatus).code)
+
+    def test_request_times_out(self):
+        with ThreadPoolExecutor(1) as executor:
+            transport = LoopbackUTransport()
+            server = InMemoryRpcServer(transport, executor)
+            client = InMemoryRpcClient(transport, build_source())
+            handler = BlockingHandler()
+            server.register_request_handler(build_method(), handler)
+            payload = UPayloadBuilder.pack_to_any(Int32Value(value=3))
+            response = client.invoke_method(build_method(), payload, CallOptions(ttl=50)).result(1)
+            handler.release.set()
+            self.assertEqual(UCode.DEADLINE_EXCEEDED, response.attributes.commstatus)
+            self.assertEqual(0, client.pending())
+            client.close()
+
+    def test_register_request_handler_twice(self):
+        self.server.register_request_handler(build_method(), IncrementHandler())
+        status = self.server.register_request_handler(build_method(), IncrementHandler())
+        self.assertEqual(UCode.ALREADY_EXISTS, status.code)
+
+    def test_register_request_handler_invalid_uri(self):
+        status = self.server.register_request_handler(UUri(), IncrementHandler())
+        self.assertEqual(UCode.INVALID_ARGUMENT, status.code)
+
+    def test_unregister_request_handler(self):
+        handler = IncrementHandler()
+        self.server.register_request_handler(build_method(), handler)
+        self.assertEqual(UCode.NOT_FOUND, self.server.unregister_request_handler(build_method(), ThatThrows()).code)
+        self.assertEqual(UCode.OK, self.server.unregister_request_handler(build_method(), handler).code)
+        self.assertEqual(UCode.NOT_FOUND, UPayloadBuilder.unpack(self.invoke().result(1).payload, UStatus).code)
+
+    def stream(self, count, max_buffered=16):
+        payload = UPayloadBuilder.pack_to_any(Int32Value(value=count))
+        return self.client.invoke_streaming(build_method(), payload, CallOptions(ttl=1000), max_buffered)
+
+    def test_streaming(self):
+        self.server.register_stream_handler(build_method(), CountingStreamHandler())
+        stream = self.stream(50)
+        values = [UPayloadBuilder.unpack(message.payload, Int32Value).value for message in stream]
+        self.assertEqual(list(range(50)), values)
+        self.assertEqual(UCode.OK, stream.status().code)
+        self.assertEqual(0, self.client.pending())
+
+    def test_streaming_is_flow_controlled(self):
+        handler = CountingStreamHandler()
+        self.server.register_stream_handler(build_method(), handler)
+        stream = self.stream(100, max_buffered=4)
+        first = next(stream)
+        self.assertEqual(Int32Value(value=0), UPayloadBuilder.unpack(first.payload, Int32Value))
+        # The producer is paused once the buffer is full
+        self.assertLessEqual(handler.produced, 6)
+        self.assertEqual(99, len(list(stream)))
+
+    def test_streaming_async(self):
+        self.server.register_stream_handler(build_method(), CountingStreamHandler())
+
+        async def consume():
+            return [UPayloadBuilder.unpack(message.payload, Int32Value).value async for message in self.stream(10)]
+
+        self.assertEqual(list(range(10)), asyncio.run(consume()))
+
+    def test_streaming_failure(self):
+        self.server.register_stream_handler(build_method(), CountingStreamHandler(fail_after=3))
+        stream = self.stream(10)
+        received = []
+        with self.assertRaises(RuntimeError):
+            for message in stream:
+                received.append(message)
+        self.assertEqual(3, len(received))
+        self.assertEqual(UStatus(code=UCode.INTERNAL, message="Boom"), stream.status())
+
+    def test_streaming_closed_by_client(self):
+        self.server.register_stream_handler(build_method(), CountingStreamHandler())
+        stream = self.stream(100, max_buffered=2)
+        next(stream)
+        stream.close()
+        self.assertEqual(UCode.CANCELLED, stream.status().code)
+        self.assertEqual([], list(stream))
+        self.assertEqual(0, self.client.pending())
+
+    def test_streaming_closed_by_client_stops_the_producer(self):
+        handler = CountingStreamHandler()
+        self.server.register_stream_handler(build_method(), handler)
+        stream = self.stream(1000, max_buffered=2)
+        next(stream)
+        stream.close()
+        time.sleep(0.1)
+        self.assertLess(handler.produced, 1000)
+
+    def test_streaming_closed_by_context_manager(self):
+        self.server.register_stream_handler(build_method(), CountingStreamHandler())
+        with self.stream(100, max_buffered=2) as stream:
+            next(stream)
+        self.assertEqual(UCode.CANCELLED, stream.status().code)
+        self.assertEqual(0, self.client.pending())
+
+    def test_streaming_closed_when_iteration_stops(self):
+        handler = CountingStreamHandler()
+        self.server.register_stream_handler(build_method(), handler)
+        stream = self.stream(1000, max_buffered=2)
+        for _ in stream:
+            break
+        self.assertEqual(UCode.CANCELLED, stream.status().code)
+        self.assertEqual(0, self.client.pending())
+        time.sleep(0.1)
+        self.assertLess(handler.produced, 1000)
+
+    def test_streaming_put_is_bounded_by_idle_timeout(self):
+        stream = ResponseStream(max_buffered=1, idle_timeout=0.05)
+        self.assertTrue(stream.put(UMessage()))
+        start = time.monotonic()
+        self.assertFalse(stream.put(UMessage()))
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual(UCode.DEADLINE_EXCEEDED, stream.status().code)
+
+    def test_close_server_shuts_down_stream_threads(self):
+        self.server.register_stream_handler(build_method(), CountingStreamHandler())
+        running = set(threading.enumerate())
+        self.assertEqual(10, len(list(self.stream(10))))
+        threads = [thread for thread in set(threading.enumerate()) - running if thread.name.startswith("uprotocol")]
+        self.assertTrue(threads)
+        self.server.close()
+        self.assertFalse(any(thread.is_alive() for thread in threads))
+        with self.assertRaises(RuntimeError):
+            list(self.stream(10))
+
+    def test_streaming_no_server(self):
+        stream = self.stream(10)
+        with self.assertRaises(RuntimeError):
+            list(stream)
+        self.assertEqual(UCode.NOT_FOUND, stream.status().code)
+
+    def test_invoke_message_short_circuits_local_handler(self):
+        handler = IncrementMessageHandler()
+        self.server.register_message_handler(build_method(), Int32Value, handler)
+        request = Int32Value(value=3)
+        response = self.client.invoke_message(build_method(), request, CallOptions(ttl=1000), Int32Value).result(1)
+        self.assertEqual(Int32Value(value=4), response)
+        # The handler got the very object of the caller, nothing was serialized
+        self.assertIs(request, handler.requests[0])
+        self.assertEqual(0, self.client.pending())
+
+    def test_message_handler_serves_remote_requests(self):
+        handler = IncrementMessageHandler()
+        self.server.register_message_handler(build_method(), Int32Value, handler)
+        response = RpcMapper.map_response(self.invoke(41), Int32Value).result(1)
+        self.assertEqual(Int32Value(value=42), response)
+        self.assertEqual(Int32Value(value=41), handler.requests[0])
+
+    def test_invoke_message_without_local_handler(self):
+        self.server.register_request_handler(build_method(), IncrementHandler())
+        response = self.client.invoke_message(build_method(), Int32Value(value=3), CallOptions(ttl=1000), Int32Value)
+        self.assertEqual(Int32Value(value=4), response.result(1))
+
+    def test_invoke_message_failures(self):
+        self.server.register_message_handler(build_method(), Int32Value, IncrementMessageHandler())
+        future = self.client.invoke_message(build_method(), Int32Value(value=-1), CallOptions(ttl=1000), Int32Value)
+        with self.assertRaisesRegex(RuntimeError, "Negative value \\[INTERNAL\\]"):
+            future.result(1)
+        future = self.client.invoke_message(build_method(), Int32Value(value=1), CallOptions(ttl=1000), StringValue)
+        with self.assertRaisesRegex(RuntimeError, "Unknown payload type"):
+            future.result(1)
+
+    def test_invoke_message_remote_failure(self):
+        self.server.register_request_handler(build_method(), ThatThrows())
+        future = self.client.invoke_message(build_method(), Int32Value(value=3), CallOptions(ttl=1000), Int32Value)
+        with self.assertRaisesRegex(RuntimeError, "Boom \\[INTERNAL\\]"):
+            future.result(1)
+
+    def test_unregister_message_handler(self):
+        handler = IncrementMessageHandler()
+        self.server.register_message_handler(build_method(), Int32Value, handler)
+        self.assertIsNotNone(InMemoryRpcServer.local_handler(self.transport, build_method()))
+        self.assertEqual(UCode.OK, self.server.unregister_request_handler(build_method(), handler).code)
+        self.assertIsNone(InMemoryRpcServer.local_handler(self.transport, build_method()))
+        future = self.client.invoke_message(build_method(), Int32Value(value=3), CallOptions(ttl=1000), Int32Value)
+        with self.assertRaisesRegex(RuntimeError, "NOT_FOUND"):
+            future.result(1)
+
+    def test_cancel_skips_queued_request(self):
+        with ThreadPoolExecutor(1) as executor:
+            transport = LoopbackUTransport()
+            server = InMemoryRpcServer(transport, executor)
+            client = InMemoryRpcClient(transport, build_source())
+            handler = BlockingHandler()
+            server.register_request_handler(build_method(), handler)
+            payload = UPayloadBuilder.pack_to_any(Int32Value(value=3))
+            first = client.invoke_method(build_method(), payload, CallOptions(ttl=1000))
+            second = client.invoke_method(build_method(), payload, CallOptions(ttl=1000))
+            self.assertTrue(second.cancel())
+            self.assertEqual(1, client.pending())
+            handler.release.set()
+            self.assertEqual(UCode.OK, first.result(1).attributes.commstatus)
+        self.assertEqual(1, handler.calls)
+        self.assertEqual(0, client.pending())
+        client.close()
+
+    def test_cancel_through_wrapping_clients(self):
+        with ThreadPoolExecutor(1) as executor:
+            transport = LoopbackUTransport()
+            server = InMemoryRpcServer(transport, executor)
+            client = InMemoryRpcClient(transport, build_source())
+            stacked = CachingRpcClient(SingleFlightRpcClient(CircuitBreakerRpcClient(client)), default_ttl=1000)
+            handler = BlockingHandler()
+            server.register_request_handler(build_method(), handler)
+            first = stacked.invoke_method(
+                build_method(), UPayloadBuilder.pack_to_any(Int32Value(value=3)), CallOptions(ttl=1000)
+            )
+            second = stacked.invoke_method(
+                build_method(), UPayloadBuilder.pack_to_any(Int32Value(value=4)), CallOptions(ttl=1000)
+            )
+            self.assertEqual(2, client.pending())
+            self.assertTrue(second.cancel())
+            self.assertEqual(1, client.pending())
+            handler.release.set()
+            self.assertEqual(UCode.OK, first.result(1).attributes.commstatus)
+        # The cancelled request was skipped by the server
+        self.assertEqual(1, handler.calls)
+        self.assertEqual(0, client.pending())
+        client.close()
+
+    def test_cancel_from_another_source_is_ignored(self):
+        with ThreadPoolExecutor(1) as executor:
+            transport = LoopbackUTransport()
+            server = InMemoryRpcServer(transport, executor)
+            handler = BlockingHandler()
+            server.register_request_handler(build_method(), handler)
+            responses = []
+            transport.register_listener(build_source(), RecordingListener(responses))
+            payload = UPayloadBuilder.pack_to_any(Int32Value(value=3))
+            requests = [UMessageBuilder.request(build_source(), build_method(), CallOptions(ttl=1000), payload)]
+            requests.append(UMessageBuilder.request(build_source(), build_method(), CallOptions(ttl=1000), payload))
+            for request in requests:
+                transport.send(request)
+            attributes = UAttributes()
+            attributes.CopyFrom(requests[1].attributes)
+            attributes.source.CopyFrom(LongUriSerializer().deserialize("/intruder/1/rpc.response"))
+            transport.send(UMessageBuilder.cancel(attributes))
+            handler.release.set()
+        self.assertEqual(2, handler.calls)
+        self.assertEqual(2, len(responses))
+
+    def test_cancel_local_call(self):
+        with ThreadPoolExecutor(1) as executor:
+            transport = LoopbackUTransport()
+            server = InMemoryRpcServer(transport, executor)
+            client = InMemoryRpcClient(transport, build_source())
+            blocking = BlockingHandler()
+            message_handler = IncrementMessageHandler()
+            server.register_request_handler(build_method(), blocking)
+            server.register_message_handler(build_method("rpc.Increment"), Int32Value, message_handler)
+            payload = UPayloadBuilder.pack_to_any(Int32Value(value=3))
+            client.invoke_method(build_method(), payload, CallOptions(ttl=1000))
+            future = client.invoke_message(
+                build_method("rpc.Increment"), Int32Value(value=3), CallOptions(ttl=1000), Int32Value
+            )
+            self.assertTrue(future.cancel())
+            blocking.release.set()
+        self.assertEqual([], message_handler.requests)
+        client.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
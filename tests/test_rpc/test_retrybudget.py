@@ -0,0 +1,58 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import unittest
+
+from uprotocol.rpc.retrybudget import RetryBudget
+
+
+class TestRetryBudget(unittest.TestCase):
+    def test_starts_full(self):
+        budget = RetryBudget(ratio=0.1, capacity=2)
+        self.assertTrue(budget.try_withdraw())
+        self.assertTrue(budget.try_withdraw())
+        self.assertFalse(budget.try_withdraw())
+
+    def test_calls_earn_retries(self):
+        budget = RetryBudget(ratio=0.25, capacity=1)
+        budget.try_withdraw()
+        for _ in range(3):
+            budget.deposit()
+        self.assertFalse(budget.try_withdraw())
+        budget.deposit()
+        self.assertTrue(budget.try_withdraw())
+
+    def test_balance_is_capped(self):
+        budget = RetryBudget(ratio=0.5, capacity=3)
+        for _ in range(100):
+            budget.deposit()
+        self.assertEqual(3, budget.balance())
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            RetryBudget(ratio=-0.1)
+        with self.assertRaises(ValueError):
+            RetryBudget(capacity=0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
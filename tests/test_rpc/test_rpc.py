@@ -306,6 +306,13 @@ class TestRpc(unittest.TestCase):
         )
         self.assertEqual(str(exception), str(rpc_response.exception()))
 
+    def test_success_invoke_method_happy_flow_using_map_response_without_expected_class(self):
+        rpc_response = RpcMapper.map_response(
+            HappyPath().invoke_method(build_topic(), build_upayload(), build_calloptions()),
+            None,
+        )
+        self.assertEqual(build_cloud_event(), rpc_response.result())
+
     def test_map_response_when_response_message_is_null(self):
         rpc_response = RpcMapper.map_response(
             WithNullMessage().invoke_method(build_topic(), build_upayload(), build_calloptions()),
@@ -313,3 +320,15 @@ class TestRpc(unittest.TestCase):
         )
         exception = RuntimeError("Server returned a null payload. Expected CloudEvent")
         self.assertEqual(str(exception), str(rpc_response.exception()))
+
+    def test_to_status(self):
+        status = RpcMapper.to_status(
+            WithUStatusCodeInsteadOfHappyPath()
+            .invoke_method(build_topic(), build_upayload(), build_calloptions())
+            .result()
+        )
+        self.assertEqual(UStatus(code=UCode.INVALID_ARGUMENT, message="boom"), status)
+        # Not a UStatus, no payload or a payload that cannot be parsed
+        for client in (HappyPath(), WithNullInPayload(), ThatBarfsCrapyPayload()):
+            message = client.invoke_method(build_topic(), build_upayload(), build_calloptions()).result()
+            self.assertIsNone(RpcMapper.to_status(message))
@@ -0,0 +1,179 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import threading
+import unittest
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from google.protobuf.wrappers_pb2 import Int32Value, StringValue
+
+from uprotocol.proto.uattributes_pb2 import CallOptions
+from uprotocol.proto.umessage_pb2 import UMessage
+from uprotocol.proto.upayload_pb2 import UPayload
+from uprotocol.proto.uri_pb2 import UUri
+from uprotocol.rpc.rpcclient import RpcClient
+from uprotocol.rpc.rpcmapper import RpcMapper
+from uprotocol.rpc.singleflightrpcclient import SingleFlightRpcClient
+from uprotocol.transport.builder.upayloadbuilder import UPayloadBuilder
+from uprotocol.uri.serializer.longuriserializer import LongUriSerializer
+
+
+def build_method():
+    return LongUriSerializer().deserialize("//vcu.vin/core.udiscovery/3/rpc.LookupUri")
+
+
+def build_calloptions():
+    return CallOptions(ttl=1000)
+
+
+class DeferredRpcClient(RpcClient):
+    """
+    RpcClient that keeps the returned futures pending until complete() is called.
+    """
+
+    def __init__(self):
+        self.pending = []
+        self.lock = threading.Lock()
+
+    def invoke_method(self, method_uri: UUri, request_payload: UPayload, options: CallOptions):
+        future = Future()
+        with self.lock:
+            self.pending.append(future)
+        return future
+
+    def complete(self, value=3):
+        for future in self.pending:
+            future.set_result(UMessage(payload=UPayloadBuilder.pack_to_any(Int32Value(value=value))))
+
+
+class ThatThrows(RpcClient):
+    def invoke_method(self, method_uri: UUri, request_payload: UPayload, options: CallOptions):
+        raise RuntimeError("Boom")
+
+
+class TestSingleFlightRpcClient(unittest.TestCase):
+    def test_identical_concurrent_calls_are_coalesced(self):
+        delegate = DeferredRpcClient()
+        client = SingleFlightRpcClient(delegate)
+        payload = UPayloadBuilder.pack_to_any(StringValue(value="hartley"))
+        first = client.invoke_method(build_method(), payload, build_calloptions())
+        second = client.invoke_method(build_method(), payload, build_calloptions())
+        self.assertIsNot(first, second)
+        self.assertEqual(1, len(delegate.pending))
+        self.assertEqual(1, client.coalesced)
+
+        delegate.complete()
+        self.assertEqual(3, RpcMapper.map_response(first, Int32Value).result().value)
+        self.assertEqual(3, RpcMapper.map_response(second, Int32Value).result().value)
+        self.assertEqual(0, client.in_flight())
+
+    def test_cancel_only_drops_the_caller(self):
+        delegate = DeferredRpcClient()
+        client = SingleFlightRpcClient(delegate)
+        first = client.invoke_method(build_method(), None, build_calloptions())
+        second = client.invoke_method(build_method(), None, build_calloptions())
+        self.assertTrue(first.cancel())
+        self.assertFalse(second.cancelled())
+        self.assertFalse(delegate.pending[0].cancelled())
+        self.assertEqual(1, client.in_flight())
+
+        delegate.complete()
+        self.assertTrue(first.cancelled())
+        self.assertEqual(3, RpcMapper.map_response(second, Int32Value).result().value)
+
+    def test_request_is_cancelled_once_every_caller_cancelled(self):
+        delegate = DeferredRpcClient()
+        client = SingleFlightRpcClient(delegate)
+        first = client.invoke_method(build_method(), None, build_calloptions())
+        second = client.invoke_method(build_method(), None, build_calloptions())
+        first.cancel()
+        second.cancel()
+        self.assertTrue(delegate.pending[0].cancelled())
+        self.assertEqual(0, client.in_flight())
+
+        third = client.invoke_method(build_method(), None, build_calloptions())
+        self.assertEqual(2, len(delegate.pending))
+        self.assertFalse(third.done())
+
+    def test_cancelled_request_cancels_the_callers(self):
+        delegate = DeferredRpcClient()
+        client = SingleFlightRpcClient(delegate)
+        first = client.invoke_method(build_method(), None, build_calloptions())
+        second = client.invoke_method(build_method(), None, build_calloptions())
+        delegate.pending[0].cancel()
+        self.assertTrue(first.cancelled())
+        self.assertTrue(second.cancelled())
+        self.assertEqual(0, client.in_flight())
+
+    def test_different_payloads_are_not_coalesced(self):
+        delegate = DeferredRpcClient()
+        client = SingleFlightRpcClient(delegate)
+        first = client.invoke_method(build_method(), UPayloadBuilder.pack_to_any(StringValue(value="a")), None)
+        second = client.invoke_method(build_method(), UPayloadBuilder.pack_to_any(StringValue(value="b")), None)
+        self.assertIsNot(first, second)
+        self.assertEqual(2, len(delegate.pending))
+        self.assertEqual(2, client.in_flight())
+
+    def test_completed_call_is_not_reused(self):
+        delegate = DeferredRpcClient()
+        client = SingleFlightRpcClient(delegate)
+        first = client.invoke_method(build_method(), None, build_calloptions())
+        delegate.complete()
+        second = client.invoke_method(build_method(), None, build_calloptions())
+        self.assertIsNot(first, second)
+        self.assertFalse(second.done())
+
+    def test_exception_is_shared(self):
+        delegate = DeferredRpcClient()
+        client = SingleFlightRpcClient(delegate)
+        first = client.invoke_method(build_method(), None, build_calloptions())
+        second = client.invoke_method(build_method(), None, build_calloptions())
+        delegate.pending[0].set_exception(RuntimeError("Boom"))
+        self.assertEqual("Boom", str(first.exception()))
+        self.assertEqual("Boom", str(second.exception()))
+        self.assertEqual(0, client.in_flight())
+
+    def test_delegate_raising_clears_in_flight_entry(self):
+        client = SingleFlightRpcClient(ThatThrows())
+        with self.assertRaises(RuntimeError):
+            client.invoke_method(build_method(), None, build_calloptions())
+        self.assertEqual(0, client.in_flight())
+
+    def test_thundering_herd_collapses_into_one_call(self):
+        delegate = DeferredRpcClient()
+        client = SingleFlightRpcClient(delegate)
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            futures = list(
+                executor.map(lambda _: client.invoke_method(build_method(), None, build_calloptions()), range(200))
+            )
+        self.assertEqual(1, len(delegate.pending))
+        delegate.complete(7)
+        for future in futures:
+            self.assertEqual(7, RpcMapper.map_response(future, Int32Value).result().value)
+
+    def test_none_delegate(self):
+        with self.assertRaises(ValueError):
+            SingleFlightRpcClient(None)
+
+
+if __name__ == "__main__":
+    unittest.main()
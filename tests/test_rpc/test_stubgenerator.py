@@ -0,0 +1,167 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import unittest
+from concurrent.futures import Future
+
+from google.protobuf import descriptor_pb2, descriptor_pool
+
+from uprotocol.proto import uprotocol_options_pb2
+from uprotocol.proto.core.udiscovery.v3.udiscovery_pb2 import (
+    DESCRIPTOR as U_DISCOVERY_FILE_DESCRIPTOR,
+)
+from uprotocol.proto.uattributes_pb2 import CallOptions
+from uprotocol.proto.umessage_pb2 import UMessage
+from uprotocol.proto.upayload_pb2 import UPayload
+from uprotocol.proto.uri_pb2 import UAuthority, UResource, UUri
+from uprotocol.rpc.rpcclient import RpcClient
+from uprotocol.rpc.stubgenerator import RpcStub, StubGenerator
+from uprotocol.transport.builder.upayloadbuilder import UPayloadBuilder
+from uprotocol.uri.serializer.longuriserializer import LongUriSerializer
+from uprotocol.uri.serializer.microuriserializer import MicroUriSerializer
+
+
+def build_service():
+    return U_DISCOVERY_FILE_DESCRIPTOR.services_by_name["uDiscovery"]
+
+
+def build_service_without_method_ids():
+    """
+    Build a body.access service whose methods do not declare a method_id option.
+    """
+    pool = descriptor_pool.DescriptorPool()
+    for dependency in (descriptor_pb2.DESCRIPTOR, uprotocol_options_pb2.DESCRIPTOR):
+        file = descriptor_pb2.FileDescriptorProto()
+        dependency.CopyToProto(file)
+        pool.Add(file)
+
+    file = descriptor_pb2.FileDescriptorProto(
+        name="body/access/v1/body_access.proto",
+        package="body.access.v1",
+        syntax="proto3",
+        dependency=[uprotocol_options_pb2.DESCRIPTOR.name],
+    )
+    file.message_type.add(name="Door")
+    service = file.service.add(name="BodyAccess")
+    service.options.Extensions[uprotocol_options_pb2.name] = "body.access"
+    service.options.Extensions[uprotocol_options_pb2.version_major] = 1
+    service.method.add(name="OpenDoor", input_type=".body.access.v1.Door", output_type=".body.access.v1.Door")
+    return pool.Add(file).services_by_name["BodyAccess"]
+
+
+class RecordingRpcClient(RpcClient):
+    """
+    RpcClient answering every call with an empty message of the expected response class.
+    """
+
+    def __init__(self, response_class):
+        self.response_class = response_class
+        self.calls = []
+
+    def invoke_method(self, method_uri: UUri, request_payload: UPayload, options: CallOptions):
+        self.calls.append((method_uri, request_payload, options))
+        future = Future()
+        future.set_result(UMessage(payload=UPayloadBuilder.pack_to_any(self.response_class())))
+        return future
+
+
+class TestStubGenerator(unittest.TestCase):
+    def test_method_stubs_are_resolved_once(self):
+        methods = StubGenerator.method_stubs(build_service())
+        self.assertEqual(len(build_service().methods), len(methods))
+        method = methods["LookupUri"]
+        self.assertEqual("core.udiscovery", method.uri.entity.name)
+        self.assertEqual(3, method.uri.entity.version_major)
+        self.assertEqual("rpc", method.uri.resource.name)
+        self.assertEqual("LookupUri", method.uri.resource.instance)
+        self.assertEqual("/core.udiscovery/3/rpc.LookupUri", method.long_uri)
+        self.assertEqual(LongUriSerializer().serialize(method.uri), method.long_uri)
+        self.assertEqual(MicroUriSerializer().serialize(method.uri), method.micro_uri)
+        self.assertEqual(
+            build_service().methods_by_name["LookupUri"].output_type.full_name,
+            method.response_class.DESCRIPTOR.full_name,
+        )
+
+    def test_method_stubs_without_method_id(self):
+        method = StubGenerator.method_stubs(build_service_without_method_ids())["OpenDoor"]
+        self.assertEqual(UResource(name="rpc", instance="OpenDoor"), method.uri.resource)
+        self.assertFalse(method.uri.resource.HasField("id"))
+        self.assertEqual("/body.access/1/rpc.OpenDoor", method.long_uri)
+        self.assertEqual("body.access.v1.Door", method.request_class.DESCRIPTOR.full_name)
+
+    def test_create_stub_class(self):
+        stub_class = StubGenerator.create_stub_class(build_service())
+        self.assertTrue(issubclass(stub_class, RpcStub))
+        self.assertEqual("uDiscoveryStub", stub_class.__name__)
+        for method in build_service().methods:
+            self.assertTrue(callable(getattr(stub_class, method.name)))
+
+    def test_stub_invokes_precomputed_uri(self):
+        stub_class = StubGenerator.create_stub_class(build_service())
+        method = stub_class.METHODS["LookupUri"]
+        client = RecordingRpcClient(method.response_class)
+        stub = stub_class(client, options=CallOptions(ttl=500))
+
+        response = stub.LookupUri(method.request_class()).result(1)
+        self.assertIsInstance(response, method.response_class)
+        method_uri, payload, options = client.calls[0]
+        self.assertIs(method.uri, method_uri)
+        self.assertEqual(UPayloadBuilder.pack_to_any(method.request_class()), payload)
+        self.assertEqual(500, options.ttl)
+
+        stub.LookupUri(method.request_class(), CallOptions(ttl=100))
+        self.assertEqual(100, client.calls[1][2].ttl)
+
+    def test_stub_with_authority(self):
+        stub_class = StubGenerator.create_stub_class(build_service())
+        method = stub_class.METHODS["LookupUri"]
+        client = RecordingRpcClient(method.response_class)
+        stub = stub_class(client, UAuthority(name="vcu.vin"))
+        stub.LookupUri(method.request_class())
+        self.assertEqual("//vcu.vin/core.udiscovery/3/rpc.LookupUri", LongUriSerializer().serialize(client.calls[0][0]))
+        self.assertFalse(method.uri.HasField("authority"))
+
+    def test_generate_module(self):
+        source = StubGenerator.generate_module(build_service())
+        namespace = {}
+        exec(compile(source, "udiscovery_stub.py", "exec"), namespace)
+        stub_class = namespace["uDiscoveryStub"]
+        method = stub_class.METHODS["LookupUri"]
+        client = RecordingRpcClient(method.response_class)
+        response = stub_class(client).LookupUri(method.request_class()).result(1)
+        self.assertIsInstance(response, method.response_class)
+        self.assertIn("def LookupUri(self, request: ", source)
+        self.assertIn("import uprotocol.proto.core.udiscovery.v3.udiscovery_pb2 as ", source)
+        self.assertIn("import uprotocol.proto.uri_pb2 as ", source)
+        self.assertNotIn("import core.", source)
+
+    def test_none_service_descriptor(self):
+        with self.assertRaises(ValueError):
+            StubGenerator.method_stubs(None)
+
+    def test_none_rpc_client(self):
+        with self.assertRaises(ValueError):
+            StubGenerator.create_stub_class(build_service())(None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import unittest
+
+from google.protobuf.any_pb2 import Any
+from google.protobuf.api_pb2 import Method
+from google.protobuf.message import DecodeError
+from google.protobuf.timestamp_pb2 import Timestamp
+from google.protobuf.wrappers_pb2 import BoolValue, Int32Value, StringValue
+
+from uprotocol.transport.builder.typeregistry import TypeRegistry, split_any
+
+
+def pack(message, type_url_prefix=None):
+    any_message = Any()
+    if type_url_prefix is None:
+        any_message.Pack(message)
+    else:
+        any_message.Pack(message, type_url_prefix)
+    return any_message.SerializeToString()
+
+
+class TestTypeRegistry(unittest.TestCase):
+    def test_register_returns_interned_type_url(self):
+        registry = TypeRegistry()
+        type_url = registry.register(Int32Value)
+        self.assertEqual("type.googleapis.com/google.protobuf.Int32Value", type_url)
+        self.assertIs(type_url, registry.type_url(Int32Value))
+
+    def test_unpack_with_expected_class(self):
+        registry = TypeRegistry()
+        message = registry.unpack(pack(Int32Value(value=42)), Int32Value)
+        self.assertEqual(Int32Value(value=42), message)
+
+    def test_unpack_with_wrong_expected_class_returns_none(self):
+        registry = TypeRegistry()
+        self.assertIsNone(registry.unpack(pack(Int32Value(value=42)), BoolValue))
+
+    def test_unpack_resolves_registered_class(self):
+        registry = TypeRegistry()
+        registry.register(Method)
+        original = Method(name="name", request_type_url="request", response_type_url="response")
+        self.assertEqual(original, registry.unpack(pack(original)))
+
+    def test_unpack_resolves_unregistered_class_from_descriptor_pool(self):
+        registry = TypeRegistry()
+        message = registry.unpack(pack(Timestamp(seconds=10, nanos=5)))
+        self.assertIsInstance(message, Timestamp)
+        self.assertEqual(10, message.seconds)
+        self.assertIs(Timestamp, registry.resolve("type.googleapis.com/google.protobuf.Timestamp"))
+
+    def test_unpack_unknown_type_returns_none(self):
+        registry = TypeRegistry()
+        any_message = Any(type_url="type.googleapis.com/does.not.Exist", value=b"")
+        self.assertIsNone(registry.unpack(any_message.SerializeToString()))
+        self.assertIsNone(registry.resolve("type.googleapis.com/does.not.Exist"))
+
+    def test_unpack_custom_type_url_prefix(self):
+        registry = TypeRegistry()
+        data = pack(StringValue(value="hello"), "type.example.com")
+        self.assertEqual(StringValue(value="hello"), registry.unpack(data, StringValue))
+        self.assertEqual(StringValue(value="hello"), registry.unpack(data))
+
+    def test_unpack_large_value(self):
+        registry = TypeRegistry()
+        data = pack(StringValue(value="x" * 100000))
+        self.assertEqual(100000, len(registry.unpack(data, StringValue).value))
+
+    def test_unpack_value_before_type_url(self):
+        registry = TypeRegistry()
+        value = Int32Value(value=7).SerializeToString()
+        type_url = b"type.googleapis.com/google.protobuf.Int32Value"
+        data = b"\x12" + bytes([len(value)]) + value + b"\x0a" + bytes([len(type_url)]) + type_url
+        self.assertEqual(Int32Value(value=7), registry.unpack(data, Int32Value))
+        self.assertEqual(Int32Value(value=7), registry.unpack(data))
+
+    def test_unpack_empty_any(self):
+        registry = TypeRegistry()
+        self.assertIsNone(registry.unpack(b"", Int32Value))
+        self.assertEqual("", TypeRegistry.type_url_of(b""))
+
+    def test_unpack_garbage_raises_decode_error(self):
+        registry = TypeRegistry()
+        with self.assertRaises(DecodeError):
+            registry.unpack(bytes([0]), Int32Value)
+        with self.assertRaises(DecodeError):
+            registry.unpack(b"\x0a\x10abc", Int32Value)
+
+    def test_split_any(self):
+        data = pack(BoolValue(value=True))
+        type_url, value = split_any(data)
+        self.assertEqual(b"type.googleapis.com/google.protobuf.BoolValue", bytes(type_url))
+        self.assertEqual(BoolValue(value=True).SerializeToString(), bytes(value))
+
+    def test_type_url_of(self):
+        self.assertEqual(
+            "type.googleapis.com/google.protobuf.Int32Value", TypeRegistry.type_url_of(pack(Int32Value(value=1)))
+        )
+
+    def test_default_registry_is_shared(self):
+        self.assertIs(TypeRegistry.default(), TypeRegistry.default())
+
+
+if __name__ == "__main__":
+    unittest.main()
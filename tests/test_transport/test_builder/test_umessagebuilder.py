@@ -0,0 +1,105 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import unittest
+
+from google.protobuf.wrappers_pb2 import Int32Value
+
+from uprotocol.proto.uattributes_pb2 import CallOptions, UMessageType, UPriority
+from uprotocol.proto.ustatus_pb2 import UCode, UStatus
+from uprotocol.transport.builder.umessagebuilder import UMessageBuilder
+from uprotocol.transport.builder.upayloadbuilder import UPayloadBuilder
+from uprotocol.uri.serializer.longuriserializer import LongUriSerializer
+
+
+def build_source():
+    return LongUriSerializer().deserialize("/hartley/1/rpc.response")
+
+
+def build_method():
+    return LongUriSerializer().deserialize("/core.udiscovery/3/rpc.LookupUri")
+
+
+class TestUMessageBuilder(unittest.TestCase):
+    def test_request(self):
+        payload = UPayloadBuilder.pack_to_any(Int32Value(value=3))
+        options = CallOptions(priority=UPriority.UPRIORITY_CS5, ttl=1000, token="s3cr3t")
+        message = UMessageBuilder.request(build_source(), build_method(), options, payload)
+        self.assertEqual(UMessageType.UMESSAGE_TYPE_REQUEST, message.attributes.type)
+        self.assertEqual(build_source(), message.attributes.source)
+        self.assertEqual(build_method(), message.attributes.sink)
+        self.assertEqual(UPriority.UPRIORITY_CS5, message.attributes.priority)
+        self.assertEqual(1000, message.attributes.ttl)
+        self.assertEqual("s3cr3t", message.attributes.token)
+        self.assertEqual(payload, message.payload)
+
+    def test_request_default_priority(self):
+        message = UMessageBuilder.request(build_source(), build_method(), CallOptions(ttl=1000))
+        self.assertEqual(UPriority.UPRIORITY_CS4, message.attributes.priority)
+        self.assertFalse(message.attributes.HasField("token"))
+        self.assertFalse(message.HasField("payload"))
+
+    def test_response(self):
+        request = UMessageBuilder.request(build_source(), build_method(), CallOptions(ttl=1000))
+        payload = UPayloadBuilder.pack_to_any(Int32Value(value=3))
+        message = UMessageBuilder.response(request.attributes, payload)
+        self.assertEqual(UMessageType.UMESSAGE_TYPE_RESPONSE, message.attributes.type)
+        self.assertEqual(request.attributes.id, message.attributes.reqid)
+        self.assertEqual(build_method(), message.attributes.source)
+        self.assertEqual(build_source(), message.attributes.sink)
+        self.assertEqual(payload, message.payload)
+
+    def test_failed_response(self):
+        request = UMessageBuilder.request(build_source(), build_method(), CallOptions(ttl=1000))
+        message = UMessageBuilder.failed_response(request.attributes, UCode.INTERNAL, "Boom")
+        self.assertEqual(UCode.INTERNAL, message.attributes.commstatus)
+        self.assertEqual(request.attributes.id, message.attributes.reqid)
+        self.assertEqual(UStatus(code=UCode.INTERNAL, message="Boom"), UPayloadBuilder.unpack(message.payload, UStatus))
+
+    def test_end_of_stream(self):
+        request = UMessageBuilder.request(build_source(), build_method(), CallOptions(ttl=1000))
+        message = UMessageBuilder.end_of_stream(request.attributes)
+        self.assertEqual(UMessageType.UMESSAGE_TYPE_RESPONSE, message.attributes.type)
+        self.assertTrue(message.attributes.HasField("commstatus"))
+        self.assertEqual(UCode.OK, message.attributes.commstatus)
+        self.assertEqual(request.attributes.id, message.attributes.reqid)
+
+    def test_cancel(self):
+        request = UMessageBuilder.request(build_source(), build_method(), CallOptions(ttl=1000))
+        message = UMessageBuilder.cancel(request.attributes)
+        self.assertEqual(UMessageType.UMESSAGE_TYPE_NOTIFICATION, message.attributes.type)
+        self.assertEqual(build_source(), message.attributes.source)
+        self.assertEqual(build_method(), message.attributes.sink)
+        self.assertEqual(UCode.CANCELLED, message.attributes.commstatus)
+        self.assertEqual(request.attributes.id, message.attributes.reqid)
+
+    def test_status(self):
+        request = UMessageBuilder.request(build_source(), build_method(), CallOptions(ttl=1000))
+        message = UMessageBuilder.status(UCode.DEADLINE_EXCEEDED, "Timeout", request.attributes.id)
+        self.assertEqual(UMessageType.UMESSAGE_TYPE_RESPONSE, message.attributes.type)
+        self.assertEqual(UCode.DEADLINE_EXCEEDED, message.attributes.commstatus)
+        self.assertEqual(request.attributes.id, message.attributes.reqid)
+        self.assertEqual(UCode.DEADLINE_EXCEEDED, UPayloadBuilder.unpack(message.payload, UStatus).code)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -232,6 +232,25 @@ class TestUPayloadBuilder(unittest.TestCase):
 
         self.assertEqual(original_msg, unpacked_msg)
 
+    def test_unpack_given_any_wrapped_upayload_without_class_returns_method(self):
+        builder = self._create_upayload_builder()
+
+        original_msg: Message = Method(name="name", request_type_url="request_type_url")
+        upayload: UPayload = builder.pack_to_any(original_msg)
+
+        unpacked_msg: Method = builder.unpack(upayload)
+
+        self.assertEqual(original_msg, unpacked_msg)
+
+    def test_unpack_given_any_wrapped_upayload_of_another_type_returns_empty_message(self):
+        builder = self._create_upayload_builder()
+
+        upayload: UPayload = builder.pack_to_any(BoolValue(value=True))
+
+        unpacked_msg: Method = builder.unpack(upayload, Method)
+
+        self.assertEqual(Method(), unpacked_msg)
+
     def test_unpack_given_wrong_format_returns_none(self):
         builder = self._create_upayload_builder()
 
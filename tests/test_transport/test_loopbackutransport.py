@@ -0,0 +1,111 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from uprotocol.proto.uattributes_pb2 import UPriority
+from uprotocol.proto.umessage_pb2 import UMessage
+from uprotocol.proto.ustatus_pb2 import UCode
+from uprotocol.transport.builder.uattributesbuilder import UAttributesBuilder
+from uprotocol.transport.loopbackutransport import LoopbackUTransport
+from uprotocol.transport.ulistener import UListener
+from uprotocol.uri.serializer.longuriserializer import LongUriSerializer
+
+
+def build_topic():
+    return LongUriSerializer().deserialize("/body.access/1/door.front_left#Door")
+
+
+def build_sink():
+    return LongUriSerializer().deserialize("/core.usubscription/3/rpc.response")
+
+
+class RecordingListener(UListener):
+    def __init__(self):
+        self.received = []
+
+    def on_receive(self, umsg: UMessage) -> None:
+        self.received.append(umsg)
+
+
+class TestLoopbackUTransport(unittest.TestCase):
+    def test_publish_is_delivered_to_the_topic_listeners(self):
+        transport = LoopbackUTransport()
+        listener = RecordingListener()
+        self.assertEqual(UCode.OK, transport.register_listener(build_topic(), listener).code)
+        message = UMessage(attributes=UAttributesBuilder.publish(build_topic(), UPriority.UPRIORITY_CS1).build())
+        self.assertEqual(UCode.OK, transport.send(message).code)
+        self.assertEqual([message], listener.received)
+
+    def test_publish_without_listener_is_ok(self):
+        transport = LoopbackUTransport()
+        message = UMessage(attributes=UAttributesBuilder.publish(build_topic(), UPriority.UPRIORITY_CS1).build())
+        self.assertEqual(UCode.OK, transport.send(message).code)
+
+    def test_notification_is_delivered_to_the_sink_listeners(self):
+        transport = LoopbackUTransport()
+        topic_listener = RecordingListener()
+        sink_listener = RecordingListener()
+        transport.register_listener(build_topic(), topic_listener)
+        transport.register_listener(build_sink(), sink_listener)
+        attributes = UAttributesBuilder.notification(build_topic(), build_sink(), UPriority.UPRIORITY_CS1).build()
+        self.assertEqual(UCode.OK, transport.send(UMessage(attributes=attributes)).code)
+        self.assertEqual([], topic_listener.received)
+        self.assertEqual(1, len(sink_listener.received))
+
+    def test_send_to_sink_without_listener(self):
+        transport = LoopbackUTransport()
+        attributes = UAttributesBuilder.notification(build_topic(), build_sink(), UPriority.UPRIORITY_CS1).build()
+        self.assertEqual(UCode.NOT_FOUND, transport.send(UMessage(attributes=attributes)).code)
+
+    def test_send_none(self):
+        self.assertEqual(UCode.INVALID_ARGUMENT, LoopbackUTransport().send(None).code)
+
+    def test_register_twice(self):
+        transport = LoopbackUTransport()
+        listener = RecordingListener()
+        transport.register_listener(build_topic(), listener)
+        self.assertEqual(UCode.ALREADY_EXISTS, transport.register_listener(build_topic(), listener).code)
+
+    def test_unregister(self):
+        transport = LoopbackUTransport()
+        listener = RecordingListener()
+        transport.register_listener(build_topic(), listener)
+        self.assertEqual(UCode.OK, transport.unregister_listener(build_topic(), listener).code)
+        self.assertEqual(UCode.NOT_FOUND, transport.unregister_listener(build_topic(), listener).code)
+        message = UMessage(attributes=UAttributesBuilder.publish(build_topic(), UPriority.UPRIORITY_CS1).build())
+        transport.send(message)
+        self.assertEqual([], listener.received)
+
+    def test_delivery_on_executor(self):
+        listener = RecordingListener()
+        with ThreadPoolExecutor(1) as executor:
+            transport = LoopbackUTransport(executor)
+            transport.register_listener(build_topic(), listener)
+            attributes = UAttributesBuilder.publish(build_topic(), UPriority.UPRIORITY_CS1).build()
+            transport.send(UMessage(attributes=attributes))
+        self.assertEqual(1, len(listener.received))
+
+
+if __name__ == "__main__":
+    unittest.main()
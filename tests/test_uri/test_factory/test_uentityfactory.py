@@ -99,6 +99,15 @@ class TestUEntityFactory(unittest.TestCase):
         self.assertEqual(default_version_minor, actual_uentity.version_minor)
         self.assertEqual(default_id, actual_uentity.id)
 
+    def test_from_proto_returns_a_copy(self):
+        service_descriptor: ServiceDescriptor = U_TWIN_FILE_DESCRIPTOR.services_by_name["uTwin"]
+        actual_uentity: UEntity = UEntityFactory.from_proto(service_descriptor)
+        self.assertEqual(actual_uentity, UEntityFactory.from_proto(service_descriptor))
+        self.assertIsNot(actual_uentity, UEntityFactory.from_proto(service_descriptor))
+
+        actual_uentity.name = "modified"
+        self.assertEqual("core.utwin", UEntityFactory.from_proto(service_descriptor).name)
+
     def test_from_proto_given_none_return_empty_uentity(self):
         empty_service_name: str = ""
         empty_version_major: str = 0
@@ -22,7 +22,11 @@ SPDX-License-Identifier: Apache-2.0
 
 import unittest
 
+from uprotocol.proto.core.udiscovery.v3.udiscovery_pb2 import (
+    DESCRIPTOR as U_DISCOVERY_FILE_DESCRIPTOR,
+)
 from uprotocol.proto.uprotocol_options_pb2 import UServiceTopic
+from uprotocol.proto.uri_pb2 import UResource
 from uprotocol.uri.factory.uresourcebuilder import UResourceBuilder
 
 
@@ -54,6 +58,19 @@ class TestUResourceBuilder(unittest.TestCase):
         self.assertEqual(resource.instance, "")
         self.assertEqual(resource.id, 0x8000)
 
+    def test_for_rpc_request(self):
+        self.assertEqual(UResource(name="rpc", instance="Raise", id=5), UResourceBuilder.for_rpc_request("Raise", 5))
+        self.assertEqual(UResource(name="rpc", id=5), UResourceBuilder.for_rpc_request(5))
+        self.assertEqual(UResource(name="rpc", instance="Raise"), UResourceBuilder.for_rpc_request("Raise"))
+        self.assertEqual(UResource(name="rpc", instance="Raise"), UResourceBuilder.for_rpc_request("Raise", None))
+        self.assertEqual(UResource(name="rpc"), UResourceBuilder.for_rpc_request(None))
+        self.assertEqual(UResource(name="rpc", id=5), UResourceBuilder.for_rpc_request(None, 5))
+
+    def test_from_id_returns_new_resources(self):
+        resource = UResourceBuilder.from_id(5)
+        resource.instance = "Raise"
+        self.assertEqual(UResource(name="rpc", id=5), UResourceBuilder.from_id(5))
+
     def test_from_uservice_topic_valid_service_topic(self):
         topic = UServiceTopic(name="SubscriptionChange", id=0, message="Update")
         resource = UResourceBuilder.from_uservice_topic(topic)
@@ -76,6 +93,22 @@ class TestUResourceBuilder(unittest.TestCase):
             UResourceBuilder.from_uservice_topic(topic)
         self.assertEqual(str(context.exception), "topic cannot be None.")
 
+    def test_from_uservice_topic_with_backslash_separator(self):
+        topic = UServiceTopic(name="door\\front_left", id=0x8000, message="Door")
+        resource = UResourceBuilder.from_uservice_topic(topic)
+        self.assertEqual(resource.name, "door")
+        self.assertEqual(resource.instance, "front_left")
+
+    def test_from_rpc_method(self):
+        method = U_DISCOVERY_FILE_DESCRIPTOR.services_by_name["uDiscovery"].methods_by_name["LookupUri"]
+        resource = UResourceBuilder.from_rpc_method(method)
+        self.assertEqual("rpc", resource.name)
+        self.assertEqual("LookupUri", resource.instance)
+
+    def test_from_rpc_method_none(self):
+        with self.assertRaises(ValueError):
+            UResourceBuilder.from_rpc_method(None)
+
 
 if __name__ == "__main__":
     unittest.main()
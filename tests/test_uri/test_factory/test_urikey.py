@@ -0,0 +1,74 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import unittest
+
+from uprotocol.proto.uri_pb2 import UAuthority, UEntity, UUri
+from uprotocol.uri.factory.uresourcebuilder import UResourceBuilder
+from uprotocol.uri.factory.urikey import UriKey
+from uprotocol.uri.serializer.longuriserializer import LongUriSerializer
+from uprotocol.uri.serializer.microuriserializer import MicroUriSerializer
+
+
+def build_uri():
+    return UUri(
+        authority=UAuthority(ip=bytes([192, 168, 1, 100])),
+        entity=UEntity(name="body.access", id=29999, version_major=1),
+        resource=UResourceBuilder.for_rpc_request("OpenDoor", 5),
+    )
+
+
+class TestUriKey(unittest.TestCase):
+    def test_equal_uris_have_equal_keys(self):
+        key = UriKey.from_uri(build_uri())
+        self.assertEqual(key, UriKey.from_uri(build_uri()))
+        self.assertEqual(hash(key), hash(UriKey.from_uri(build_uri())))
+        self.assertEqual("value", {key: "value"}[UriKey.from_uri(build_uri())])
+        other = build_uri()
+        other.resource.id = 6
+        self.assertNotEqual(key, UriKey.from_uri(other))
+
+    def test_to_uri(self):
+        uri = LongUriSerializer().deserialize("//vcu.vin/body.access/1/door.front_left#Door")
+        key = UriKey.from_uri(uri)
+        self.assertEqual(uri, key.to_uri())
+        self.assertIsNot(key.to_uri(), key.to_uri())
+
+    def test_micro(self):
+        micro_uri = MicroUriSerializer().serialize(build_uri())
+        key = UriKey.from_micro(micro_uri)
+        self.assertEqual(MicroUriSerializer().deserialize(micro_uri), key.to_uri())
+        self.assertEqual(bytes(micro_uri), key.to_micro())
+        self.assertEqual(b"", UriKey.from_uri(LongUriSerializer().deserialize("/body.access/1")).to_micro())
+
+    def test_empty(self):
+        self.assertEqual(UriKey.from_uri(UUri()), UriKey.from_uri(None))
+        self.assertEqual(UriKey.from_uri(UUri()), UriKey.from_micro(b"\x00"))
+        self.assertEqual(UUri(), UriKey.from_uri(None).to_uri())
+
+    def test_repr(self):
+        key = UriKey.from_uri(LongUriSerializer().deserialize("/body.access/1/door.front_left#Door"))
+        self.assertEqual("UriKey('/body.access/1/door.front_left#Door')", repr(key))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import unittest
+
+from uprotocol.proto.uri_pb2 import UAuthority, UEntity, UUri
+from uprotocol.uri.factory.urikey import UriKey
+from uprotocol.uri.factory.uripool import UriPool
+from uprotocol.uri.serializer.longuriserializer import LongUriSerializer
+
+
+def build_uri():
+    return LongUriSerializer().deserialize("//vcu.vin/body.access/1/door.front_left#Door")
+
+
+class TestUriPool(unittest.TestCase):
+    def test_intern_returns_canonical_instance(self):
+        pool = UriPool()
+        uri = pool.intern(build_uri())
+        self.assertIs(uri, pool.intern(build_uri()))
+        entity = pool.intern(UEntity(name="body.access", version_major=1))
+        self.assertIs(entity, pool.intern(UEntity(name="body.access", version_major=1)))
+        authority = pool.intern(UAuthority(name="vcu.vin"))
+        self.assertIs(authority, pool.intern(UAuthority(name="vcu.vin")))
+        self.assertIsNot(entity, pool.intern(UEntity(name="body.access", version_major=2)))
+        self.assertEqual(4, len(pool))
+
+    def test_types_are_interned_separately(self):
+        pool = UriPool()
+        self.assertIsInstance(pool.intern(UUri()), UUri)
+        self.assertIsInstance(pool.intern(UEntity()), UEntity)
+        self.assertIsInstance(pool.intern(UAuthority()), UAuthority)
+        self.assertEqual(3, len(pool))
+
+    def test_intern_invalid(self):
+        pool = UriPool()
+        with self.assertRaises(ValueError):
+            pool.intern(None)
+        with self.assertRaises(ValueError):
+            pool.intern(build_uri().resource)
+        with self.assertRaises(ValueError):
+            pool.intern(UriKey.from_uri(build_uri()))
+
+    def test_intern_key(self):
+        pool = UriPool()
+        key = pool.intern_key(build_uri())
+        self.assertEqual(UriKey.from_uri(build_uri()), key)
+        self.assertIs(key, pool.intern_key(build_uri()))
+        self.assertIs(key, pool.intern_key(UriKey.from_uri(build_uri())))
+        self.assertIs(pool.intern_key(None), pool.intern_key(UUri()))
+
+    def test_release(self):
+        pool = UriPool()
+        uri = pool.intern(build_uri())
+        self.assertIs(uri, pool.intern(build_uri()))
+        pool.intern(UEntity(name="body.access"))
+        self.assertTrue(pool.release(UEntity(name="body.access")))
+        self.assertFalse(pool.release(build_uri()))
+        self.assertIs(uri, pool.intern(build_uri()))
+        self.assertFalse(pool.release(uri))
+        self.assertTrue(pool.release(uri))
+        self.assertEqual(0, len(pool))
+        self.assertIsNot(uri, pool.intern(build_uri()))
+
+    def test_release_key(self):
+        pool = UriPool()
+        key = pool.intern_key(build_uri())
+        pool.intern_key(UriKey.from_uri(build_uri()))
+        self.assertFalse(pool.release_key(build_uri()))
+        self.assertTrue(pool.release_key(key))
+        self.assertEqual(0, len(pool))
+
+    def test_release_not_interned(self):
+        pool = UriPool()
+        with self.assertRaises(ValueError):
+            pool.release(build_uri())
+        with self.assertRaises(ValueError):
+            pool.release_key(build_uri())
+        with self.assertRaises(ValueError):
+            pool.release(None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import unittest
+
+from google.protobuf import descriptor_pb2, descriptor_pool
+
+from uprotocol.proto import uprotocol_options_pb2
+from uprotocol.proto.uri_pb2 import UAuthority, UEntity, UResource, UUri
+from uprotocol.uri.resolver.uriresolver import UriResolver
+from uprotocol.uri.serializer.longuriserializer import LongUriSerializer
+from uprotocol.uri.serializer.microuriserializer import MicroUriSerializer
+from uprotocol.uri.validator.urivalidator import UriValidator
+
+
+def build_file(version_major: int = 1):
+    """
+    Build a proto file declaring a body.access service with uProtocol options.
+    """
+    pool = descriptor_pool.DescriptorPool()
+    for dependency in (descriptor_pb2.DESCRIPTOR, uprotocol_options_pb2.DESCRIPTOR):
+        file = descriptor_pb2.FileDescriptorProto()
+        dependency.CopyToProto(file)
+        pool.Add(file)
+
+    file = descriptor_pb2.FileDescriptorProto(
+        name=f"body_access_v{version_major}.proto",
+        package=f"body.access.v{version_major}",
+        syntax="proto3",
+        dependency=[uprotocol_options_pb2.DESCRIPTOR.name],
+    )
+    file.message_type.add(name="Door")
+    service = file.service.add(name="BodyAccess")
+    options = service.options.Extensions
+    options[uprotocol_options_pb2.name] = "body.access"
+    options[uprotocol_options_pb2.version_major] = version_major
+    options[uprotocol_options_pb2.id] = 1234
+    options[uprotocol_options_pb2.publish_topic].add(id=0x8000, name="door.front_left", message="Door")
+    options[uprotocol_options_pb2.notification_topic].add(id=0x8001, name="door.rear_left", message="Door")
+    door = f".body.access.v{version_major}.Door"
+    method = service.method.add(name="OpenDoor", input_type=door, output_type=door)
+    if hasattr(uprotocol_options_pb2, "method_id"):
+        method.options.Extensions[uprotocol_options_pb2.method_id] = 5
+    # A method without method_id option
+    service.method.add(name="CloseDoor", input_type=door, output_type=door)
+    return pool.Add(file)
+
+
+def build_resolver():
+    resolver = UriResolver()
+    resolver.register_file(build_file())
+    return resolver
+
+
+class TestUriResolver(unittest.TestCase):
+    def test_register_file(self):
+        entities = UriResolver().register_file(build_file())
+        self.assertEqual([UEntity(name="body.access", version_major=1, version_minor=0, id=1234)], entities)
+
+    def test_resolve_long_form_topic(self):
+        uri = LongUriSerializer().deserialize("/body.access/1/door.front_left#Door")
+        resolved = build_resolver().resolve(uri)
+        self.assertTrue(UriValidator.is_resolved(resolved))
+        self.assertEqual(1234, resolved.entity.id)
+        self.assertEqual(0x8000, resolved.resource.id)
+        self.assertFalse(uri.entity.HasField("id"))
+
+        remote = build_resolver().resolve(LongUriSerializer().deserialize("//vcu.vin/body.access/1/door.front_left"))
+        self.assertEqual(UAuthority(name="vcu.vin"), remote.authority)
+        self.assertEqual(0x8000, remote.resource.id)
+
+    def test_resolve_micro_form_topic(self):
+        micro_uri = MicroUriSerializer().serialize(
+            UUri(entity=UEntity(id=1234, version_major=1), resource=UResource(id=0x8001))
+        )
+        resolved = build_resolver().resolve(MicroUriSerializer().deserialize(micro_uri))
+        self.assertTrue(UriValidator.is_resolved(resolved))
+        self.assertEqual("/body.access/1/door.rear_left#Door", LongUriSerializer().serialize(resolved))
+
+    def test_resolve_rpc_uris(self):
+        resolver = build_resolver()
+        response = resolver.resolve(LongUriSerializer().deserialize("/body.access/1/rpc.response"))
+        self.assertTrue(UriValidator.is_resolved(response))
+        self.assertEqual(0, response.resource.id)
+
+        if hasattr(uprotocol_options_pb2, "method_id"):
+            method = resolver.resolve(LongUriSerializer().deserialize("/body.access/1/rpc.OpenDoor"))
+            self.assertTrue(UriValidator.is_resolved(method))
+            self.assertEqual(5, method.resource.id)
+            from_micro = resolver.resolve(MicroUriSerializer().deserialize(MicroUriSerializer().serialize(method)))
+            self.assertEqual("OpenDoor", from_micro.resource.instance)
+
+    def test_resolve_rpc_method_without_method_id(self):
+        uri = LongUriSerializer().deserialize("/body.access/1/rpc.CloseDoor")
+        resolved = build_resolver().resolve(uri)
+        self.assertEqual(1234, resolved.entity.id)
+        self.assertEqual(UResource(name="rpc", instance="CloseDoor"), resolved.resource)
+        self.assertFalse(resolved.resource.HasField("id"))
+        self.assertFalse(UriValidator.is_resolved(resolved))
+
+    def test_resolve_version(self):
+        resolver = build_resolver()
+        resolver.register_file(build_file(2))
+        latest = resolver.resolve(LongUriSerializer().deserialize("/body.access//door.front_left"))
+        self.assertEqual(2, latest.entity.version_major)
+        self.assertEqual(1234, latest.entity.id)
+        self.assertEqual(1, resolver.resolve(LongUriSerializer().deserialize("/body.access/1")).entity.version_major)
+        unknown = LongUriSerializer().deserialize("/body.access/3/door.front_left")
+        self.assertEqual(unknown, resolver.resolve(unknown))
+
+    def test_resolve_unknown(self):
+        resolver = build_resolver()
+        unknown_entity = LongUriSerializer().deserialize("/hartley/1/door.front_left")
+        self.assertEqual(unknown_entity, resolver.resolve(unknown_entity))
+        unknown_resource = resolver.resolve(LongUriSerializer().deserialize("/body.access/1/window.front_left"))
+        self.assertEqual(1234, unknown_resource.entity.id)
+        self.assertFalse(unknown_resource.resource.HasField("id"))
+        self.assertFalse(UriValidator.is_resolved(unknown_resource))
+
+    def test_none(self):
+        with self.assertRaises(ValueError):
+            UriResolver().register_service(None)
+        with self.assertRaises(ValueError):
+            UriResolver().register_file(None)
+        with self.assertRaises(ValueError):
+            UriResolver().resolve(None)
+
+
+if __name__ == "__main__":
+    unittest.main()
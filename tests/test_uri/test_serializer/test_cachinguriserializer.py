@@ -0,0 +1,115 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import threading
+import unittest
+
+from uprotocol.proto.uri_pb2 import UAuthority, UEntity, UUri
+from uprotocol.uri.factory.uresourcebuilder import UResourceBuilder
+from uprotocol.uri.serializer.cachinguriserializer import CachingUriSerializer
+from uprotocol.uri.serializer.longuriserializer import LongUriSerializer
+from uprotocol.uri.serializer.microuriserializer import MicroUriSerializer
+from uprotocol.uri.serializer.shorturiserializer import ShortUriSerializer
+
+
+def build_uri():
+    return UUri(
+        authority=UAuthority(name="vcu.vin", ip=bytes([192, 168, 1, 100])),
+        entity=UEntity(name="body.access", id=29999, version_major=1),
+        resource=UResourceBuilder.for_rpc_request("UpdateDoor", 10),
+    )
+
+
+class TestCachingUriSerializer(unittest.TestCase):
+    def test_matches_delegates(self):
+        uri = build_uri()
+        for delegate in (LongUriSerializer(), ShortUriSerializer(), MicroUriSerializer()):
+            serializer = CachingUriSerializer(delegate)
+            for _ in range(2):
+                serialized = serializer.serialize(uri)
+                self.assertEqual(delegate.serialize(uri), serialized)
+                self.assertEqual(delegate.deserialize(serialized), serializer.deserialize(serialized))
+            self.assertEqual(2, serializer.stats().hits)
+            self.assertEqual(2, serializer.stats().misses)
+
+    def test_deserialize_hit_returns_a_copy(self):
+        serializer = CachingUriSerializer(LongUriSerializer())
+        first = serializer.deserialize("/body.access/1/door.front_left#Door")
+        first.entity.name = "modified"
+        second = serializer.deserialize("/body.access/1/door.front_left#Door")
+        self.assertEqual("body.access", second.entity.name)
+        self.assertIsNot(first, second)
+
+    def test_evicts_least_recently_used(self):
+        serializer = CachingUriSerializer(LongUriSerializer(), max_entries=2)
+        serializer.deserialize("/a/1/rpc.A")
+        serializer.deserialize("/b/1/rpc.B")
+        serializer.deserialize("/a/1/rpc.A")
+        serializer.deserialize("/c/1/rpc.C")
+        serializer.deserialize("/a/1/rpc.A")
+        serializer.deserialize("/b/1/rpc.B")
+        stats = serializer.stats()
+        self.assertEqual(2, stats.hits)
+        self.assertEqual(4, stats.misses)
+        self.assertEqual(2, stats.evictions)
+        self.assertEqual(2, stats.entries)
+        self.assertAlmostEqual(1 / 3, stats.hit_rate())
+
+    def test_micro_uri_hit_returns_a_copy(self):
+        serializer = CachingUriSerializer(MicroUriSerializer())
+        first = serializer.serialize(build_uri())
+        first[0] = 0xFF
+        self.assertEqual(MicroUriSerializer().serialize(build_uri()), serializer.serialize(build_uri()))
+
+    def test_null(self):
+        serializer = CachingUriSerializer(LongUriSerializer())
+        self.assertEqual("", serializer.serialize(None))
+        self.assertEqual(UUri(), serializer.deserialize(None))
+        self.assertEqual(0, serializer.stats().hits + serializer.stats().misses)
+
+    def test_concurrent_access(self):
+        serializer = CachingUriSerializer(LongUriSerializer(), max_entries=8)
+        errors = []
+
+        def work(index):
+            for i in range(200):
+                uri = f"/service{(index + i) % 16}/1/rpc.Method"
+                if LongUriSerializer().serialize(serializer.deserialize(uri)) != uri:
+                    errors.append(uri)
+
+        threads = [threading.Thread(target=work, args=(index,)) for index in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([], errors)
+        self.assertLessEqual(serializer.stats().entries, 8)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            CachingUriSerializer(None)
+        with self.assertRaises(ValueError):
+            CachingUriSerializer(LongUriSerializer(), max_entries=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
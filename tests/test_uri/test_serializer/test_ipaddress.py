@@ -146,6 +146,24 @@ class TestIpAddress(unittest.TestCase):
     def test_is_valid_with_invalid_ipv6_address_that_has_only_7_groups(self):
         self.assertFalse(IpAddress.is_valid("dead:beef:85a3:0:0:8a2e:370"))
 
+    def test_pack(self):
+        self.assertEqual(bytes([192, 168, 1, 100]), IpAddress.pack("192.168.1.100"))
+        self.assertEqual(16, len(IpAddress.pack("2001:db8:85a3::8a2e:370:7334")))
+        self.assertIsNone(IpAddress.pack("vcu.my_car_vin"))
+        self.assertIsNone(IpAddress.pack("192.168.1.256"))
+        self.assertIsNone(IpAddress.pack("2001:db8:85a3:0:0:8a2e:370:7334:1234"))
+        self.assertIsNone(IpAddress.pack(""))
+        self.assertIsNone(IpAddress.pack(None))
+
+    def test_unpack(self):
+        self.assertEqual("192.168.1.100", IpAddress.unpack(bytes([192, 168, 1, 100])))
+        ipv6 = "2001:db8:85a3::8a2e:370:7334"
+        self.assertEqual(ipv6, IpAddress.unpack(IpAddress.pack(ipv6)))
+        self.assertEqual("192.168.1.100", IpAddress.unpack(bytearray([192, 168, 1, 100])))
+        self.assertIsNone(IpAddress.unpack(b"12345"))
+        self.assertIsNone(IpAddress.unpack(b""))
+        self.assertIsNone(IpAddress.unpack(None))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -787,6 +787,12 @@ class TestLongUriSerializer(unittest.TestCase):
         ucustom_uri = LongUriSerializer().serialize(UUri(authority=u_authority, entity=use, resource=resource))
         self.assertEqual("/body.access/1/door.front_left#Door", ucustom_uri)
 
+    def test_parse_protocol_uri_with_resource_without_name(self):
+        with self.assertRaises(ValueError):
+            LongUriSerializer().deserialize("/body.access/1/#Door")
+        with self.assertRaises(ValueError):
+            LongUriSerializer().deserialize("/body.access/1/..#Door")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,101 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import importlib.util
+import socket
+import unittest
+
+from uprotocol.proto.uri_pb2 import UAuthority, UEntity, UUri
+from uprotocol.uri.factory.uresourcebuilder import UResourceBuilder
+from uprotocol.uri.serializer.microuriarray import MicroUriArray
+from uprotocol.uri.serializer.microuriserializer import MicroUriSerializer
+
+
+def build_uris():
+    return [
+        UUri(entity=UEntity(id=29999, version_major=254), resource=UResourceBuilder.for_rpc_response()),
+        UUri(entity=UEntity(id=1, version_major=1), resource=UResourceBuilder.from_id(5)),
+        UUri(entity=UEntity(id=0xFFFF, version_major=3), resource=UResourceBuilder.from_id(0x8001)),
+    ]
+
+
+@unittest.skipUnless(importlib.util.find_spec("numpy"), "NumPy is not installed")
+class TestMicroUriArray(unittest.TestCase):
+    def test_decode(self):
+        buffer = MicroUriSerializer().serialize_many(build_uris())
+        array = MicroUriArray.decode(buffer)
+        self.assertEqual(3, len(array))
+        self.assertEqual([29999, 1, 0xFFFF], array["ue_id"].tolist())
+        self.assertEqual([254, 1, 3], array["ue_version"].tolist())
+        self.assertEqual([0, 5, 0x8001], array["resource_id"].tolist())
+        self.assertEqual([0, 0, 0], array["address_type"].tolist())
+        self.assertEqual(0, len(MicroUriArray.decode(b"")))
+
+    def test_encode(self):
+        buffer = MicroUriSerializer().serialize_many(build_uris())
+        self.assertEqual(buffer, MicroUriArray.encode(MicroUriArray.decode(bytes(buffer))))
+
+        array = MicroUriArray.decode(buffer)
+        array["ue_version"] = 7
+        uris = MicroUriSerializer().deserialize_many(MicroUriArray.encode(array))
+        self.assertEqual([7, 7, 7], [uri.entity.version_major for uri in uris])
+
+    def test_encode_new_array(self):
+        import numpy
+
+        array = numpy.zeros(2, dtype=MicroUriArray.dtype())
+        array["ue_id"] = [10, 20]
+        array["resource_id"] = [0x8000, 1]
+        uris = MicroUriSerializer().deserialize_many(MicroUriArray.encode(array))
+        self.assertEqual([10, 20], [uri.entity.id for uri in uris])
+        self.assertEqual(UResourceBuilder.from_id(1), uris[1].resource)
+
+    def test_predicates(self):
+        array = MicroUriArray.decode(MicroUriSerializer().serialize_many(build_uris()))
+        self.assertEqual([True, True, False], MicroUriArray.is_rpc_method(array).tolist())
+        self.assertEqual([True, False, False], MicroUriArray.is_rpc_response(array).tolist())
+
+    def test_decode_invalid_buffer(self):
+        buffer = MicroUriSerializer().serialize_many(build_uris())
+        with self.assertRaises(ValueError):
+            MicroUriArray.decode(buffer[:-1])
+        buffer[9] = 1
+        with self.assertRaises(ValueError):
+            MicroUriArray.decode(buffer)
+
+        remote = UUri(
+            authority=UAuthority(ip=socket.inet_pton(socket.AF_INET, "192.168.1.100")),
+            entity=UEntity(id=1, version_major=1),
+            resource=UResourceBuilder.from_id(5),
+        )
+        with self.assertRaises(ValueError):
+            MicroUriArray.decode(MicroUriSerializer().serialize(remote) + bytearray(4))
+
+    def test_encode_remote_address_type(self):
+        array = MicroUriArray.decode(MicroUriSerializer().serialize_many(build_uris()))
+        array["address_type"][1] = 1
+        with self.assertRaises(ValueError):
+            MicroUriArray.encode(array)
+
+
+if __name__ == "__main__":
+    unittest.main()
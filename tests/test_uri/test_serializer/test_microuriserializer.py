@@ -107,6 +107,10 @@ class TestMicroUriSerializer(unittest.TestCase):
         uuri = MicroUriSerializer().deserialize(bad_micro_uuri)
         self.assertTrue(UriValidator.is_empty(uuri))
 
+        bad_micro_uuri = bytes([0x1, 0x3, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x4, 0x0])
+        uuri = MicroUriSerializer().deserialize(bad_micro_uuri)
+        self.assertTrue(UriValidator.is_empty(uuri))
+
     def test_serialize_good_ipv4_based_authority(self):
         uri = UUri(
             authority=UAuthority(ip=socket.inet_pton(socket.AF_INET, "10.0.3.3")),
@@ -224,6 +228,106 @@ class TestMicroUriSerializer(unittest.TestCase):
         bytes_uuri = MicroUriSerializer().serialize(uri)
         self.assertEqual(len(bytes_uuri), 0)
 
+    def test_serialize_into_and_deserialize_from_offset(self):
+        uri = UUri(
+            authority=UAuthority(ip=socket.inet_pton(socket.AF_INET, "192.168.1.100")),
+            entity=UEntity(id=29999, version_major=254),
+            resource=UResourceBuilder.from_id(19999),
+        )
+        buffer = bytearray(20)
+        size = MicroUriSerializer().serialize_into(uri, buffer, 4)
+        self.assertEqual(MicroUriSerializer.IPV4_MICRO_URI_LENGTH, size)
+        self.assertEqual(MicroUriSerializer().serialize(uri), buffer[4 : 4 + size])
+        self.assertEqual((uri, size), MicroUriSerializer().deserialize_from(buffer, 4))
+        self.assertEqual((UUri(), 0), MicroUriSerializer().deserialize_from(buffer, 0))
+        self.assertEqual(0, MicroUriSerializer().serialize_into(UUri(), buffer, 4))
+        with self.assertRaises(ValueError):
+            MicroUriSerializer().serialize_into(uri, buffer, 10)
+
+    def test_serialize_many_and_deserialize_many(self):
+        uris = [
+            UUri(entity=UEntity(id=29999, version_major=254), resource=UResourceBuilder.for_rpc_response()),
+            UUri(
+                authority=UAuthority(ip=socket.inet_pton(socket.AF_INET6, "2001:db8::1")),
+                entity=UEntity(id=1, version_major=1),
+                resource=UResourceBuilder.from_id(5),
+            ),
+            UUri(
+                authority=UAuthority(id=b"vcu.vin"),
+                entity=UEntity(id=2, version_major=3),
+                resource=UResourceBuilder.from_id(0x8001),
+            ),
+        ]
+        buffer = MicroUriSerializer().serialize_many(uris)
+        self.assertEqual(b"".join(MicroUriSerializer().serialize(uri) for uri in uris), buffer)
+        self.assertEqual(uris, MicroUriSerializer().deserialize_many(buffer))
+        self.assertEqual(uris, MicroUriSerializer().deserialize_many(memoryview(bytes(buffer))))
+        self.assertEqual([], MicroUriSerializer().deserialize_many(b""))
+
+    def test_serialize_many_and_deserialize_many_invalid(self):
+        uri = UUri(entity=UEntity(id=29999, version_major=254), resource=UResourceBuilder.from_id(19999))
+        with self.assertRaises(ValueError):
+            MicroUriSerializer().serialize_many([uri, UUri(entity=UEntity(name="hartley"))])
+        buffer = MicroUriSerializer().serialize_many([uri, uri])
+        with self.assertRaises(ValueError):
+            MicroUriSerializer().deserialize_many(buffer[:-1])
+
+    def test_iter_deserialize_and_iter_fields(self):
+        uris = [
+            UUri(
+                authority=UAuthority(id=b"vcu.vin"),
+                entity=UEntity(id=2, version_major=3),
+                resource=UResourceBuilder.from_id(0x8001),
+            ),
+            UUri(
+                authority=UAuthority(ip=socket.inet_pton(socket.AF_INET, "192.168.1.100")),
+                entity=UEntity(id=29999, version_major=1),
+                resource=UResourceBuilder.from_id(5),
+            ),
+            UUri(entity=UEntity(id=29999, version_major=254), resource=UResourceBuilder.for_rpc_response()),
+        ]
+        buffer = MicroUriSerializer().serialize_many(uris)
+        stream = MicroUriSerializer().iter_deserialize(buffer)
+        self.assertEqual([(0, uris[0]), (16, uris[1]), (28, uris[2])], list(stream))
+
+        fields = list(MicroUriSerializer().iter_fields(buffer))
+        self.assertEqual([0, 16, 28], [field[0] for field in fields])
+        self.assertEqual((3, 2, 3, 0x8001), fields[0][1:5])
+        self.assertEqual(b"vcu.vin", fields[0][5])
+        self.assertIsInstance(fields[0][5], memoryview)
+        self.assertEqual((1, 29999, 1, 5, bytes([192, 168, 1, 100])), fields[1][1:])
+        self.assertEqual((0, 29999, 254, 0, b""), fields[2][1:])
+
+    def test_index(self):
+        uris = [
+            UUri(
+                authority=UAuthority(id=b"a" * length),
+                entity=UEntity(id=length, version_major=1),
+                resource=UResourceBuilder.from_id(length),
+            )
+            for length in range(1, 6)
+        ]
+        buffer = bytes(MicroUriSerializer().serialize_many(uris))
+        offsets = MicroUriSerializer().index(buffer)
+        self.assertEqual([0, 10, 21, 33, 46], list(offsets))
+        for index in (4, 0, 2):
+            uri, size = MicroUriSerializer().deserialize_from(buffer, offsets[index])
+            self.assertEqual(uris[index], uri)
+            self.assertEqual(9 + len(uris[index].authority.id), size)
+        self.assertEqual(0, len(MicroUriSerializer().index(b"")))
+
+    def test_iter_invalid(self):
+        uri = UUri(entity=UEntity(id=29999, version_major=254), resource=UResourceBuilder.from_id(19999))
+        buffer = MicroUriSerializer().serialize_many([uri, uri])
+        stream = MicroUriSerializer().iter_deserialize(buffer[:-1])
+        self.assertEqual(0, next(stream)[0])
+        with self.assertRaises(ValueError):
+            next(stream)
+        with self.assertRaises(ValueError):
+            list(MicroUriSerializer().iter_fields(buffer[:-1]))
+        with self.assertRaises(ValueError):
+            MicroUriSerializer().index(buffer[:-1])
+
 
 if __name__ == "__main__":
     unittest.main()
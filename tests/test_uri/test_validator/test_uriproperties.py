@@ -0,0 +1,114 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import unittest
+
+from uprotocol.proto.uri_pb2 import UAuthority, UEntity, UUri
+from uprotocol.uri.factory.uresourcebuilder import UResourceBuilder
+from uprotocol.uri.factory.urikey import UriKey
+from uprotocol.uri.serializer.longuriserializer import LongUriSerializer
+from uprotocol.uri.serializer.microuriserializer import MicroUriSerializer
+from uprotocol.uri.validator.uriproperties import UriProperties, UriPropertiesCache
+from uprotocol.uri.validator.urivalidator import UriValidator
+
+
+def build_uris():
+    return [
+        None,
+        UUri(),
+        UUri(authority=UAuthority()),
+        LongUriSerializer().deserialize("/hartley/1/rpc.response"),
+        LongUriSerializer().deserialize("/hartley/1/rpc.Raise"),
+        LongUriSerializer().deserialize("//vcu.vin/body.access/1/door.front_left#Door"),
+        LongUriSerializer().deserialize("/body.access//door"),
+        UUri(
+            authority=UAuthority(ip=bytes([192, 168, 1, 100])),
+            entity=UEntity(name="body.access", id=29999, version_major=1),
+            resource=UResourceBuilder.for_rpc_request("OpenDoor", 5),
+        ),
+        MicroUriSerializer().deserialize(bytes([1, 0, 0, 5, 0x75, 0x2F, 1, 0])),
+    ]
+
+
+class TestUriProperties(unittest.TestCase):
+    def test_of_matches_uri_validator(self):
+        for uri in build_uris():
+            properties = UriProperties.of(uri)
+            checked = uri if uri is not None else UUri()
+            self.assertEqual(UriValidator.is_empty(uri), bool(properties & UriProperties.EMPTY))
+            self.assertEqual(UriValidator.is_local(checked.authority), bool(properties & UriProperties.LOCAL))
+            self.assertEqual(UriValidator.is_remote(checked.authority), bool(properties & UriProperties.REMOTE))
+            self.assertEqual(UriValidator.is_micro_form(checked), bool(properties & UriProperties.MICRO_FORM))
+            self.assertEqual(UriValidator.is_long_form(checked), bool(properties & UriProperties.LONG_FORM))
+            self.assertEqual(UriValidator.is_rpc_method(uri), bool(properties & UriProperties.RPC_METHOD))
+            self.assertEqual(UriValidator.is_rpc_response(uri), bool(properties & UriProperties.RPC_RESPONSE))
+            self.assertEqual(UriValidator.validate(checked).is_success(), bool(properties & UriProperties.VALID))
+
+    def test_topic(self):
+        self.assertTrue(
+            UriProperties.of(LongUriSerializer().deserialize("/body.access/1/door.front_left#Door"))
+            & UriProperties.TOPIC
+        )
+        self.assertFalse(
+            UriProperties.of(LongUriSerializer().deserialize("/body.access/1/door.front_left")) & UriProperties.TOPIC
+        )
+
+
+class TestUriPropertiesCache(unittest.TestCase):
+    def test_get(self):
+        cache = UriPropertiesCache()
+        for uri in build_uris():
+            self.assertEqual(UriProperties.of(uri), cache.get(uri))
+            self.assertEqual(UriProperties.of(uri), cache.get(UriKey.from_uri(uri)))
+            self.assertEqual(UriProperties.of(uri), cache.get(uri))
+        self.assertEqual(len(build_uris()) - 1, cache.stats().entries)
+
+    def test_string_uris(self):
+        cache = UriPropertiesCache()
+        uri = "/hartley/1/rpc.Raise"
+        self.assertEqual(UriProperties.of(LongUriSerializer().deserialize(uri)), cache.get(uri))
+        self.assertTrue(cache.check(uri, UriProperties.VALID | UriProperties.RPC_METHOD))
+        self.assertFalse(cache.check(uri, UriProperties.VALID | UriProperties.RPC_RESPONSE))
+        self.assertTrue(cache.check("", UriProperties.EMPTY))
+        self.assertEqual(2, cache.stats().hits)
+
+    def test_eviction(self):
+        cache = UriPropertiesCache(max_entries=2)
+        cache.get("/hartley/1/rpc.Raise")
+        cache.get("/hartley/1/rpc.response")
+        cache.get("/hartley/1/rpc.Raise")
+        cache.get("/body.access/1/door.front_left#Door")
+        stats = cache.stats()
+        self.assertEqual(1, stats.evictions)
+        self.assertEqual(2, stats.entries)
+        cache.get("/hartley/1/rpc.Raise")
+        self.assertEqual(2, cache.stats().hits)
+        cache.clear()
+        self.assertEqual(0, cache.stats().entries)
+
+    def test_invalid_max_entries(self):
+        with self.assertRaises(ValueError):
+            UriPropertiesCache(max_entries=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
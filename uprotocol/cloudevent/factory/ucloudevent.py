@@ -37,10 +37,14 @@ from uprotocol.proto.umessage_pb2 import UMessage
 from uprotocol.proto.upayload_pb2 import UPayload, UPayloadFormat
 from uprotocol.proto.ustatus_pb2 import UCode
 from uprotocol.proto.uuid_pb2 import UUID
+from uprotocol.uri.serializer.cachinguriserializer import CachingUriSerializer
 from uprotocol.uri.serializer.longuriserializer import LongUriSerializer
 from uprotocol.uuid.factory.uuidutils import UUIDUtils
 from uprotocol.uuid.serializer.longuuidserializer import LongUuidSerializer
 
+# Events keep referring to the same few topics and methods
+_uri_serializer = CachingUriSerializer(LongUriSerializer())
+
 
 class UCloudEvent:
     """
@@ -537,7 +541,7 @@ class UCloudEvent:
         data = bytearray()
         json_attributes = {
             "id": LongUuidSerializer.instance().serialize(attributes.id),
-            "source": LongUriSerializer().serialize(message.attributes.source),
+            "source": _uri_serializer.serialize(message.attributes.source),
             "type": UCloudEvent.get_event_type(attributes.type),
         }
         contenttype = UCloudEvent.get_content_type_from_upayload_format(payload.format)
@@ -555,7 +559,7 @@ class UCloudEvent:
         if attributes.HasField("token"):
             json_attributes["token"] = attributes.token
         if attributes.HasField("sink"):
-            json_attributes["sink"] = LongUriSerializer().serialize(attributes.sink)
+            json_attributes["sink"] = _uri_serializer.serialize(attributes.sink)
         if attributes.HasField("commstatus"):
             json_attributes["commstatus"] = attributes.commstatus
         if attributes.HasField("reqid"):
@@ -586,7 +590,7 @@ class UCloudEvent:
         attributes = UAttributes(
             id=LongUuidSerializer.instance().deserialize(UCloudEvent.get_id(event)),
             type=UCloudEvent.get_message_type(UCloudEvent.get_type(event)),
-            source=LongUriSerializer().deserialize(UCloudEvent.get_source(event)),
+            source=_uri_serializer.deserialize(UCloudEvent.get_source(event)),
         )
         if UCloudEvent.has_communication_status_problem(event):
             attributes.commstatus = UCloudEvent.get_communication_status(event)
@@ -600,7 +604,7 @@ class UCloudEvent:
 
         sink = UCloudEvent.get_sink(event)
         if sink is not None:
-            attributes.sink.CopyFrom(LongUriSerializer().deserialize(sink))
+            attributes.sink.CopyFrom(_uri_serializer.deserialize(sink))
 
         reqid = UCloudEvent.get_request_id(event)
         if reqid is not None:
@@ -28,10 +28,19 @@ from cloudevents.http import CloudEvent
 from uprotocol.cloudevent.factory.ucloudevent import UCloudEvent
 from uprotocol.proto.uattributes_pb2 import UMessageType
 from uprotocol.proto.uri_pb2 import UUri
+from uprotocol.uri.serializer.cachinguriserializer import CachingUriSerializer
 from uprotocol.uri.serializer.longuriserializer import LongUriSerializer
+from uprotocol.uri.validator.uriproperties import UriProperties, UriPropertiesCache
 from uprotocol.uri.validator.urivalidator import UriValidator
 from uprotocol.validation.validationresult import ValidationResult
 
+# Events keep referring to the same few topics and methods
+_uri_serializer = CachingUriSerializer(LongUriSerializer())
+_uri_properties = UriPropertiesCache(serializer=_uri_serializer)
+_VALID_TOPIC = UriProperties.VALID | UriProperties.TOPIC
+_VALID_RPC_RESPONSE = UriProperties.VALID | UriProperties.RPC_RESPONSE
+_VALID_RPC_METHOD = UriProperties.VALID | UriProperties.RPC_METHOD
+
 
 class CloudEventValidator(ABC):
     @staticmethod
@@ -157,7 +166,9 @@ class CloudEventValidator(ABC):
         ValidationResult containing a success or a failure with the error
         message.
         """
-        uri = LongUriSerializer().deserialize(uri)
+        if _uri_properties.check(uri, UriProperties.VALID):
+            return ValidationResult.success()
+        uri = _uri_serializer.deserialize(uri)
         return CloudEventValidator.validate_u_entity_uri_from_uuri(uri)
 
     @staticmethod
@@ -174,7 +185,9 @@ class CloudEventValidator(ABC):
         ValidationResult containing a success or a failure with the error
         message.
         """
-        uri = LongUriSerializer().deserialize(uri)
+        if _uri_properties.check(uri, _VALID_TOPIC):
+            return ValidationResult.success()
+        uri = _uri_serializer.deserialize(uri)
         return CloudEventValidator.validate_topic_uri_from_uuri(uri)
 
     @staticmethod
@@ -210,7 +223,9 @@ class CloudEventValidator(ABC):
         @return:Returns the ValidationResult containing a success or a failure
         with the error message.
         """
-        uri = LongUriSerializer().deserialize(uri)
+        if _uri_properties.check(uri, _VALID_RPC_RESPONSE):
+            return ValidationResult.success()
+        uri = _uri_serializer.deserialize(uri)
         return CloudEventValidator.validate_rpc_topic_uri_from_uuri(uri)
 
     @staticmethod
@@ -247,7 +262,9 @@ class CloudEventValidator(ABC):
         @param uri: String UriPart to validate
         @return:Returns the ValidationResult containing a success or a failure with the error message.
         """
-        uuri = LongUriSerializer().deserialize(uri)
+        if _uri_properties.check(uri, _VALID_RPC_METHOD):
+            return ValidationResult.success()
+        uuri = _uri_serializer.deserialize(uri)
         validation_result = CloudEventValidator.validate_u_entity_uri_from_uuri(uuri)
         if validation_result.is_failure():
             return ValidationResult.failure(f"Invalid RPC method uri. {validation_result.get_message()}")
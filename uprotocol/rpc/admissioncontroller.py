@@ -0,0 +1,189 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import heapq
+import itertools
+import threading
+from collections import deque
+from typing import Callable, Optional
+
+from uprotocol.proto.uattributes_pb2 import UAttributes
+from uprotocol.proto.ustatus_pb2 import UCode
+from uprotocol.uuid.factory.uuidutils import UUIDUtils
+
+
+class AdmissionStats:
+    """
+    Snapshot of the counters of an AdmissionController.
+    """
+
+    def __init__(self, admitted: int, rejected: int, in_flight: int, queued: int, service_time: float):
+        self.admitted = admitted
+        self.rejected = rejected
+        self.in_flight = in_flight
+        self.queued = queued
+        self.service_time = service_time
+
+    def __str__(self):
+        return (
+            f"AdmissionStats(admitted={self.admitted}, rejected={self.rejected}, in_flight={self.in_flight}, "
+            f"queued={self.queued}, service_time={self.service_time:.3f}ms)"
+        )
+
+
+class AdmissionController:
+    """
+    Admission control for the requests dispatched by an RPC server.<br>
+    At most max_in_flight requests are served at once. The others wait in a queue ordered by
+    UAttributes.priority (highest first) and then by earliest deadline (the time of the request id plus its ttl).
+    The controller keeps a moving average of the observed service time and rejects a request with
+    UCode.RESOURCE_EXHAUSTED, either on arrival or when it leaves the queue, once its remaining time to live can
+    no longer cover that service time: such a request would time out anyway and serving it would only delay the
+    requests that can still make their deadline. Requests arriving while the queue is full are rejected too.
+    """
+
+    def __init__(self, max_in_flight: int, max_queued: int = 1024, smoothing: float = 0.2):
+        """
+        @param max_in_flight:The maximum number of requests served concurrently.
+        @param max_queued:The maximum number of requests waiting to be served.
+        @param smoothing:The weight of the last observation in the moving average of the service time.
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be positive.")
+        if max_queued < 0:
+            raise ValueError("max_queued cannot be negative.")
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be in ]0, 1].")
+        self.max_in_flight = max_in_flight
+        self.max_queued = max_queued
+        self.smoothing = smoothing
+        self._service_time = 0.0
+        self._in_flight = 0
+        self._queue = []
+        self._sequence = itertools.count()
+        self._admitted = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def submit(self, attributes: UAttributes, start: Callable[[], None], reject: Callable[[UCode, str], None]):
+        """
+        Submit a request for admission.<br><br>
+        @param attributes:The attributes of the request, used for its priority and deadline.
+        @param start:Called when the request is admitted. The work started must call release() once the
+        request is served.
+        @param reject:Called with UCode.RESOURCE_EXHAUSTED and a reason when the request is rejected.
+        """
+        reason = None
+        with self._lock:
+            remaining = self._remaining_time(attributes)
+            if remaining is not None and remaining < self._service_time:
+                reason = "Not enough time left to serve the request."
+            elif self._in_flight < self.max_in_flight:
+                self._in_flight += 1
+                self._admitted += 1
+            elif len(self._queue) >= self.max_queued:
+                reason = "Too many requests waiting to be served."
+            else:
+                deadline = self._deadline(attributes)
+                heapq.heappush(
+                    self._queue, (-attributes.priority, deadline, next(self._sequence), attributes, start, reject)
+                )
+                return
+            if reason is not None:
+                self._rejected += 1
+        if reason is not None:
+            reject(UCode.RESOURCE_EXHAUSTED, reason)
+        else:
+            start()
+
+    def release(self, service_time: Optional[float]):
+        """
+        Signal that an admitted request was served, which frees its slot for the next waiting request.<br><br>
+        @param service_time:The time spent serving the request in milliseconds, None if the request was dropped
+        without being served: its slot is freed but the moving average of the service time is left as is.
+        """
+        rejected = []
+        admitted = None
+        with self._lock:
+            if service_time is not None:
+                if self._service_time == 0.0:
+                    self._service_time = service_time
+                else:
+                    self._service_time += self.smoothing * (service_time - self._service_time)
+            while self._queue:
+                entry = heapq.heappop(self._queue)
+                remaining = self._remaining_time(entry[3])
+                if remaining is not None and remaining < self._service_time:
+                    rejected.append(entry[5])
+                    continue
+                admitted = entry[4]
+                break
+            self._rejected += len(rejected)
+            if admitted is None:
+                self._in_flight -= 1
+            else:
+                self._admitted += 1
+        try:
+            if admitted is not None:
+                self._run(admitted)
+        finally:
+            for reject in rejected:
+                try:
+                    reject(UCode.RESOURCE_EXHAUSTED, "Not enough time left to serve the request.")
+                except Exception:
+                    # The slot is already handed over, a failing callback must not affect the other requests
+                    pass
+
+    def stats(self) -> AdmissionStats:
+        """
+        Get a snapshot of the counters of the controller.<br><br>
+        @return:Returns the AdmissionStats of the controller.
+        """
+        with self._lock:
+            return AdmissionStats(self._admitted, self._rejected, self._in_flight, len(self._queue), self._service_time)
+
+    def _run(self, start: Callable[[], None]):
+        # A request served inline calls release(), and so starts the next waiting request, from within start():
+        # the starts are queued on the thread and run in a loop instead of recursing once per waiting request
+        pending = getattr(self._local, "pending", None)
+        if pending is not None:
+            pending.append(start)
+            return
+        self._local.pending = pending = deque((start,))
+        try:
+            while pending:
+                pending.popleft()()
+        finally:
+            self._local.pending = None
+
+    @staticmethod
+    def _remaining_time(attributes: UAttributes) -> Optional[int]:
+        if attributes.ttl <= 0 or UUIDUtils.get_time(attributes.id) is None:
+            return None
+        remaining = UUIDUtils.get_remaining_time(attributes.id, attributes.ttl)
+        return 0 if remaining is None else remaining
+
+    @staticmethod
+    def _deadline(attributes: UAttributes) -> float:
+        created = UUIDUtils.get_time(attributes.id) if attributes.ttl > 0 else None
+        return float("inf") if created is None else created + attributes.ttl
@@ -0,0 +1,243 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from enum import Enum
+from typing import Callable, Dict, List, Optional, Sequence
+
+from uprotocol.proto.uattributes_pb2 import CallOptions
+from uprotocol.proto.upayload_pb2 import UPayload
+from uprotocol.proto.uri_pb2 import UAuthority, UUri
+from uprotocol.proto.ustatus_pb2 import UCode
+from uprotocol.rpc.rpcclient import RpcClient
+from uprotocol.transport.builder.umessagebuilder import UMessageBuilder
+
+# Communication failures reported by the RPC layer that count against the health of an instance, failures
+# returned by the service itself do not
+_INSTANCE_FAILURES = frozenset({UCode.UNAVAILABLE, UCode.DEADLINE_EXCEEDED, UCode.RESOURCE_EXHAUSTED, UCode.INTERNAL})
+
+# Latency in milliseconds assumed for the score of an instance without samples yet
+_MIN_LATENCY = 0.001
+
+
+class BalancingStrategy(Enum):
+    """
+    The way a BalancingRpcClient picks the instance serving a request.
+    """
+
+    # The instance with the fewest requests in flight, the lowest latency breaking ties
+    LEAST_OUTSTANDING = 0
+    # The best of two random instances, scored by requests in flight and latency
+    POWER_OF_TWO_CHOICES = 1
+
+
+class InstanceStats:
+    """
+    Snapshot of the state of one service instance of a BalancingRpcClient.
+    """
+
+    def __init__(self, authority: UAuthority, in_flight: int, latency: float, failures: int, ejected: bool):
+        self.authority = authority
+        self.in_flight = in_flight
+        self.latency = latency
+        self.failures = failures
+        self.ejected = ejected
+
+    def __str__(self):
+        return (
+            f"InstanceStats(authority={self.authority.name or self.authority.ip or self.authority.id}, "
+            f"in_flight={self.in_flight}, latency={self.latency:.3f}ms, failures={self.failures}, "
+            f"ejected={self.ejected})"
+        )
+
+
+class _Instance:
+    __slots__ = ("authority", "in_flight", "latency", "failures", "ejected_until")
+
+    def __init__(self, authority: UAuthority):
+        self.authority = authority
+        self.in_flight = 0
+        self.latency = 0.0
+        self.failures = 0
+        self.ejected_until = 0.0
+
+
+class BalancingRpcClient(RpcClient):
+    """
+    RpcClient spreading the calls of a logical method over the replicas of a uEntity running under different
+    authorities.<br>
+    The method UUri given to invoke_method() is resolved to the authorities of the instances serving it, one of
+    them is picked according to the BalancingStrategy and the request is sent to the method UUri of that
+    instance through the delegate. The client tracks, per instance, the requests in flight and a moving average
+    of the response latency. An instance failing failure_threshold calls in a row with a communication failure
+    (a commstatus of UNAVAILABLE, DEADLINE_EXCEEDED, RESOURCE_EXHAUSTED or INTERNAL, or an exception) is ejected
+    for ejection_time milliseconds. When every instance is ejected, requests are spread over all of them rather
+    than failed. Cancelled calls are not scored. The state of at most max_instances instances is kept, the
+    instances idle for the longest time being forgotten first.
+    """
+
+    def __init__(
+        self,
+        delegate: RpcClient,
+        resolver: Callable[[UUri], Sequence[UAuthority]],
+        strategy: BalancingStrategy = BalancingStrategy.LEAST_OUTSTANDING,
+        smoothing: float = 0.2,
+        failure_threshold: int = 3,
+        ejection_time: int = 30000,
+        rng: random.Random = None,
+        max_instances: int = 1024,
+    ):
+        """
+        @param delegate:The RpcClient used to send the requests.
+        @param resolver:Returns the authorities of the instances serving a method, given its logical UUri.
+        @param strategy:The BalancingStrategy used to pick an instance.
+        @param smoothing:The weight of the last observation in the moving average of the latency.
+        @param failure_threshold:The number of consecutive failures after which an instance is ejected.
+        @param ejection_time:The time an ejected instance is left aside, in milliseconds.
+        @param rng:The random generator used by BalancingStrategy.POWER_OF_TWO_CHOICES.
+        @param max_instances:The maximum number of instances whose state is kept.
+        """
+        if delegate is None:
+            raise ValueError("delegate cannot be None.")
+        if resolver is None:
+            raise ValueError("resolver cannot be None.")
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be in ]0, 1].")
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be positive.")
+        if max_instances < 1:
+            raise ValueError("max_instances must be positive.")
+        self.delegate = delegate
+        self.resolver = resolver
+        self.strategy = strategy
+        self.smoothing = smoothing
+        self.failure_threshold = failure_threshold
+        self.ejection_time = ejection_time
+        self._rng = rng if rng is not None else random.Random()
+        self.max_instances = max_instances
+        self._instances: Dict[bytes, _Instance] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def invoke_method(self, method_uri: UUri, request_payload: UPayload, options: CallOptions) -> Future:
+        authorities = self.resolver(method_uri) if method_uri is not None else None
+        if not authorities:
+            future = Future()
+            future.set_result(UMessageBuilder.status(UCode.UNAVAILABLE, "No instance available for the method."))
+            return future
+
+        with self._lock:
+            instance = self._pick(authorities)
+            instance.in_flight += 1
+        instance_uri = UUri()
+        instance_uri.CopyFrom(method_uri)
+        instance_uri.authority.CopyFrom(instance.authority)
+        start = time.monotonic()
+        try:
+            response_future = self.delegate.invoke_method(instance_uri, request_payload, options)
+        except Exception:
+            self._record(instance, start, False)
+            raise
+        response_future.add_done_callback(lambda done: self._record(instance, start, self._succeeded(done)))
+        return response_future
+
+    def stats(self) -> List[InstanceStats]:
+        """
+        Get the state of the instances the client has sent requests to.<br><br>
+        @return:Returns an InstanceStats per instance.
+        """
+        now = time.monotonic()
+        with self._lock:
+            return [
+                InstanceStats(i.authority, i.in_flight, i.latency, i.failures, i.ejected_until > now)
+                for i in self._instances.values()
+            ]
+
+    def _pick(self, authorities: Sequence[UAuthority]) -> _Instance:
+        instances = []
+        for authority in authorities:
+            key = authority.SerializeToString()
+            instance = self._instances.get(key)
+            if instance is None:
+                instance = self._instances[key] = _Instance(authority)
+            else:
+                self._instances.move_to_end(key)
+            instances.append(instance)
+        self._forget_idle()
+
+        now = time.monotonic()
+        healthy = [i for i in instances if i.ejected_until <= now] or instances
+        if len(healthy) == 1:
+            return healthy[0]
+        if self.strategy is BalancingStrategy.POWER_OF_TWO_CHOICES:
+            first, second = self._rng.sample(healthy, 2)
+            return first if self._score(first) <= self._score(second) else second
+        return min(healthy, key=lambda i: (i.in_flight, i.latency))
+
+    def _forget_idle(self):
+        excess = len(self._instances) - self.max_instances
+        if excess <= 0:
+            return
+        # Least recently picked first, instances with requests in flight are kept until they complete
+        idle = [key for key, instance in self._instances.items() if instance.in_flight == 0]
+        for key in idle[:excess]:
+            del self._instances[key]
+
+    @staticmethod
+    def _score(instance: _Instance) -> float:
+        # Expected wait behind the requests already in flight, an instance without samples is favored
+        return (instance.in_flight + 1) * max(instance.latency, _MIN_LATENCY)
+
+    @staticmethod
+    def _succeeded(done: Future) -> Optional[bool]:
+        if done.cancelled():
+            # The caller gave up, the call tells nothing about the instance
+            return None
+        if done.exception() is not None:
+            return False
+        response = done.result()
+        if response is None:
+            return False
+        attributes = response.attributes
+        return not (attributes.HasField("commstatus") and attributes.commstatus in _INSTANCE_FAILURES)
+
+    def _record(self, instance: _Instance, start: float, succeeded: Optional[bool]):
+        now = time.monotonic()
+        with self._lock:
+            instance.in_flight -= 1
+            if succeeded is None:
+                return
+            latency = (now - start) * 1000
+            if instance.latency == 0:
+                instance.latency = latency
+            else:
+                instance.latency += self.smoothing * (latency - instance.latency)
+            if succeeded:
+                instance.failures = 0
+                return
+            instance.failures += 1
+            if instance.failures >= self.failure_threshold:
+                instance.failures = 0
+                instance.ejected_until = now + self.ejection_time / 1000
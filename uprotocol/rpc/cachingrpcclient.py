@@ -0,0 +1,187 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from uprotocol.proto.uattributes_pb2 import CallOptions
+from uprotocol.proto.umessage_pb2 import UMessage
+from uprotocol.proto.upayload_pb2 import UPayload
+from uprotocol.proto.uri_pb2 import UUri
+from uprotocol.rpc.rpcclient import RpcClient
+from uprotocol.rpc.rpcmapper import RpcMapper
+from uprotocol.rpc.rpcrequestkey import request_key
+from uprotocol.uri.factory.urikey import UriKey
+
+
+class CacheStats:
+    """
+    Snapshot of the counters of a CachingRpcClient.
+    """
+
+    def __init__(self, hits: int, misses: int, evictions: int, entries: int, size_bytes: int):
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+        self.entries = entries
+        self.size_bytes = size_bytes
+
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"CacheStats(hits={self.hits}, misses={self.misses}, evictions={self.evictions}, "
+            f"entries={self.entries}, size_bytes={self.size_bytes})"
+        )
+
+
+class CachingRpcClient(RpcClient):
+    """
+    RpcClient that caches the responses of idempotent methods in front of another RpcClient.<br>
+    Caching is opt-in per method: only methods registered with cache_method() (or every method when a
+    default_ttl is given) are cached. Responses are keyed by the method UUri and the serialized request
+    payload, expire after the TTL configured for their method and are evicted in least recently used order
+    once the cache grows beyond max_bytes. Failed calls are never cached. A cache miss returns the Future of
+    the delegate, so cancelling it cancels the request, while a cache hit returns a Future that is already
+    complete.
+    """
+
+    def __init__(self, delegate: RpcClient, max_bytes: int = 1024 * 1024, default_ttl: int = None):
+        """
+        @param delegate:The RpcClient used to send the requests that are not served from the cache.
+        @param max_bytes:Upper bound of the sum of the serialized sizes of the cached responses.
+        @param default_ttl:Time to live in milliseconds of the responses of methods that were not registered
+        with cache_method(), None to only cache registered methods.
+        """
+        if delegate is None:
+            raise ValueError("delegate cannot be None.")
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive.")
+        self.delegate = delegate
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._method_ttls = {}
+        self._entries = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def cache_method(self, method_uri: UUri, ttl: int):
+        """
+        Enable caching of the responses of a method.<br><br>
+        @param method_uri:The method URI whose responses are cached.
+        @param ttl:Time to live of the cached responses in milliseconds.
+        @return:Returns this CachingRpcClient.
+        """
+        if method_uri is None:
+            raise ValueError("method_uri cannot be None.")
+        if ttl is None or ttl <= 0:
+            raise ValueError("ttl must be positive.")
+        self._method_ttls[UriKey.from_uri(method_uri)] = ttl
+        return self
+
+    def invoke_method(self, method_uri: UUri, request_payload: UPayload, options: CallOptions) -> Future:
+        key = request_key(method_uri, request_payload)
+        ttl = self._method_ttls.get(key[0], self.default_ttl)
+        if ttl is None:
+            return self.delegate.invoke_method(method_uri, request_payload, options)
+
+        cached = self._get(key)
+        if cached is not None:
+            future = Future()
+            future.set_result(cached)
+            return future
+
+        response_future = self.delegate.invoke_method(method_uri, request_payload, options)
+
+        def store_response(completed: Future):
+            if completed.cancelled() or completed.exception() is not None:
+                return
+            message = completed.result()
+            if RpcMapper.is_failure_response(message):
+                return
+            self._put(key, message, ttl)
+
+        response_future.add_done_callback(store_response)
+        return response_future
+
+    def invalidate(self, method_uri: UUri = None):
+        """
+        Drop cached responses.<br><br>
+        @param method_uri:The method URI whose responses are dropped, None to drop every cached response.
+        """
+        with self._lock:
+            if method_uri is None:
+                self._entries.clear()
+                self._size_bytes = 0
+                return
+            method_key = UriKey.from_uri(method_uri)
+            for key in [key for key in self._entries if key[0] == method_key]:
+                self._remove(key)
+
+    def stats(self) -> CacheStats:
+        """
+        Get the cache counters.<br><br>
+        @return:Returns a snapshot of the hit, miss and eviction counters and of the cache occupancy.
+        """
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, len(self._entries), self._size_bytes)
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                message, expires_at, _ = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    response = UMessage()
+                    response.CopyFrom(message)
+                    return response
+                self._remove(key)
+            self._misses += 1
+            return None
+
+    def _put(self, key, message: UMessage, ttl: int):
+        size = len(key[0]) + len(key[1]) + message.ByteSize()
+        if size > self.max_bytes:
+            return
+        cached = UMessage()
+        cached.CopyFrom(message)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (cached, time.monotonic() + ttl / 1000, size)
+            self._size_bytes += size
+            while self._size_bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def _remove(self, key):
+        _, _, size = self._entries.pop(key)
+        self._size_bytes -= size
@@ -0,0 +1,332 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from enum import Enum
+from typing import Dict, Optional
+
+from uprotocol.proto.uattributes_pb2 import CallOptions
+from uprotocol.proto.umessage_pb2 import UMessage
+from uprotocol.proto.upayload_pb2 import UPayload
+from uprotocol.proto.uri_pb2 import UUri
+from uprotocol.proto.ustatus_pb2 import UCode, UStatus
+from uprotocol.rpc.retrybudget import RetryBudget
+from uprotocol.rpc.rpcclient import RpcClient
+from uprotocol.transport.builder.umessagebuilder import UMessageBuilder
+from uprotocol.transport.builder.upayloadbuilder import UPayloadBuilder
+from uprotocol.uri.factory.urikey import UriKey
+
+# Code and reason of the failure returned when an open circuit short-circuits a call. The call was not sent, and
+# no transport failure reports FAILED_PRECONDITION, so the wrapping clients neither retry it nor count it against
+# an instance. CircuitBreakerRpcClient.is_circuit_open() tells it apart from the same code returned by a server
+CIRCUIT_OPEN = UCode.FAILED_PRECONDITION
+CIRCUIT_OPEN_REASON = "Circuit breaker open."
+
+_ERRORS = frozenset({UCode.UNAVAILABLE, UCode.RESOURCE_EXHAUSTED, UCode.INTERNAL})
+_TIMEOUTS = frozenset({UCode.DEADLINE_EXCEEDED})
+# Failures for which the request was not served, retrying them does not run a method twice
+_RETRYABLE = frozenset({UCode.UNAVAILABLE, UCode.RESOURCE_EXHAUSTED})
+
+
+class CircuitState(Enum):
+    """
+    The state of a CircuitBreaker.
+    """
+
+    # Calls go through
+    CLOSED = 0
+    # Calls are short-circuited
+    OPEN = 1
+    # A few probe calls go through to find out if the method recovered
+    HALF_OPEN = 2
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker of one RPC method.<br>
+    While closed, the breaker records the outcome of the last window_size calls and opens once at least
+    minimum_calls were recorded and either the share of errors reaches failure_rate or the share of timeouts
+    reaches timeout_rate. It stays open for open_time milliseconds, then lets probes calls through: the circuit
+    closes after that many successful probes and opens again on the first failed one.<br>
+    Every change of state starts a new generation of the circuit. allow() returns the current generation and
+    record() ignores the outcomes of calls allowed in an earlier one, so a call sent while the circuit was closed
+    and completing once it is half-open is not taken for a probe.
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        timeout_rate: float = 0.5,
+        window_size: int = 20,
+        minimum_calls: int = 10,
+        open_time: int = 5000,
+        probes: int = 1,
+    ):
+        """
+        @param failure_rate:The share of errors opening the circuit.
+        @param timeout_rate:The share of timeouts opening the circuit.
+        @param window_size:The number of recent calls the rates are computed on.
+        @param minimum_calls:The number of calls recorded before the circuit can open.
+        @param open_time:The time the circuit stays open, in milliseconds.
+        @param probes:The number of successful probe calls closing the circuit.
+        """
+        if not 0 < failure_rate <= 1 or not 0 < timeout_rate <= 1:
+            raise ValueError("failure_rate and timeout_rate must be in ]0, 1].")
+        if not 0 < minimum_calls <= window_size:
+            raise ValueError("minimum_calls must be in [1, window_size].")
+        if probes < 1:
+            raise ValueError("probes must be positive.")
+        self.failure_rate = failure_rate
+        self.timeout_rate = timeout_rate
+        self.minimum_calls = minimum_calls
+        self.open_time = open_time
+        self.probes = probes
+        self._outcomes = deque(maxlen=window_size)
+        self._errors = 0
+        self._timeouts = 0
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probing = 0
+        self._probed = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def state(self) -> CircuitState:
+        """
+        Get the state of the circuit.<br><br>
+        @return:Returns the CircuitState, an open circuit whose open_time elapsed is reported half-open.
+        """
+        with self._lock:
+            if self._state is CircuitState.OPEN and self._open_time_elapsed():
+                return CircuitState.HALF_OPEN
+            return self._state
+
+    def allow(self) -> Optional[int]:
+        """
+        Check if a call may go through, a call allowed while the circuit is half-open is a probe.<br><br>
+        @return:Returns the generation of the circuit to record the outcome of the call with, None if the call
+        must be short-circuited.
+        """
+        with self._lock:
+            if self._state is CircuitState.OPEN:
+                if not self._open_time_elapsed():
+                    return None
+                self._state = CircuitState.HALF_OPEN
+                self._generation += 1
+                self._probing = 0
+                self._probed = 0
+            if self._state is CircuitState.HALF_OPEN:
+                if self._probing + self._probed >= self.probes:
+                    return None
+                self._probing += 1
+            return self._generation
+
+    def record(self, generation: int, code: Optional[UCode]):
+        """
+        Record the outcome of an allowed call.<br><br>
+        @param generation:The generation returned by allow() for the call. The outcome of a call allowed before
+        the last change of state is ignored.
+        @param code:The failure of the call, None if it succeeded. A call cancelled with UCode.CANCELLED has no
+        outcome: it is not counted and the probe slot it held is released.
+        """
+        with self._lock:
+            if generation != self._generation:
+                return
+            if self._state is CircuitState.HALF_OPEN:
+                self._probing -= 1
+                if code == UCode.CANCELLED:
+                    return
+                if code in _ERRORS or code in _TIMEOUTS:
+                    self._open()
+                else:
+                    self._probed += 1
+                    if self._probed >= self.probes:
+                        self._state = CircuitState.CLOSED
+                        self._generation += 1
+                return
+            if code == UCode.CANCELLED:
+                return
+            if len(self._outcomes) == self._outcomes.maxlen:
+                self._forget(self._outcomes[0])
+            self._outcomes.append(code)
+            self._errors += code in _ERRORS
+            self._timeouts += code in _TIMEOUTS
+            calls = len(self._outcomes)
+            if calls >= self.minimum_calls and (
+                self._errors >= self.failure_rate * calls or self._timeouts >= self.timeout_rate * calls
+            ):
+                self._open()
+
+    def _forget(self, code: Optional[UCode]):
+        self._errors -= code in _ERRORS
+        self._timeouts -= code in _TIMEOUTS
+
+    def _open(self):
+        self._state = CircuitState.OPEN
+        self._generation += 1
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+        self._errors = 0
+        self._timeouts = 0
+
+    def _open_time_elapsed(self) -> bool:
+        return time.monotonic() - self._opened_at >= self.open_time / 1000
+
+
+class CircuitBreakerRpcClient(RpcClient):
+    """
+    RpcClient guarding every method UUri with its own CircuitBreaker and retrying failed calls within a
+    RetryBudget.<br>
+    A call to a method whose circuit is open completes right away with a response whose commstatus is
+    CIRCUIT_OPEN (UCode.FAILED_PRECONDITION) and whose UStatus reason is CIRCUIT_OPEN_REASON, mapped by RpcMapper
+    to a failed RpcResult with that code, instead of loading the failing method. is_circuit_open() tells such a
+    response apart from a failure returned by the server. Calls failing with UNAVAILABLE or RESOURCE_EXHAUSTED,
+    which the server did not serve, are retried up to max_attempts times as long as the retry budget allows it
+    and the ttl of the call is not spent: each retry is sent with the remaining time as its ttl. Cancelling the
+    returned Future cancels the attempt in flight.
+    """
+
+    def __init__(
+        self,
+        delegate: RpcClient,
+        retry_budget: RetryBudget = None,
+        max_attempts: int = 3,
+        breaker_factory=CircuitBreaker,
+    ):
+        """
+        @param delegate:The RpcClient used to send the requests.
+        @param retry_budget:The RetryBudget of the retries, possibly shared with other clients.
+        @param max_attempts:The maximum number of times a call is sent, 1 disables retries.
+        @param breaker_factory:Creates the CircuitBreaker of a method.
+        """
+        if delegate is None:
+            raise ValueError("delegate cannot be None.")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be positive.")
+        self.delegate = delegate
+        self.retry_budget = retry_budget if retry_budget is not None else RetryBudget()
+        self.max_attempts = max_attempts
+        self.breaker_factory = breaker_factory
+        self._breakers: Dict[bytes, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def invoke_method(self, method_uri: UUri, request_payload: UPayload, options: CallOptions) -> Future:
+        future = Future()
+        self.retry_budget.deposit()
+        start = time.monotonic()
+        self._attempt(future, self.breaker(method_uri), method_uri, request_payload, options, options, start, 1)
+        return future
+
+    def breaker(self, method_uri: UUri) -> CircuitBreaker:
+        """
+        Get the CircuitBreaker of a method.<br><br>
+        @param method_uri:The method URI.
+        @return:Returns the CircuitBreaker of the method, created on first use.
+        """
+        key = UriKey.from_uri(method_uri)
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = self._breakers[key] = self.breaker_factory()
+            return breaker
+
+    @staticmethod
+    def is_circuit_open(response: UMessage) -> bool:
+        """
+        Check if a response was produced by an open circuit rather than by the server.<br><br>
+        @param response:The response UMessage of a call.
+        @return:Returns true if the call was short-circuited by an open circuit.
+        """
+        if response is None or response.attributes.commstatus != CIRCUIT_OPEN or not response.HasField("payload"):
+            return False
+        status = UPayloadBuilder.unpack(response.payload, UStatus)
+        return status is not None and status.message == CIRCUIT_OPEN_REASON
+
+    def _attempt(self, future, breaker, method_uri, request_payload, options, attempt_options, start, attempt):
+        generation = breaker.allow()
+        if generation is None:
+            if future.set_running_or_notify_cancel():
+                future.set_result(UMessageBuilder.status(CIRCUIT_OPEN, CIRCUIT_OPEN_REASON))
+            return
+        try:
+            response_future = self.delegate.invoke_method(method_uri, request_payload, attempt_options)
+        except Exception as e:
+            breaker.record(generation, UCode.INTERNAL)
+            if attempt == 1:
+                raise
+            if future.set_running_or_notify_cancel():
+                future.set_exception(e)
+            return
+        # Cancelling the call cancels the attempt in flight
+        future.add_done_callback(lambda done: done.cancelled() and response_future.cancel())
+
+        def handle_response(done: Future):
+            code = self._failure(done)
+            breaker.record(generation, code)
+            if code in _RETRYABLE and attempt < self.max_attempts and not future.cancelled():
+                retry_options = self._remaining(options, start)
+                if retry_options is not None and self.retry_budget.try_withdraw():
+                    self._attempt(
+                        future, breaker, method_uri, request_payload, options, retry_options, start, attempt + 1
+                    )
+                    return
+            self._complete(future, done)
+
+        response_future.add_done_callback(handle_response)
+
+    @staticmethod
+    def _failure(done: Future) -> Optional[UCode]:
+        if done.cancelled():
+            return UCode.CANCELLED
+        if done.exception() is not None:
+            return UCode.INTERNAL
+        response: UMessage = done.result()
+        if response is not None and response.attributes.HasField("commstatus"):
+            commstatus = response.attributes.commstatus
+            return commstatus if commstatus != UCode.OK else None
+        return None
+
+    @staticmethod
+    def _remaining(options: CallOptions, start: float) -> Optional[CallOptions]:
+        if options is None or options.ttl <= 0:
+            return options
+        remaining = options.ttl - int((time.monotonic() - start) * 1000)
+        if remaining <= 0:
+            return None
+        retry_options = CallOptions()
+        retry_options.CopyFrom(options)
+        retry_options.ttl = remaining
+        return retry_options
+
+    @staticmethod
+    def _complete(future: Future, done: Future):
+        if done.cancelled():
+            future.cancel()
+        elif not future.set_running_or_notify_cancel():
+            return
+        elif done.exception() is not None:
+            future.set_exception(done.exception())
+        else:
+            future.set_result(done.result())
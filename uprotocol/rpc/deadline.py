@@ -0,0 +1,132 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from uprotocol.proto.uattributes_pb2 import CallOptions, UAttributes
+from uprotocol.uuid.factory.uuidutils import UUIDUtils
+
+_current: ContextVar[Optional["Deadline"]] = ContextVar("uprotocol_rpc_deadline", default=None)
+
+
+class Deadline:
+    """
+    Point in time after which the caller of an RPC request no longer waits for its response.<br>
+    The server sets the deadline of the request it is handling as the current deadline of the handler context
+    (see scope()). RPC clients then apply it to the calls made while handling the request with
+    call_options(): the ttl of a nested call is capped to the remaining budget and a call is failed right away
+    once the budget is exhausted, instead of keeping a downstream service busy after the caller gave up.
+    """
+
+    __slots__ = ("expires_at",)
+
+    def __init__(self, expires_at: float):
+        """
+        @param expires_at:The expiration time, on the time.monotonic() clock.
+        """
+        self.expires_at = expires_at
+
+    @staticmethod
+    def after(ttl: int) -> "Deadline":
+        """
+        Create the deadline expiring after a ttl.<br><br>
+        @param ttl:The time to live in milliseconds.
+        @return:Returns the Deadline.
+        """
+        return Deadline(time.monotonic() + ttl / 1000)
+
+    @staticmethod
+    def from_attributes(attributes: UAttributes) -> Optional["Deadline"]:
+        """
+        Derive the deadline of a request from the timestamp of its id and its ttl.<br><br>
+        @param attributes:The attributes of the request.
+        @return:Returns the Deadline of the request, None if the request has no ttl or its creation time
+        cannot be determined.
+        """
+        if attributes is None or attributes.ttl <= 0 or UUIDUtils.get_time(attributes.id) is None:
+            return None
+        remaining = UUIDUtils.get_remaining_time(attributes.id, attributes.ttl)
+        return Deadline.after(remaining if remaining is not None else 0)
+
+    def remaining(self) -> int:
+        """
+        Get the time left before the deadline.<br><br>
+        @return:Returns the remaining time in milliseconds, 0 once the deadline has passed.
+        """
+        return max(0, int((self.expires_at - time.monotonic()) * 1000))
+
+    def is_expired(self) -> bool:
+        """
+        Check if the deadline has passed.<br><br>
+        @return:Returns true if there is no time left.
+        """
+        return self.remaining() <= 0
+
+    @staticmethod
+    def current() -> Optional["Deadline"]:
+        """
+        Get the deadline of the request being handled by the current thread or task.<br><br>
+        @return:Returns the current Deadline, None when there is none.
+        """
+        return _current.get()
+
+    @staticmethod
+    @contextmanager
+    def scope(deadline: Optional["Deadline"]):
+        """
+        Context manager making a deadline the current one. A deadline is only ever tightened: when the
+        enclosing scope has an earlier deadline, that one stays current.<br><br>
+        @param deadline:The Deadline, None to keep the enclosing one.
+        """
+        enclosing = _current.get()
+        if deadline is None or (enclosing is not None and enclosing.expires_at <= deadline.expires_at):
+            deadline = enclosing
+        token = _current.set(deadline)
+        try:
+            yield deadline
+        finally:
+            _current.reset(token)
+
+    @staticmethod
+    def call_options(options: CallOptions) -> CallOptions:
+        """
+        Apply the current deadline to the options of an outgoing call: the ttl is capped to the remaining
+        budget, or set to it when the options have no ttl.<br><br>
+        @param options:The CallOptions of the call, may be None.
+        @return:Returns the options unchanged when there is no current deadline or the ttl already fits, a copy
+        with the capped ttl otherwise. A ttl of 0 means the budget is exhausted and the call must fail.
+        """
+        deadline = _current.get()
+        if options is None:
+            options = CallOptions()
+        if deadline is None:
+            return options
+        remaining = deadline.remaining()
+        if 0 < options.ttl <= remaining:
+            return options
+        capped = CallOptions()
+        capped.CopyFrom(options)
+        capped.ttl = remaining
+        return capped
@@ -0,0 +1,359 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import heapq
+import threading
+import time
+from concurrent.futures import Future
+from typing import Type
+
+from google.protobuf.message import Message
+
+from uprotocol.proto.uattributes_pb2 import CallOptions, UMessageType
+from uprotocol.proto.umessage_pb2 import UMessage
+from uprotocol.proto.upayload_pb2 import UPayload
+from uprotocol.proto.uri_pb2 import UUri
+from uprotocol.proto.ustatus_pb2 import UCode, UStatus
+from uprotocol.proto.uuid_pb2 import UUID
+from uprotocol.rpc.deadline import Deadline
+from uprotocol.rpc.inmemoryrpcserver import InMemoryRpcServer
+from uprotocol.rpc.responsestream import ResponseStream
+from uprotocol.rpc.rpcclient import RpcClient
+from uprotocol.rpc.rpcmapper import RpcMapper
+from uprotocol.transport.builder.typeregistry import TypeRegistry
+from uprotocol.transport.builder.umessagebuilder import UMessageBuilder
+from uprotocol.transport.builder.upayloadbuilder import UPayloadBuilder
+from uprotocol.transport.ulistener import UListener
+from uprotocol.transport.utransport import UTransport
+from uprotocol.uri.validator.urivalidator import UriValidator
+
+
+class _ResponseListener(UListener):
+    def __init__(self, client: "InMemoryRpcClient"):
+        self.client = client
+
+    def on_receive(self, umsg: UMessage) -> None:
+        self.client._on_response(umsg)
+
+
+class _LocalCall(Future):
+    """
+    Future of a call served by a co-located MessageHandler, completed with the response message.
+    """
+
+
+class InMemoryRpcClient(RpcClient):
+    """
+    RpcClient sending requests over any UTransport.<br>
+    The client registers a listener for its response URI, keeps the pending requests in memory keyed by
+    their request id and completes the returned Future with the response UMessage. Failures detected by the
+    client (invalid method URI, transport errors, requests that time out after CallOptions.ttl) complete the
+    Future with a response carrying the UStatus of the failure, so they can be mapped with RpcMapper like any
+    failure reported by the server.<br>
+    Server-streaming methods are invoked with invoke_streaming(): all the responses sharing the request id are
+    queued in a ResponseStream until the one carrying a commstatus attribute ends the stream.<br>
+    Calls made while a server handles a request inherit its Deadline: their ttl is capped to the time the
+    original caller still waits and they fail with UCode.DEADLINE_EXCEEDED without being sent once that budget
+    is exhausted.<br>
+    invoke_message() takes and returns message objects: when the method is served by a MessageHandler of an
+    InMemoryRpcServer on the same transport, the request object is handed to it directly, without packing,
+    sending or parsing anything.<br>
+    Cancelling a returned Future, or closing a ResponseStream before its end, drops the pending request right
+    away and notifies the server with UMessageBuilder.cancel(), so that it does not spend time on a response
+    nobody waits for.
+    """
+
+    def __init__(self, transport: UTransport, source: UUri):
+        """
+        @param transport:The UTransport used to send the requests and receive the responses.
+        @param source:The response URI of this client, the source of every request it sends.
+        """
+        if transport is None:
+            raise ValueError("transport cannot be None.")
+        if source is None:
+            raise ValueError("source cannot be None.")
+        self.transport = transport
+        self.source = source
+        self._pending = {}
+        self._timeouts = []
+        self._lock = threading.Lock()
+        self._timeouts_changed = threading.Condition(self._lock)
+        self._timeout_thread = None
+        self._closed = False
+        self._listener = _ResponseListener(self)
+        status = transport.register_listener(source, self._listener)
+        if status.code != UCode.OK:
+            raise RuntimeError(f"Failed to register the response listener: {status.message}")
+
+    def invoke_method(self, method_uri: UUri, request_payload: UPayload, options: CallOptions) -> Future:
+        future = Future()
+        validation = UriValidator.validate_rpc_method(method_uri)
+        if validation.is_failure():
+            future.set_result(UMessageBuilder.status(UCode.INVALID_ARGUMENT, validation.get_message()))
+            return future
+
+        options = Deadline.call_options(options)
+        if options.ttl <= 0 and Deadline.current() is not None:
+            future.set_result(UMessageBuilder.status(UCode.DEADLINE_EXCEEDED, "Deadline exceeded."))
+            return future
+        request = UMessageBuilder.request(self.source, method_uri, options, request_payload)
+        reqid = request.attributes.id
+        key = (reqid.msb, reqid.lsb)
+        with self._lock:
+            self._pending[key] = future
+            if options.ttl > 0:
+                self._schedule_timeout(key, options.ttl)
+
+        status = self.transport.send(request)
+        if status.code != UCode.OK:
+            with self._lock:
+                pending = self._pending.pop(key, None)
+            if pending is not None:
+                self._complete(pending, UMessageBuilder.status(status.code, status.message, reqid))
+        future.add_done_callback(lambda done: self._on_done(key, request.attributes, done))
+        return future
+
+    def invoke_message(
+        self, method_uri: UUri, request: Message, options: CallOptions, response_class: Type[Message]
+    ) -> Future:
+        """
+        Invoke an RPC method with a request message and get the response message.<br><br>
+        @param method_uri:The method URI to be invoked.
+        @param request:The request message, a co-located handler receives this very object.
+        @param options:RPC method invocation call options.
+        @param response_class:The declared response class of the method.
+        @return:Returns a Future completed with the response message, or with the exception built by
+        RpcMapper.to_exception() if the call fails.
+        """
+        local = InMemoryRpcServer.local_handler(self.transport, method_uri) if method_uri is not None else None
+        if local is None:
+            return self._map_response(
+                self.invoke_method(method_uri, UPayloadBuilder.pack_to_any(request), options), response_class
+            )
+
+        future = _LocalCall()
+        options = Deadline.call_options(options)
+        if options.ttl <= 0 and Deadline.current() is not None:
+            future.set_exception(RpcMapper.to_exception(UCode.DEADLINE_EXCEEDED, "Deadline exceeded."))
+            return future
+        # Same attributes as a request sent over the transport, so that the server applies the same rules
+        attributes = UMessageBuilder.request(self.source, method_uri, options).attributes
+        key = (attributes.id.msb, attributes.id.lsb)
+        with self._lock:
+            self._pending[key] = future
+            if options.ttl > 0:
+                self._schedule_timeout(key, options.ttl)
+
+        server, handler = local
+        served = server.invoke_local(handler, request, attributes)
+        served.add_done_callback(lambda done: self._complete_local(key, done, response_class))
+        future.add_done_callback(lambda done: self._on_local_done(key, served, done))
+        return future
+
+    def _complete_local(self, key, served: Future, response_class: Type[Message]):
+        with self._lock:
+            future = self._pending.pop(key, None)
+        if future is None or not future.set_running_or_notify_cancel():
+            return
+        exception = served.exception()
+        if exception is not None:
+            future.set_exception(exception)
+        elif response_class is not None and not isinstance(served.result(), response_class):
+            response_type = served.result().DESCRIPTOR.full_name
+            future.set_exception(
+                RuntimeError(f"Unknown payload type [{response_type}]. Expected [{response_class.__name__}]")
+            )
+        else:
+            future.set_result(served.result())
+
+    @staticmethod
+    def _map_response(message_future: Future, response_class: Type[Message]) -> Future:
+        future = Future()
+
+        def handle_response(done: Future):
+            if not future.set_running_or_notify_cancel():
+                return
+            if done.exception() is not None:
+                future.set_exception(done.exception())
+                return
+            message = done.result()
+            if RpcMapper.is_failure_response(message):
+                status = RpcMapper.to_status(message)
+                if status is None:
+                    status = UStatus(code=message.attributes.commstatus, message="Server returned a null payload.")
+                future.set_exception(RpcMapper.to_exception(status.code, status.message))
+                return
+            value = message.payload.value
+            try:
+                response = TypeRegistry.default().unpack(value, response_class)
+            except Exception as e:
+                future.set_exception(e)
+                return
+            if response is None:
+                future.set_exception(
+                    RuntimeError(
+                        f"Unknown payload type [{TypeRegistry.type_url_of(value)}]. "
+                        f"Expected [{response_class.__name__}]"
+                    )
+                )
+            else:
+                future.set_result(response)
+
+        message_future.add_done_callback(handle_response)
+        return future
+
+    def invoke_streaming(
+        self, method_uri: UUri, request_payload: UPayload, options: CallOptions, max_buffered: int = 16
+    ) -> ResponseStream:
+        """
+        Invoke a server-streaming RPC method.<br><br>
+        @param method_uri:The method URI to be invoked.
+        @param request_payload:The request message to be sent to the server.
+        @param options:RPC method invocation call options, the ttl bounds the wait for each response.
+        @param max_buffered:The maximum number of responses buffered before the delivery of the next ones is
+        blocked.
+        @return:Returns the ResponseStream of the response messages.
+        """
+        options = Deadline.call_options(options)
+        idle_timeout = options.ttl / 1000 if options.ttl > 0 else None
+        validation = UriValidator.validate_rpc_method(method_uri)
+        if validation.is_failure():
+            stream = ResponseStream(max_buffered, idle_timeout)
+            stream.put(UMessageBuilder.status(UCode.INVALID_ARGUMENT, validation.get_message()))
+            return stream
+        if options.ttl <= 0 and Deadline.current() is not None:
+            stream = ResponseStream(max_buffered, idle_timeout)
+            stream.put(UMessageBuilder.status(UCode.DEADLINE_EXCEEDED, "Deadline exceeded."))
+            return stream
+
+        request = UMessageBuilder.request(self.source, method_uri, options, request_payload)
+        reqid = request.attributes.id
+        key = (reqid.msb, reqid.lsb)
+        stream = ResponseStream(max_buffered, idle_timeout, lambda: self._on_stream_closed(key, request.attributes))
+        with self._lock:
+            self._pending[key] = stream
+
+        status = self.transport.send(request)
+        if status.code != UCode.OK:
+            stream.put(UMessageBuilder.status(status.code, status.message, reqid))
+        return stream
+
+    def pending(self) -> int:
+        """
+        Get the number of requests waiting for a response.<br><br>
+        @return:Returns the number of pending requests.
+        """
+        with self._lock:
+            return len(self._pending)
+
+    def close(self):
+        """
+        Unregister the response listener and stop the timeout thread. Pending requests are not completed and
+        open response streams are closed.
+        """
+        self.transport.unregister_listener(self.source, self._listener)
+        with self._lock:
+            self._closed = True
+            self._timeouts_changed.notify()
+            streams = [pending for pending in self._pending.values() if isinstance(pending, ResponseStream)]
+        for stream in streams:
+            stream.close()
+
+    def _on_response(self, message: UMessage):
+        attributes = message.attributes
+        if attributes.type != UMessageType.UMESSAGE_TYPE_RESPONSE:
+            return
+        key = (attributes.reqid.msb, attributes.reqid.lsb)
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is None:
+                return
+            if not isinstance(pending, ResponseStream) or attributes.HasField("commstatus"):
+                del self._pending[key]
+        if isinstance(pending, ResponseStream):
+            # Blocks while the stream buffer is full, which is what slows the server down
+            pending.put(message)
+        else:
+            self._complete(pending, message)
+
+    def _on_done(self, key, attributes, future: Future):
+        if future.cancelled() and self._discard(key):
+            self.transport.send(UMessageBuilder.cancel(attributes))
+
+    def _on_local_done(self, key, served: Future, future: Future):
+        if future.cancelled() and self._discard(key):
+            # Skips the handler if the request is still waiting for its turn
+            served.cancel()
+
+    def _on_stream_closed(self, key, attributes):
+        # Still pending when the stream was not ended by the server
+        if self._discard(key):
+            self.transport.send(UMessageBuilder.cancel(attributes))
+
+    def _discard(self, key) -> bool:
+        with self._lock:
+            return self._pending.pop(key, None) is not None
+
+    @staticmethod
+    def _complete(future: Future, message: UMessage):
+        if future.set_running_or_notify_cancel():
+            future.set_result(message)
+
+    def _schedule_timeout(self, key, ttl: int):
+        # Called with the lock held. The timeouts of completed requests are left in the heap, they are dropped
+        # when they reach its top or when they make up most of it
+        if len(self._timeouts) > 2 * len(self._pending) + 64:
+            self._timeouts = [timeout for timeout in self._timeouts if timeout[1] in self._pending]
+            heapq.heapify(self._timeouts)
+        heapq.heappush(self._timeouts, (time.monotonic() + ttl / 1000, key))
+        if self._timeout_thread is None:
+            self._timeout_thread = threading.Thread(target=self._expire_requests, daemon=True)
+            self._timeout_thread.start()
+        elif self._timeouts[0][1] == key:
+            self._timeouts_changed.notify()
+
+    def _expire_requests(self):
+        while True:
+            with self._timeouts_changed:
+                if self._closed:
+                    return
+                if not self._timeouts:
+                    self._timeouts_changed.wait()
+                    continue
+                deadline, key = self._timeouts[0]
+                if key not in self._pending:
+                    heapq.heappop(self._timeouts)
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    self._timeouts_changed.wait(remaining)
+                    continue
+                heapq.heappop(self._timeouts)
+                future = self._pending.pop(key, None)
+            if isinstance(future, _LocalCall):
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(RpcMapper.to_exception(UCode.DEADLINE_EXCEEDED, "Request timed out."))
+            elif future is not None:
+                self._complete(
+                    future,
+                    UMessageBuilder.status(UCode.DEADLINE_EXCEEDED, "Request timed out.", UUID(msb=key[0], lsb=key[1])),
+                )
@@ -0,0 +1,412 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import threading
+import time
+import weakref
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from functools import partial
+from typing import Optional, Tuple, Type, Union
+
+from google.protobuf.message import Message
+
+from uprotocol.proto.uattributes_pb2 import UAttributes, UMessageType
+from uprotocol.proto.umessage_pb2 import UMessage
+from uprotocol.proto.upayload_pb2 import UPayload, UPayloadFormat
+from uprotocol.proto.uri_pb2 import UUri
+from uprotocol.proto.ustatus_pb2 import UCode, UStatus
+from uprotocol.rpc.admissioncontroller import AdmissionController
+from uprotocol.rpc.deadline import Deadline
+from uprotocol.rpc.messagehandler import MessageHandler
+from uprotocol.rpc.requesthandler import RequestHandler
+from uprotocol.rpc.rpcmapper import RpcMapper
+from uprotocol.rpc.streamhandler import StreamHandler
+from uprotocol.transport.builder.typeregistry import TypeRegistry
+from uprotocol.transport.builder.umessagebuilder import UMessageBuilder
+from uprotocol.transport.builder.upayloadbuilder import UPayloadBuilder
+from uprotocol.transport.ulistener import UListener
+from uprotocol.transport.utransport import UTransport
+from uprotocol.transport.validate.uattributesvalidator import Validators
+from uprotocol.uri.factory.urikey import UriKey
+from uprotocol.uri.validator.urivalidator import UriValidator
+from uprotocol.uuid.factory.uuidutils import UUIDUtils
+
+# MessageHandlers that co-located clients can call directly, per transport and serialized method URI
+_local_handlers = weakref.WeakKeyDictionary()
+_local_handlers_lock = threading.Lock()
+
+
+class _MessageRequestHandler(RequestHandler):
+    """
+    Serves the requests of remote clients with a MessageHandler.
+    """
+
+    def __init__(self, request_class: Type[Message], handler: MessageHandler):
+        self.request_class = request_class
+        self.handler = handler
+
+    def handle_request(self, request: UMessage) -> UPayload:
+        payload = request.payload
+        if payload.format == UPayloadFormat.UPAYLOAD_FORMAT_PROTOBUF_WRAPPED_IN_ANY:
+            # Unlike UPayloadBuilder.unpack(), the registry does not turn a request of another type into an empty one
+            message = TypeRegistry.default().unpack(payload.value, self.request_class)
+        else:
+            message = UPayloadBuilder.unpack(payload, self.request_class)
+        if message is None:
+            raise ValueError(f"Expected a {self.request_class.DESCRIPTOR.full_name} request.")
+        return UPayloadBuilder.pack_to_any(self.handler.handle_message(message, request.attributes))
+
+
+class _ActiveRequest:
+    __slots__ = ("source", "cancelled")
+
+    def __init__(self, source: UUri):
+        self.source = source
+        self.cancelled = False
+
+
+class _RequestListener(UListener):
+    def __init__(self, server: "InMemoryRpcServer", handler, target: Union[RequestHandler, StreamHandler]):
+        self.server = server
+        self.handler = handler
+        self.target = target
+
+    def on_receive(self, umsg: UMessage) -> None:
+        self.server._on_request(self.target, umsg)
+
+
+class InMemoryRpcServer:
+    """
+    Server side of RPC over any UTransport: registers a listener for each served method, hands the
+    requests to their RequestHandler and sends the responses back to the caller.<br>
+    Requests are validated with the UAttributes request validator and requests that already expired are
+    dropped. Handlers run on the transport thread unless an Executor is supplied.<br>
+    Server-streaming methods are served by a StreamHandler registered with register_stream_handler(): every
+    payload it produces is sent in its own response sharing the request id and the stream is ended by a response
+    carrying a commstatus attribute. Since sending blocks while the client is not consuming, stream handlers
+    always run off the transport thread, on the supplied Executor or on a thread pool owned by the server and shut
+    down by close().<br>
+    With an AdmissionController, requests to RequestHandlers are only dispatched once admitted and the requests
+    it rejects are answered with its UCode right away.<br>
+    Handlers run with the Deadline of their request as the current one, so the RPC calls they make are bounded
+    by the time the caller still waits.<br>
+    A MessageHandler registered with register_message_handler() also serves the clients sharing the transport of
+    the server without serialization: InMemoryRpcClient.invoke_message() finds it with local_handler() and
+    hands the request object to invoke_local(), which applies the same validation, expiration, admission and
+    deadline rules as for a request received from the transport.<br>
+    A client no longer waiting for a request sends a cancel notification (see UMessageBuilder.cancel()) to the
+    method: a request still waiting for its turn is then skipped, a stream stops at the next response and no
+    response is sent for a request whose handler was already running.
+    """
+
+    def __init__(
+        self, transport: UTransport, executor: Executor = None, admission_controller: AdmissionController = None
+    ):
+        """
+        @param transport:The UTransport the requests are received from and the responses sent to.
+        @param executor:Optional Executor used to run the handlers.
+        @param admission_controller:Optional AdmissionController deciding when requests are dispatched.
+        """
+        if transport is None:
+            raise ValueError("transport cannot be None.")
+        self.transport = transport
+        self.executor = executor
+        self.admission_controller = admission_controller
+        self._listeners = {}
+        self._active = {}
+        self._lock = threading.Lock()
+        self._stream_executor = executor
+        self._closed = False
+
+    def register_request_handler(self, method_uri: UUri, handler: Union[RequestHandler, StreamHandler]) -> UStatus:
+        """
+        Register the handler serving an RPC method.<br><br>
+        @param method_uri:The URI of the method.
+        @param handler:The RequestHandler called for each request.
+        @return:Returns UStatus with UCode.OK if the handler was registered.
+        """
+        return self._register(method_uri, handler, handler)
+
+    def _register(self, method_uri: UUri, handler, target: Union[RequestHandler, StreamHandler]) -> UStatus:
+        if handler is None:
+            return UStatus(code=UCode.INVALID_ARGUMENT, message="handler cannot be None.")
+        validation = UriValidator.validate_rpc_method(method_uri)
+        if validation.is_failure():
+            return UStatus(code=UCode.INVALID_ARGUMENT, message=validation.get_message())
+
+        key = UriKey.from_uri(method_uri)
+        with self._lock:
+            if key in self._listeners:
+                return UStatus(code=UCode.ALREADY_EXISTS, message="A handler is already registered for the method.")
+            listener = _RequestListener(self, handler, target)
+            status = self.transport.register_listener(method_uri, listener)
+            if status.code == UCode.OK:
+                self._listeners[key] = listener
+            return status
+
+    def register_stream_handler(self, method_uri: UUri, handler: StreamHandler) -> UStatus:
+        """
+        Register the handler serving a server-streaming RPC method.<br><br>
+        @param method_uri:The URI of the method.
+        @param handler:The StreamHandler called for each request.
+        @return:Returns UStatus with UCode.OK if the handler was registered.
+        """
+        return self.register_request_handler(method_uri, handler)
+
+    def register_message_handler(
+        self, method_uri: UUri, request_class: Type[Message], handler: MessageHandler
+    ) -> UStatus:
+        """
+        Register the handler serving an RPC method with message objects.<br><br>
+        @param method_uri:The URI of the method.
+        @param request_class:The class of the request messages of the method.
+        @param handler:The MessageHandler called for each request.
+        @return:Returns UStatus with UCode.OK if the handler was registered.
+        """
+        if request_class is None:
+            return UStatus(code=UCode.INVALID_ARGUMENT, message="request_class cannot be None.")
+        status = self._register(method_uri, handler, _MessageRequestHandler(request_class, handler))
+        if status.code == UCode.OK:
+            with _local_handlers_lock:
+                _local_handlers.setdefault(self.transport, {})[UriKey.from_uri(method_uri)] = (self, handler)
+        return status
+
+    @staticmethod
+    def local_handler(transport: UTransport, method_uri: UUri) -> Optional[Tuple["InMemoryRpcServer", MessageHandler]]:
+        """
+        Find the MessageHandler serving a method on a transport within this process.<br><br>
+        @param transport:The UTransport shared by the client and the server.
+        @param method_uri:The URI of the method.
+        @return:Returns the server and the handler of the method, None if the method is not served locally.
+        """
+        handlers = _local_handlers.get(transport)
+        return handlers.get(UriKey.from_uri(method_uri)) if handlers else None
+
+    def unregister_request_handler(
+        self, method_uri: UUri, handler: Union[RequestHandler, StreamHandler, MessageHandler]
+    ) -> UStatus:
+        """
+        Stop serving an RPC method.<br><br>
+        @param method_uri:The URI of the method.
+        @param handler:The RequestHandler, StreamHandler or MessageHandler that was registered for the method.
+        @return:Returns UStatus with UCode.OK if the handler was unregistered.
+        """
+        if method_uri is None:
+            return UStatus(code=UCode.INVALID_ARGUMENT, message="method_uri cannot be None.")
+        key = UriKey.from_uri(method_uri)
+        with self._lock:
+            listener = self._listeners.get(key)
+            if listener is None or listener.handler is not handler:
+                return UStatus(code=UCode.NOT_FOUND, message="Handler not registered for the method.")
+            del self._listeners[key]
+            if isinstance(listener.target, _MessageRequestHandler):
+                with _local_handlers_lock:
+                    _local_handlers.get(self.transport, {}).pop(key, None)
+            return self.transport.unregister_listener(method_uri, listener)
+
+    def close(self):
+        """
+        Stop serving: unregister the handlers of all the methods, stop the streams in progress at their next
+        response and shut down the thread pool the server created to run the stream handlers. An Executor
+        supplied to the server is left running.
+        """
+        with self._lock:
+            self._closed = True
+            listeners = list(self._listeners.items())
+            for active in self._active.values():
+                active.cancelled = True
+            owned = self._stream_executor if self._stream_executor is not self.executor else None
+            self._stream_executor = self.executor
+        for key, listener in listeners:
+            self.unregister_request_handler(key.to_uri(), listener.handler)
+        if owned is not None:
+            owned.shutdown()
+
+    def _on_request(self, handler: RequestHandler, request: UMessage):
+        attributes = request.attributes
+        if attributes.type == UMessageType.UMESSAGE_TYPE_NOTIFICATION and attributes.commstatus == UCode.CANCELLED:
+            self._cancel(attributes)
+            return
+        if attributes.type != UMessageType.UMESSAGE_TYPE_REQUEST:
+            return
+        validation = Validators.REQUEST.validator().validate(attributes)
+        if validation.is_failure():
+            self.transport.send(
+                UMessageBuilder.failed_response(attributes, UCode.INVALID_ARGUMENT, validation.get_message())
+            )
+            return
+        if UUIDUtils.is_expired(attributes):
+            # The caller already gave up on this request, a response would be dropped
+            return
+        key = (attributes.id.msb, attributes.id.lsb)
+        with self._lock:
+            self._active[key] = _ActiveRequest(attributes.source)
+        if isinstance(handler, StreamHandler):
+            executor = self._streaming_executor()
+            try:
+                if executor is None:
+                    raise RuntimeError("Server closed.")
+                executor.submit(self._dispatch_stream, handler, request)
+            except RuntimeError as e:
+                # Received while the server was closing
+                self._reject(attributes, UCode.UNAVAILABLE, str(e))
+        else:
+            self._admit(attributes, self._dispatch, handler, request, partial(self._reject, attributes))
+
+    def _reject(self, attributes: UAttributes, code: UCode, reason: str):
+        if self._untrack(attributes) is not None:
+            self.transport.send(UMessageBuilder.failed_response(attributes, code, reason))
+
+    def _cancel(self, notification: UAttributes):
+        with self._lock:
+            active = self._active.get((notification.reqid.msb, notification.reqid.lsb))
+            # Only the caller can cancel its request
+            if active is not None and active.source == notification.source:
+                active.cancelled = True
+
+    def _cancelled(self, attributes: UAttributes) -> bool:
+        active = self._active.get((attributes.id.msb, attributes.id.lsb))
+        return active is None or active.cancelled
+
+    def _untrack(self, attributes: UAttributes) -> Optional[_ActiveRequest]:
+        with self._lock:
+            return self._active.pop((attributes.id.msb, attributes.id.lsb), None)
+
+    def invoke_local(self, handler: MessageHandler, request: Message, attributes: UAttributes) -> Future:
+        """
+        Serve a request of a co-located client without serialization.<br><br>
+        @param handler:The MessageHandler returned by local_handler().
+        @param request:The request message.
+        @param attributes:The attributes of the request, built as for a request sent over the transport.
+        @return:Returns a Future completed with the response message, or with the exception built by
+        RpcMapper.to_exception() if the call fails.
+        """
+        future = Future()
+        validation = Validators.REQUEST.validator().validate(attributes)
+        if validation.is_failure():
+            future.set_exception(RpcMapper.to_exception(UCode.INVALID_ARGUMENT, validation.get_message()))
+        elif UUIDUtils.is_expired(attributes):
+            future.set_exception(RpcMapper.to_exception(UCode.DEADLINE_EXCEEDED, "Request expired."))
+        else:
+            self._admit(
+                attributes,
+                partial(self._dispatch_message, future, attributes),
+                handler,
+                request,
+                partial(self._reject_message, future),
+            )
+        return future
+
+    @staticmethod
+    def _reject_message(future: Future, code: UCode, reason: str):
+        # The caller may have cancelled the Future while the request was waiting for its turn
+        if future.set_running_or_notify_cancel():
+            future.set_exception(RpcMapper.to_exception(code, reason))
+
+    def _admit(self, attributes: UAttributes, dispatch, handler, request, reject):
+        if self.admission_controller is None:
+            self._execute(dispatch, handler, request)
+        else:
+            self.admission_controller.submit(
+                attributes, lambda: self._execute(self._admitted(dispatch), handler, request), reject
+            )
+
+    def _execute(self, dispatch, handler, request):
+        if self.executor is None:
+            dispatch(handler, request)
+        else:
+            self.executor.submit(dispatch, handler, request)
+
+    def _streaming_executor(self) -> Optional[Executor]:
+        if self._stream_executor is None:
+            with self._lock:
+                if self._stream_executor is None and not self._closed:
+                    self._stream_executor = ThreadPoolExecutor(thread_name_prefix="uprotocol-rpc-stream")
+        return self._stream_executor
+
+    def _dispatch_stream(self, handler: StreamHandler, request: UMessage):
+        attributes = request.attributes
+        responses = None
+        try:
+            if self._cancelled(attributes):
+                return
+            with Deadline.scope(Deadline.from_attributes(attributes)):
+                responses = iter(handler.handle_request(request))
+                for payload in responses:
+                    if self._cancelled(attributes):
+                        return
+                    status = self.transport.send(UMessageBuilder.response(attributes, payload))
+                    if status.code != UCode.OK:
+                        # The client is gone, stop producing
+                        return
+            end = UMessageBuilder.end_of_stream(attributes)
+        except Exception as e:
+            end = UMessageBuilder.failed_response(attributes, UCode.INTERNAL, str(e))
+        finally:
+            close = getattr(responses, "close", None)
+            if close is not None:
+                close()
+            active = self._untrack(attributes)
+        if active is not None and not active.cancelled:
+            self.transport.send(end)
+
+    def _admitted(self, dispatch):
+        def dispatch_admitted(handler, request):
+            start = time.monotonic()
+            served = True
+            try:
+                served = dispatch(handler, request)
+            finally:
+                # A request skipped because it was cancelled says nothing about the service time
+                self.admission_controller.release((time.monotonic() - start) * 1000 if served else None)
+
+        return dispatch_admitted
+
+    @staticmethod
+    def _dispatch_message(future: Future, attributes: UAttributes, handler: MessageHandler, request: Message) -> bool:
+        if not future.set_running_or_notify_cancel():
+            # Cancelled by the caller while waiting for its turn
+            return False
+        try:
+            with Deadline.scope(Deadline.from_attributes(attributes)):
+                response = handler.handle_message(request, attributes)
+        except Exception as e:
+            future.set_exception(RpcMapper.to_exception(UCode.INTERNAL, str(e)))
+        else:
+            future.set_result(response)
+        return True
+
+    def _dispatch(self, handler: RequestHandler, request: UMessage) -> bool:
+        if self._cancelled(request.attributes):
+            # Cancelled by the caller while waiting for its turn
+            self._untrack(request.attributes)
+            return False
+        try:
+            with Deadline.scope(Deadline.from_attributes(request.attributes)):
+                payload = handler.handle_request(request)
+            response = UMessageBuilder.response(request.attributes, payload)
+        except Exception as e:
+            response = UMessageBuilder.failed_response(request.attributes, UCode.INTERNAL, str(e))
+        active = self._untrack(request.attributes)
+        if active is not None and not active.cancelled:
+            self.transport.send(response)
+        return True
@@ -0,0 +1,46 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+from abc import ABC, abstractmethod
+
+from google.protobuf.message import Message
+
+from uprotocol.proto.uattributes_pb2 import UAttributes
+
+
+class MessageHandler(ABC):
+    """
+    Handler of the requests of an RPC method working on message objects rather than payloads. Clients sharing
+    the transport of the InMemoryRpcServer serving the method call it directly with their request object, without
+    encoding it, and get the response object back. Remote clients are served from the encoded payloads as
+    usual.
+    """
+
+    @abstractmethod
+    def handle_message(self, request: Message, attributes: UAttributes) -> Message:
+        """
+        Method called to handle an RPC request.<br><br>
+        @param request:The request message. A co-located caller passes its own object, it must not be modified.
+        @param attributes:The attributes of the request.
+        @return:Returns the response message. Raising an exception fails the call with UCode.INTERNAL.
+        """
+        pass
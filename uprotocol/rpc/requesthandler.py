@@ -0,0 +1,41 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+from abc import ABC, abstractmethod
+
+from uprotocol.proto.umessage_pb2 import UMessage
+from uprotocol.proto.upayload_pb2 import UPayload
+
+
+class RequestHandler(ABC):
+    """
+    Handler of the requests of an RPC method served by an InMemoryRpcServer.
+    """
+
+    @abstractmethod
+    def handle_request(self, request: UMessage) -> UPayload:
+        """
+        Method called to handle an RPC request.<br><br>
+        @param request:The request UMessage.
+        @return:Returns the response payload. Raising an exception fails the call with UCode.INTERNAL.
+        """
+        pass
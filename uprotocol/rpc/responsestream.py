@@ -0,0 +1,174 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Callable, Optional
+
+from uprotocol.proto.umessage_pb2 import UMessage
+from uprotocol.proto.ustatus_pb2 import UCode, UStatus
+from uprotocol.rpc.rpcmapper import RpcMapper
+
+
+class ResponseStream:
+    """
+    Responses of a server-streaming RPC call, consumed as an iterator or an async iterator of response
+    UMessages.<br>
+    At most max_buffered responses are queued: once the buffer is full the thread delivering the responses is
+    blocked until the consumer catches up, which in turn pauses the server. The stream ends with the response
+    carrying a commstatus attribute; iteration then stops, or raises a RuntimeError if the stream failed, and
+    status() returns the final UStatus. Waiting longer than idle_timeout for the next response, or for room in the
+    buffer, fails the stream with UCode.DEADLINE_EXCEEDED.<br>
+    A consumer stopping early must close() the stream, or use it as a context manager. The stream is also closed
+    when an iterator returned by iter() or aiter() is dropped before the end of the stream, for instance when
+    breaking out of a for loop.
+    """
+
+    def __init__(self, max_buffered: int = 16, idle_timeout: float = None, on_close: Callable[[], None] = None):
+        """
+        @param max_buffered:The maximum number of responses queued before the producer is blocked.
+        @param idle_timeout:The maximum time in seconds to wait for the next response, None to wait forever.
+        @param on_close:Callback called once when the stream ends or is closed by the consumer.
+        """
+        if max_buffered < 1:
+            raise ValueError("max_buffered must be positive.")
+        self.max_buffered = max_buffered
+        self.idle_timeout = idle_timeout
+        self._on_close = on_close
+        self._buffer = deque()
+        self._changed = threading.Condition()
+        self._status = None
+        self._closed = False
+
+    def put(self, message: UMessage) -> bool:
+        """
+        Deliver a response of the stream, blocking while the buffer is full, at most idle_timeout.<br><br>
+        @param message:The response UMessage.
+        @return:Returns false if the stream is closed and the response was dropped.
+        """
+        with self._changed:
+            deadline = None if self.idle_timeout is None else time.monotonic() + self.idle_timeout
+            while len(self._buffer) >= self.max_buffered and not self._closed:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._changed.wait(remaining)
+            if not self._closed and len(self._buffer) < self.max_buffered:
+                self._buffer.append(message)
+                self._changed.notify_all()
+                return True
+        if not self._closed:
+            # The consumer stopped reading without closing the stream
+            self._finish(UStatus(code=UCode.DEADLINE_EXCEEDED, message="Timed out waiting for the consumer."))
+        return False
+
+    def status(self) -> Optional[UStatus]:
+        """
+        Get the final status of the stream.<br><br>
+        @return:Returns the UStatus ending the stream, None while the stream is still open.
+        """
+        return self._status
+
+    def close(self):
+        """
+        Stop consuming the stream. Buffered and future responses are dropped and the producer is unblocked.
+        """
+        self._finish(UStatus(code=UCode.CANCELLED, message="Stream closed by the client."))
+
+    def _finish(self, status: UStatus):
+        with self._changed:
+            if self._closed:
+                return
+            self._closed = True
+            if self._status is None:
+                self._status = status
+            self._buffer.clear()
+            self._changed.notify_all()
+        if self._on_close is not None:
+            self._on_close()
+
+    def __enter__(self) -> "ResponseStream":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __iter__(self):
+        try:
+            while True:
+                message = self._next()
+                if message is None:
+                    return
+                yield message
+        finally:
+            self.close()
+
+    def __next__(self) -> UMessage:
+        message = self._next()
+        if message is None:
+            raise StopIteration
+        return message
+
+    async def __aiter__(self):
+        try:
+            while True:
+                message = await asyncio.get_running_loop().run_in_executor(None, self._next)
+                if message is None:
+                    return
+                yield message
+        finally:
+            self.close()
+
+    async def __anext__(self) -> UMessage:
+        message = await asyncio.get_running_loop().run_in_executor(None, self._next)
+        if message is None:
+            raise StopAsyncIteration
+        return message
+
+    def _next(self) -> Optional[UMessage]:
+        with self._changed:
+            deadline = None if self.idle_timeout is None else time.monotonic() + self.idle_timeout
+            while not self._buffer and not self._closed:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._changed.wait(remaining)
+            message = self._buffer.popleft() if self._buffer else None
+            self._changed.notify_all()
+
+        if message is None:
+            if self._status is None:
+                self._finish(UStatus(code=UCode.DEADLINE_EXCEEDED, message="Timed out waiting for the next response."))
+            return self._end()
+        if not message.attributes.HasField("commstatus"):
+            return message
+
+        status = RpcMapper.to_status(message)
+        self._finish(status if status is not None else UStatus(code=message.attributes.commstatus))
+        return self._end()
+
+    def _end(self) -> None:
+        if self._status.code not in (UCode.OK, UCode.CANCELLED):
+            raise RpcMapper.to_exception(self._status.code, self._status.message)
+        return None
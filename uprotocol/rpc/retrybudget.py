@@ -0,0 +1,74 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import threading
+
+
+class RetryBudget:
+    """
+    Budget capping the retries of RPC calls to a share of the traffic.<br>
+    Every call deposits ratio in the budget and every retry withdraws 1 from it, so that over time retries
+    cannot exceed ratio times the number of calls, plus the capacity of the budget which lets a few retries
+    through when the traffic is low. Unlike a fixed number of attempts per call, the budget keeps retries
+    from multiplying the load on a dependency that fails for every call. A single RetryBudget can be shared by
+    several clients to enforce a process-wide limit.
+    """
+
+    def __init__(self, ratio: float = 0.1, capacity: float = 10):
+        """
+        @param ratio:The share of the calls that may be retried.
+        @param capacity:The maximum balance of the budget, it starts full.
+        """
+        if ratio < 0:
+            raise ValueError("ratio cannot be negative.")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        self.ratio = ratio
+        self.capacity = capacity
+        self._balance = capacity
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        """
+        Record a call, which earns a fraction of a retry.
+        """
+        with self._lock:
+            self._balance = min(self.capacity, self._balance + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        """
+        Take one retry from the budget.<br><br>
+        @return:Returns true if the retry is allowed, false if the budget is exhausted.
+        """
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+    def balance(self) -> float:
+        """
+        Get the number of retries currently available.<br><br>
+        @return:Returns the balance of the budget.
+        """
+        with self._lock:
+            return self._balance
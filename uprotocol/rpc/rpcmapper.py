@@ -21,11 +21,11 @@ SPDX-License-Identifier: Apache-2.0
 """
 
 from concurrent.futures import Future
-
-from google.protobuf import any_pb2
+from typing import Optional
 
 from uprotocol.proto.ustatus_pb2 import UCode, UStatus
 from uprotocol.rpc.rpcresult import RpcResult
+from uprotocol.transport.builder.typeregistry import TypeRegistry
 
 
 class RpcMapper:
@@ -47,30 +47,30 @@ class RpcMapper:
         @param response_future:CompletableFuture&lt;UMessage&gt;
         response from uTransport.
         @param expected_cls:The class name of the declared expected
-        return type of the RPC method.
+        return type of the RPC method, None to resolve the class from
+        the type_url of the response using the TypeRegistry.
         @return:Returns a CompletableFuture containing the declared
         expected return type of the RPC method or an
         exception.
         """
         response_future: Future = Future()
+        expected_name = expected_cls.__name__ if expected_cls is not None else "a registered type"
 
         def handle_response(message):
             nonlocal response_future
             message = message.result()
             if not message or not message.HasField("payload"):
-                response_future.set_exception(
-                    RuntimeError(f"Server returned a null payload. Expected {expected_cls.__name__}")
-                )
+                response_future.set_exception(RuntimeError(f"Server returned a null payload. Expected {expected_name}"))
                 return response_future
             try:
-                any_message = any_pb2.Any()
-                any_message.ParseFromString(message.payload.value)
-                if any_message.Is(expected_cls.DESCRIPTOR):
-                    response_future.set_result(RpcMapper.unpack_payload(any_message, expected_cls))
+                value = message.payload.value
+                response = TypeRegistry.default().unpack(value, expected_cls)
+                if response is not None:
+                    response_future.set_result(response)
                 else:
                     response_future.set_exception(
                         RuntimeError(
-                            f"Unknown payload type [{any_message.type_url}]. Expected [{expected_cls.__name__}]"
+                            f"Unknown payload type [{TypeRegistry.type_url_of(value)}]. Expected [{expected_name}]"
                         )
                     )
 
@@ -103,23 +103,27 @@ class RpcMapper:
                 return RpcResult.failure(value=exception, message=str(exception))
 
             try:
-                any_message = any_pb2.Any()
-                any_message.ParseFromString(message.payload.value)
+                registry = TypeRegistry.default()
+                value = message.payload.value
+                response = registry.unpack(value, expected_cls)
 
-                if any_message.Is(expected_cls.DESCRIPTOR):
+                if response is not None:
                     if expected_cls == UStatus:
-                        return RpcMapper.calculate_status_result(any_message)
+                        return RpcMapper._status_result(response)
                     else:
-                        return RpcResult.success(RpcMapper.unpack_payload(any_message, expected_cls))
+                        return RpcResult.success(response)
+
+                status = registry.unpack(value, UStatus)
+                if status is not None:
+                    return RpcMapper._status_result(status)
 
-                if any_message.Is(UStatus.DESCRIPTOR):
-                    return RpcMapper.calculate_status_result(any_message)
+                type_url = registry.type_url_of(value)
             except Exception as e:
                 exception = RuntimeError(f"{str(e)} [{UStatus.__name__}]")
                 return RpcResult.failure(value=exception, message=str(exception))
 
             exception = RuntimeError(
-                f"Unknown payload type [{any_message.type_url}]. Expected [{expected_cls.DESCRIPTOR.full_name}]"
+                f"Unknown payload type [{type_url}]. Expected [{expected_cls.DESCRIPTOR.full_name}]"
             )
             return RpcResult.failure(value=exception, message=str(exception))
 
@@ -132,9 +136,54 @@ class RpcMapper:
         response_future.add_done_callback(callback_wrapper)
         return result
 
+    @staticmethod
+    def is_failure_response(message) -> bool:
+        """
+        Check if a response UMessage represents a failed RPC call. A response is a failure when it is missing,
+        has no payload, carries a commstatus other than OK or its payload is a UStatus with a code other than
+        OK.<br><br>
+        @param message:The response UMessage returned by the server.
+        @return:Returns true if the response represents a failure.
+        """
+        if not message or not message.HasField("payload"):
+            return True
+        if message.attributes.HasField("commstatus") and message.attributes.commstatus != UCode.OK:
+            return True
+        status = RpcMapper.to_status(message)
+        return status is not None and status.code != UCode.OK
+
+    @staticmethod
+    def to_status(message) -> Optional[UStatus]:
+        """
+        Read the UStatus carried by a response UMessage.<br><br>
+        @param message:The response UMessage returned by the server.
+        @return:Returns the UStatus packed in the payload of the response, None if the response has no payload or
+        its payload is not a UStatus.
+        """
+        if not message or not message.HasField("payload"):
+            return None
+        try:
+            return TypeRegistry.default().unpack(message.payload.value, UStatus)
+        except Exception:
+            return None
+
+    @staticmethod
+    def to_exception(code: UCode, reason: str = "") -> RuntimeError:
+        """
+        Build the exception a failed RPC call completes with when its result is a message rather than a
+        response UMessage.<br><br>
+        @param code:The code of the failure.
+        @param reason:The human readable reason of the failure.
+        @return:Returns a RuntimeError whose message ends with the name of the code.
+        """
+        return RuntimeError(f"{reason} [{UCode.Name(code)}]")
+
     @staticmethod
     def calculate_status_result(payload):
-        status = RpcMapper.unpack_payload(payload, UStatus)
+        return RpcMapper._status_result(RpcMapper.unpack_payload(payload, UStatus))
+
+    @staticmethod
+    def _status_result(status: UStatus):
         return RpcResult.success(status) if status.code == UCode.OK else RpcResult.failure(status)
 
     @staticmethod
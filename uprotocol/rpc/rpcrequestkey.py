@@ -0,0 +1,41 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+from typing import Optional, Tuple
+
+from uprotocol.proto.upayload_pb2 import UPayload
+from uprotocol.proto.uri_pb2 import UUri
+from uprotocol.uri.factory.urikey import UriKey
+
+
+def request_key(method_uri: UUri, request_payload: Optional[UPayload]) -> Tuple[UriKey, bytes]:
+    """
+    Build a hashable key identifying an RPC request by its method UUri and its serialized request payload.
+    Two requests with the same key are expected to produce the same response from an idempotent method.<br><br>
+    @param method_uri:The method URI to be invoked.
+    @param request_payload:The request payload to be sent to the server.
+    @return:Returns a tuple of the UriKey of the method URI and the serialized request payload.
+    """
+    return (
+        UriKey.from_uri(method_uri),
+        request_payload.SerializeToString() if request_payload is not None else b"",
+    )
@@ -0,0 +1,135 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import threading
+from concurrent.futures import Future
+
+from uprotocol.proto.uattributes_pb2 import CallOptions
+from uprotocol.proto.upayload_pb2 import UPayload
+from uprotocol.proto.uri_pb2 import UUri
+from uprotocol.rpc.rpcclient import RpcClient
+from uprotocol.rpc.rpcrequestkey import request_key
+
+
+class _Flight:
+    """
+    A request in flight and the Futures of the callers waiting for its response.
+    """
+
+    __slots__ = ("response_future", "callers", "waiting")
+
+    def __init__(self):
+        self.response_future = None
+        self.callers = []
+        self.waiting = 0
+
+
+class SingleFlightRpcClient(RpcClient):
+    """
+    RpcClient that coalesces identical concurrent requests.<br>
+    When a request with the same method UUri and the same serialized payload is already in flight, the caller
+    joins the pending request instead of sending another one, so a burst of identical calls results in a single
+    request on the wire. Every caller gets its own Future, completed with the same response message, which
+    callers must not mutate. Cancelling a Future only drops that caller; the request itself is cancelled once
+    every caller has cancelled.
+    """
+
+    def __init__(self, delegate: RpcClient):
+        """
+        @param delegate:The RpcClient used to send the requests.
+        """
+        if delegate is None:
+            raise ValueError("delegate cannot be None.")
+        self.delegate = delegate
+        self._in_flight = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def invoke_method(self, method_uri: UUri, request_payload: UPayload, options: CallOptions) -> Future:
+        key = request_key(method_uri, request_payload)
+        future = Future()
+        with self._lock:
+            flight = self._in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._in_flight[key] = flight
+            else:
+                self.coalesced += 1
+            flight.callers.append(future)
+            flight.waiting += 1
+        future.add_done_callback(lambda done: self._on_done(key, flight, done))
+        if not leader:
+            return future
+
+        try:
+            response_future = self.delegate.invoke_method(method_uri, request_payload, options)
+        except Exception as e:
+            self._complete(key, flight, None, e)
+            raise
+
+        with self._lock:
+            flight.response_future = response_future
+            # Every caller may have cancelled while the request was being sent
+            cancel = flight.waiting == 0
+        if cancel:
+            response_future.cancel()
+        response_future.add_done_callback(lambda completed: self._complete(key, flight, completed, None))
+        return future
+
+    def in_flight(self) -> int:
+        """
+        Get the number of distinct requests currently in flight.<br><br>
+        @return:Returns the number of requests waiting for a response.
+        """
+        with self._lock:
+            return len(self._in_flight)
+
+    def _on_done(self, key, flight: _Flight, future: Future):
+        if not future.cancelled():
+            return
+        with self._lock:
+            flight.waiting -= 1
+            if flight.waiting > 0:
+                return
+            if self._in_flight.get(key) is flight:
+                del self._in_flight[key]
+            response_future = flight.response_future
+        if response_future is not None:
+            response_future.cancel()
+
+    def _complete(self, key, flight: _Flight, completed: Future, error: Exception):
+        with self._lock:
+            if self._in_flight.get(key) is flight:
+                del self._in_flight[key]
+            callers = list(flight.callers)
+        for future in callers:
+            if completed is not None and completed.cancelled():
+                future.cancel()
+            elif not future.set_running_or_notify_cancel():
+                continue
+            elif error is not None:
+                future.set_exception(error)
+            elif completed.exception() is not None:
+                future.set_exception(completed.exception())
+            else:
+                future.set_result(completed.result())
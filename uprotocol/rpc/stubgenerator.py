@@ -0,0 +1,247 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import argparse
+import importlib
+import sys
+from concurrent.futures import Future
+from typing import Dict, Type
+
+from google.protobuf import message_factory
+from google.protobuf.descriptor import Descriptor, FileDescriptor, MethodDescriptor, ServiceDescriptor
+from google.protobuf.message import Message
+
+from uprotocol.proto.uattributes_pb2 import CallOptions
+from uprotocol.proto.uri_pb2 import UAuthority, UUri
+from uprotocol.rpc.rpcclient import RpcClient
+from uprotocol.rpc.rpcmapper import RpcMapper
+from uprotocol.transport.builder.upayloadbuilder import UPayloadBuilder
+from uprotocol.uri.factory.uentityfactory import UEntityFactory
+from uprotocol.uri.factory.uresourcebuilder import UResourceBuilder
+from uprotocol.uri.serializer.longuriserializer import LongUriSerializer
+from uprotocol.uri.serializer.microuriserializer import MicroUriSerializer
+
+
+class MethodStub:
+    """
+    Everything a stub needs to invoke one RPC method, computed once from its MethodDescriptor: the resolved
+    method UUri (names and ids), its long and micro serialized forms and the request and response classes.
+    """
+
+    def __init__(self, name: str, uri: UUri, request_class: Type[Message], response_class: Type[Message]):
+        self.name = name
+        self.uri = uri
+        self.request_class = request_class
+        self.response_class = response_class
+        self.long_uri = LongUriSerializer().serialize(uri)
+        self.micro_uri = MicroUriSerializer().serialize(uri)
+
+    @staticmethod
+    def from_descriptor(method: MethodDescriptor) -> "MethodStub":
+        """
+        Build the MethodStub of an RPC method.<br><br>
+        @param method:The MethodDescriptor of the method, read from the generated protobuf module.
+        @return:Returns the MethodStub of the method.
+        """
+        uri = UUri(
+            entity=UEntityFactory.from_proto(method.containing_service),
+            resource=UResourceBuilder.from_rpc_method(method),
+        )
+        return MethodStub(
+            method.name,
+            uri,
+            message_factory.GetMessageClass(method.input_type),
+            message_factory.GetMessageClass(method.output_type),
+        )
+
+    def with_authority(self, authority: UAuthority) -> "MethodStub":
+        """
+        Get the MethodStub of the same method served by a remote uE.<br><br>
+        @param authority:The UAuthority of the device hosting the service.
+        @return:Returns a MethodStub whose URIs include the authority.
+        """
+        uri = UUri()
+        uri.CopyFrom(self.uri)
+        uri.authority.CopyFrom(authority)
+        return MethodStub(self.name, uri, self.request_class, self.response_class)
+
+
+class RpcStub:
+    """
+    Base class of the typed client stubs produced by the StubGenerator. A stub invokes the methods of one
+    service through an RpcClient: each call only packs the request and invokes the precomputed method UUri, the
+    returned Future is mapped to the declared response class of the method.
+    """
+
+    METHODS: Dict[str, MethodStub] = {}
+
+    def __init__(self, rpc_client: RpcClient, authority: UAuthority = None, options: CallOptions = None):
+        """
+        @param rpc_client:The RpcClient used to invoke the methods.
+        @param authority:The UAuthority of the device hosting the service, None for a local service.
+        @param options:The CallOptions used by the calls that do not provide their own.
+        """
+        if rpc_client is None:
+            raise ValueError("rpc_client cannot be None.")
+        self.rpc_client = rpc_client
+        self.options = options if options is not None else CallOptions()
+        self.methods = (
+            self.METHODS
+            if authority is None
+            else {name: method.with_authority(authority) for name, method in self.METHODS.items()}
+        )
+
+    def _invoke(self, name: str, request: Message, options: CallOptions = None) -> Future:
+        method = self.methods[name]
+        future = self.rpc_client.invoke_method(
+            method.uri, UPayloadBuilder.pack_to_any(request), options if options is not None else self.options
+        )
+        return RpcMapper.map_response(future, method.response_class)
+
+
+class StubGenerator:
+    """
+    Generator of typed RpcStub classes from the ServiceDescriptor of a uService, either at runtime with
+    create_stub_class() or as the source code of a Python module with generate_module().
+    """
+
+    @staticmethod
+    def method_stubs(service_descriptor: ServiceDescriptor) -> Dict[str, MethodStub]:
+        """
+        Build the MethodStubs of all the methods of a service.<br><br>
+        @param service_descriptor:The ServiceDescriptor of the service.
+        @return:Returns the MethodStubs keyed by method name.
+        """
+        if service_descriptor is None:
+            raise ValueError("service_descriptor cannot be None.")
+        return {method.name: MethodStub.from_descriptor(method) for method in service_descriptor.methods}
+
+    @staticmethod
+    def create_stub_class(service_descriptor: ServiceDescriptor) -> Type[RpcStub]:
+        """
+        Create the stub class of a service at runtime. The class has one method per RPC method, named after it,
+        taking the request message and optional CallOptions and returning a Future of the response
+        message.<br><br>
+        @param service_descriptor:The ServiceDescriptor of the service.
+        @return:Returns the RpcStub subclass named after the service.
+        """
+        methods = StubGenerator.method_stubs(service_descriptor)
+        namespace = {"METHODS": methods, "__doc__": f"Client stub of the {service_descriptor.full_name} service."}
+        for name in methods:
+            namespace[name] = StubGenerator._stub_method(name)
+        return type(f"{service_descriptor.name}Stub", (RpcStub,), namespace)
+
+    @staticmethod
+    def _stub_method(name: str):
+        def invoke(self, request: Message, options: CallOptions = None) -> Future:
+            return self._invoke(name, request, options)
+
+        invoke.__name__ = name
+        return invoke
+
+    @staticmethod
+    def generate_module(service_descriptor: ServiceDescriptor) -> str:
+        """
+        Generate the source code of a module declaring the stub class of a service. The module imports the
+        generated protobuf module of the service so that request and response types are checked by type
+        checkers, and computes the MethodStubs once when it is imported.<br><br>
+        @param service_descriptor:The ServiceDescriptor of the service.
+        @return:Returns the source code of the module.
+        """
+        methods = StubGenerator.method_stubs(service_descriptor)
+        service_module = StubGenerator._module_name(service_descriptor.file)
+        modules = {service_module}
+        for method in methods.values():
+            modules.add(StubGenerator._module_name(method.request_class.DESCRIPTOR.file))
+            modules.add(StubGenerator._module_name(method.response_class.DESCRIPTOR.file))
+        aliases = {module: f"_pb{index}" for index, module in enumerate(sorted(modules))}
+
+        def type_name(clazz):
+            descriptor: Descriptor = clazz.DESCRIPTOR
+            package = descriptor.file.package
+            name = descriptor.full_name[len(package) + 1 :] if package else descriptor.full_name
+            return f"{aliases[StubGenerator._module_name(descriptor.file)]}.{name}"
+
+        lines = [
+            '"""',
+            f"Client stub of the {service_descriptor.full_name} service, generated by",
+            "uprotocol.rpc.stubgenerator. Do not edit.",
+            '"""',
+            "",
+            "from concurrent.futures import Future",
+            "",
+        ]
+        lines += [f"import {module} as {alias}" for module, alias in sorted(aliases.items(), key=lambda i: i[1])]
+        lines += [
+            "from uprotocol.proto.uattributes_pb2 import CallOptions",
+            "from uprotocol.rpc.stubgenerator import RpcStub, StubGenerator",
+            "",
+            "",
+            f"class {service_descriptor.name}Stub(RpcStub):",
+            "    METHODS = StubGenerator.method_stubs(",
+            f'        {aliases[service_module]}.DESCRIPTOR.services_by_name["{service_descriptor.name}"]',
+            "    )",
+        ]
+        for name, method in methods.items():
+            lines += [
+                "",
+                f"    def {name}(self, request: {type_name(method.request_class)}, options: CallOptions = None)"
+                " -> Future:",
+                '        """',
+                f"        Invoke {method.long_uri}, the Future is completed with a"
+                f" {method.response_class.DESCRIPTOR.full_name}.",
+                '        """',
+                f'        return self._invoke("{name}", request, options)',
+            ]
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _module_name(file_descriptor: FileDescriptor) -> str:
+        # protoc names the generated modules after the proto files, which this package installs under
+        # uprotocol.proto, e.g. core/utwin/v2/utwin.proto is uprotocol.proto.core.utwin.v2.utwin_pb2
+        base = file_descriptor.name[: -len(".proto")].replace("/", ".").replace("-", "_") + "_pb2"
+        candidates = [base] if base.startswith("uprotocol.") else [f"uprotocol.proto.{base}", base]
+        for candidate in candidates:
+            descriptor = getattr(sys.modules.get(candidate), "DESCRIPTOR", None)
+            if descriptor is not None and descriptor.name == file_descriptor.name:
+                return candidate
+        return candidates[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the client stub module of a uService.")
+    parser.add_argument("module", help="generated protobuf module, e.g. uprotocol.proto.core.utwin.v2.utwin_pb2")
+    parser.add_argument("service", help="name of the service in the module, e.g. uTwin")
+    parser.add_argument("--output", help="file the module is written to, printed when omitted")
+    args = parser.parse_args()
+
+    module = importlib.import_module(args.module)
+    source = StubGenerator.generate_module(module.DESCRIPTOR.services_by_name[args.service])
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(source)
+    else:
+        print(source, end="")
+
+
+if __name__ == "__main__":
+    main()
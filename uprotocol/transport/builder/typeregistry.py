@@ -0,0 +1,229 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import sys
+from typing import Optional, Tuple, Type
+
+from google.protobuf import descriptor_pool, message_factory
+from google.protobuf.message import DecodeError, Message
+
+TYPE_URL_PREFIX = "type.googleapis.com/"
+
+
+def _read_varint(view, pos: int) -> Tuple[int, int]:
+    result = 0
+    shift = 0
+    length = len(view)
+    while pos < length:
+        byte = view[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+        if shift >= 64:
+            break
+    raise DecodeError("Truncated or invalid varint.")
+
+
+def _encode_varint(value: int) -> bytes:
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def split_any(data) -> Tuple[memoryview, memoryview]:
+    """
+    Scan a serialized google.protobuf.Any once and locate its type_url and value fields without copying
+    them.<br><br>
+    @param data:The serialized Any message.
+    @return:Returns a tuple of memoryviews over the type_url and the value fields of the message.
+    """
+    view = memoryview(data)
+    type_url = view[0:0]
+    value = view[0:0]
+    pos = 0
+    length = len(view)
+    while pos < length:
+        tag, pos = _read_varint(view, pos)
+        field_number = tag >> 3
+        wire_type = tag & 0x7
+        if field_number == 0:
+            raise DecodeError("Invalid field number 0.")
+        if wire_type == 2:
+            size, pos = _read_varint(view, pos)
+            end = pos + size
+            if end > length:
+                raise DecodeError("Truncated message.")
+            if field_number == 1:
+                type_url = view[pos:end]
+            elif field_number == 2:
+                value = view[pos:end]
+            pos = end
+        elif wire_type == 0:
+            _, pos = _read_varint(view, pos)
+        elif wire_type == 1:
+            pos += 8
+        elif wire_type == 5:
+            pos += 4
+        else:
+            raise DecodeError(f"Unsupported wire type {wire_type}.")
+        if pos > length:
+            raise DecodeError("Truncated message.")
+    return type_url, value
+
+
+class TypeRegistry:
+    """
+    Registry that maps interned google.protobuf.Any type_url strings to message classes so that Any
+    wrapped payloads can be unpacked in a single pass: the serialized Any is scanned once to locate the
+    type_url and the value, the message class is found with a dictionary lookup and the value is parsed
+    once into the resolved class, without building an intermediate Any message.
+    """
+
+    _default = None
+
+    def __init__(self):
+        self._by_type_url = {}
+        self._by_name = {}
+        self._type_urls = {}
+
+    @staticmethod
+    def default() -> "TypeRegistry":
+        """
+        Get the process wide TypeRegistry shared by RpcMapper and UPayloadBuilder.<br><br>
+        @return:Returns the default TypeRegistry.
+        """
+        if TypeRegistry._default is None:
+            TypeRegistry._default = TypeRegistry()
+        return TypeRegistry._default
+
+    def register(self, clazz: Type[Message]) -> str:
+        """
+        Register a message class.<br><br>
+        @param clazz:The generated message class to register.
+        @return:Returns the interned type_url of the message class.
+        """
+        return self._register(clazz)[0]
+
+    def _register(self, clazz: Type[Message]) -> Tuple[str, bytes, bytes, bytes]:
+        entry = self._type_urls.get(clazz)
+        if entry is None:
+            full_name = clazz.DESCRIPTOR.full_name
+            type_url = sys.intern(TYPE_URL_PREFIX + full_name)
+            encoded = type_url.encode("utf-8")
+            # Serialized type_url field (tag, length and value) as written by Any.Pack()
+            prefix = b"\x0a" + _encode_varint(len(encoded)) + encoded
+            entry = (type_url, encoded, full_name.encode("utf-8"), prefix)
+            self._by_type_url[entry[1]] = clazz
+            self._by_name[entry[2]] = clazz
+            self._type_urls[clazz] = entry
+        return entry
+
+    def type_url(self, clazz: Type[Message]) -> str:
+        """
+        Get the type_url used when packing a message class into an Any.<br><br>
+        @param clazz:The message class.
+        @return:Returns the interned type_url of the message class.
+        """
+        return self.register(clazz)
+
+    def resolve(self, type_url) -> Optional[Type[Message]]:
+        """
+        Find the message class of a type_url. Types that were not registered are looked up by name in the
+        default descriptor pool and registered on success.<br><br>
+        @param type_url:The type_url as a str, bytes or memoryview.
+        @return:Returns the message class or None if the type is unknown.
+        """
+        if isinstance(type_url, str):
+            type_url = type_url.encode("utf-8")
+        clazz = self._by_type_url.get(type_url)
+        if clazz is not None:
+            return clazz
+
+        full_name = bytes(type_url).rpartition(b"/")[2]
+        clazz = self._by_name.get(full_name)
+        if clazz is None:
+            try:
+                descriptor = descriptor_pool.Default().FindMessageTypeByName(full_name.decode("utf-8"))
+                clazz = message_factory.GetMessageClass(descriptor)
+            except (KeyError, UnicodeDecodeError):
+                return None
+            self.register(clazz)
+        return clazz
+
+    def unpack(self, data, expected_cls: Type[Message] = None) -> Optional[Message]:
+        """
+        Unpack a serialized google.protobuf.Any into the message it wraps.<br><br>
+        @param data:The serialized Any message.
+        @param expected_cls:The class the packed message must be an instance of, None to resolve the class
+        from the type_url.
+        @return:Returns the unpacked message, or None if the packed type is unknown or does not match
+        expected_cls.
+        """
+        if expected_cls is not None:
+            _, expected_type_url, expected_name, prefix = self._type_urls.get(expected_cls) or self._register(
+                expected_cls
+            )
+            # Fast path for the layout produced by Any.Pack(): type_url field followed by the value field
+            length = len(data)
+            pos = len(prefix)
+            if length > pos + 1 and data[pos] == 0x12 and isinstance(data, bytes) and data.startswith(prefix):
+                size = data[pos + 1]
+                start = pos + 2
+                if size > 0x7F:
+                    size, start = _read_varint(data, pos + 1)
+                if start + size == length:
+                    message = expected_cls()
+                    message.ParseFromString(data[start:])
+                    return message
+
+        elif isinstance(data, bytes) and len(data) > 1 and data[0] == 0x0A and data[1] < 0x80:
+            # Fast path for the layout produced by Any.Pack(): resolve the class from the leading type_url
+            clazz = self._by_type_url.get(data[2 : 2 + data[1]])
+            if clazz is not None:
+                return self.unpack(data, clazz)
+
+        type_url, value = split_any(data)
+        if expected_cls is not None:
+            if type_url != expected_type_url and bytes(type_url).rpartition(b"/")[2] != expected_name:
+                return None
+            clazz = expected_cls
+        else:
+            clazz = self.resolve(type_url)
+            if clazz is None:
+                return None
+        message = clazz()
+        message.ParseFromString(value)
+        return message
+
+    @staticmethod
+    def type_url_of(data) -> str:
+        """
+        Read the type_url of a serialized google.protobuf.Any.<br><br>
+        @param data:The serialized Any message.
+        @return:Returns the type_url of the packed message.
+        """
+        return bytes(split_any(data)[0]).decode("utf-8")
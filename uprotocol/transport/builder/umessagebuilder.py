@@ -0,0 +1,131 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+from uprotocol.proto.uattributes_pb2 import (
+    CallOptions,
+    UAttributes,
+    UMessageType,
+    UPriority,
+)
+from uprotocol.proto.umessage_pb2 import UMessage
+from uprotocol.proto.upayload_pb2 import UPayload
+from uprotocol.proto.uri_pb2 import UUri
+from uprotocol.proto.ustatus_pb2 import UCode, UStatus
+from uprotocol.proto.uuid_pb2 import UUID
+from uprotocol.transport.builder.uattributesbuilder import UAttributesBuilder
+from uprotocol.transport.builder.upayloadbuilder import UPayloadBuilder
+
+
+class UMessageBuilder:
+    """
+    Builder for the UMessages exchanged by RPC clients and servers.
+    """
+
+    @staticmethod
+    def request(source: UUri, method: UUri, options: CallOptions, payload: UPayload = None) -> UMessage:
+        """
+        Build an RPC request message.
+        @param source   The response URI of the client sending the request.
+        @param method   The URI of the method to invoke.
+        @param options  The call options, the priority defaults to CS4 when not specified.
+        @param payload  The request payload.
+        @return Returns the request UMessage.
+        """
+        if options is None:
+            options = CallOptions()
+        priority = options.priority if options.priority != UPriority.UPRIORITY_UNSPECIFIED else UPriority.UPRIORITY_CS4
+        builder = UAttributesBuilder.request(source, method, priority, options.ttl)
+        if options.HasField("token"):
+            builder.with_token(options.token)
+        message = UMessage(attributes=builder.build())
+        if payload is not None:
+            message.payload.CopyFrom(payload)
+        return message
+
+    @staticmethod
+    def response(request: UAttributes, payload: UPayload = None) -> UMessage:
+        """
+        Build the response to an RPC request.
+        @param request  The attributes of the request being answered.
+        @param payload  The response payload.
+        @return Returns the response UMessage.
+        """
+        message = UMessage(attributes=UAttributesBuilder.response(request).build())
+        if payload is not None:
+            message.payload.CopyFrom(payload)
+        return message
+
+    @staticmethod
+    def failed_response(request: UAttributes, code: UCode, reason: str = "") -> UMessage:
+        """
+        Build the response to an RPC request that could not be served. The response carries the code in its
+        commstatus attribute and a UStatus payload.
+        @param request  The attributes of the request being answered.
+        @param code     The reason code of the failure.
+        @param reason   The human readable reason of the failure.
+        @return Returns the response UMessage.
+        """
+        attributes = UAttributesBuilder.response(request).with_comm_status(code).build()
+        return UMessage(attributes=attributes, payload=UPayloadBuilder.pack_to_any(UStatus(code=code, message=reason)))
+
+    @staticmethod
+    def end_of_stream(request: UAttributes) -> UMessage:
+        """
+        Build the message ending a stream of responses. Responses of a stream share the reqid of the request
+        and only the last one carries a commstatus attribute, UCode.OK for a stream that completed normally
+        (see failed_response() for a stream that failed).
+        @param request  The attributes of the request being answered.
+        @return Returns the response UMessage.
+        """
+        return UMessage(attributes=UAttributesBuilder.response(request).with_comm_status(UCode.OK).build())
+
+    @staticmethod
+    def cancel(request: UAttributes) -> UMessage:
+        """
+        Build the notification a client sends to the method of a request it no longer waits for. The
+        notification carries the id of the request in its reqid attribute and UCode.CANCELLED in its commstatus
+        attribute.
+        @param request  The attributes of the cancelled request.
+        @return Returns the notification UMessage.
+        """
+        attributes = (
+            UAttributesBuilder.notification(request.source, request.sink, request.priority)
+            .with_req_id(request.id)
+            .with_comm_status(UCode.CANCELLED)
+            .build()
+        )
+        return UMessage(attributes=attributes)
+
+    @staticmethod
+    def status(code: UCode, reason: str = "", reqid: UUID = None) -> UMessage:
+        """
+        Build a response message produced locally by a client, for example when a request times out before
+        the server answers.
+        @param code     The reason code of the failure.
+        @param reason   The human readable reason of the failure.
+        @param reqid    The id of the request the status relates to.
+        @return Returns a response UMessage carrying a UStatus payload.
+        """
+        attributes = UAttributes(type=UMessageType.UMESSAGE_TYPE_RESPONSE, commstatus=code)
+        if reqid is not None:
+            attributes.reqid.CopyFrom(reqid)
+        return UMessage(attributes=attributes, payload=UPayloadBuilder.pack_to_any(UStatus(code=code, message=reason)))
@@ -26,6 +26,7 @@ from google.protobuf.any_pb2 import Any
 from google.protobuf.message import Message
 
 from uprotocol.proto.upayload_pb2 import UPayload, UPayloadFormat
+from uprotocol.transport.builder.typeregistry import TypeRegistry
 
 
 class UPayloadBuilder:
@@ -56,26 +57,27 @@ class UPayloadBuilder:
         )
 
     @staticmethod
-    def unpack(payload: UPayload, clazz: Type[Message]) -> Optional[Message]:
+    def unpack(payload: UPayload, clazz: Optional[Type[Message]] = None) -> Optional[Message]:
         """
         Unpack a uPayload into a google.protobuf.Message.
         @param payload the payload to unpack
-        @param clazz the class of the message to unpack
-        @return the unpacked message
+        @param clazz the class of the message to unpack, for payloads wrapped in Any it can be None to resolve
+        the class from the type_url using the TypeRegistry
+        @return the unpacked message or None if the payload could not be unpacked. As with Any.Unpack(), a
+        payload wrapping a message of another type than clazz unpacks into an empty clazz message
         """
         if payload is None or payload.value is None:
             return None
         try:
             if payload.format == UPayloadFormat.UPAYLOAD_FORMAT_PROTOBUF:
+                if clazz is None:
+                    return None
                 message = clazz()
                 message.ParseFromString(payload.value)
                 return message
             elif payload.format == UPayloadFormat.UPAYLOAD_FORMAT_PROTOBUF_WRAPPED_IN_ANY:
-                any_message = Any()
-                any_message.ParseFromString(payload.value)
-                message = clazz()
-                any_message.Unpack(message)
-                return message
+                message = TypeRegistry.default().unpack(payload.value, clazz)
+                return clazz() if message is None and clazz is not None else message
             else:
                 return None
         except Exception:
@@ -0,0 +1,92 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import threading
+from concurrent.futures import Executor
+
+from uprotocol.proto.umessage_pb2 import UMessage
+from uprotocol.proto.uri_pb2 import UUri
+from uprotocol.proto.ustatus_pb2 import UCode, UStatus
+from uprotocol.transport.ulistener import UListener
+from uprotocol.transport.utransport import UTransport
+from uprotocol.uri.factory.urikey import UriKey
+
+
+class LoopbackUTransport(UTransport):
+    """
+    UTransport that delivers messages to listeners registered in the same process.<br>
+    A message is delivered to the listeners registered for its sink, or for its source when it has no sink
+    (publish). Listeners are called on the sending thread unless an Executor is supplied.
+    """
+
+    def __init__(self, executor: Executor = None):
+        """
+        @param executor:Optional Executor used to call the listeners, None to call them on the sending thread.
+        """
+        self.executor = executor
+        self._listeners = {}
+        self._lock = threading.Lock()
+
+    def send(self, message: UMessage) -> UStatus:
+        if message is None:
+            return UStatus(code=UCode.INVALID_ARGUMENT, message="Message cannot be None.")
+        attributes = message.attributes
+        has_sink = attributes.HasField("sink")
+        topic = attributes.sink if has_sink else attributes.source
+        listeners = self._listeners.get(UriKey.from_uri(topic))
+        if not listeners:
+            if has_sink:
+                return UStatus(code=UCode.NOT_FOUND, message="No listener registered for the sink.")
+            return UStatus(code=UCode.OK)
+        for listener in listeners:
+            if self.executor is None:
+                listener.on_receive(message)
+            else:
+                self.executor.submit(listener.on_receive, message)
+        return UStatus(code=UCode.OK)
+
+    def register_listener(self, topic: UUri, listener: UListener) -> UStatus:
+        if topic is None or listener is None:
+            return UStatus(code=UCode.INVALID_ARGUMENT, message="Topic and listener cannot be None.")
+        key = UriKey.from_uri(topic)
+        with self._lock:
+            listeners = self._listeners.get(key, ())
+            if listener in listeners:
+                return UStatus(code=UCode.ALREADY_EXISTS, message="Listener already registered.")
+            # Listener tuples are replaced rather than mutated so that send() can iterate without locking
+            self._listeners[key] = listeners + (listener,)
+        return UStatus(code=UCode.OK)
+
+    def unregister_listener(self, topic: UUri, listener: UListener) -> UStatus:
+        if topic is None or listener is None:
+            return UStatus(code=UCode.INVALID_ARGUMENT, message="Topic and listener cannot be None.")
+        key = UriKey.from_uri(topic)
+        with self._lock:
+            listeners = self._listeners.get(key, ())
+            if listener not in listeners:
+                return UStatus(code=UCode.NOT_FOUND, message="Listener not registered.")
+            remaining = tuple(registered for registered in listeners if registered is not listener)
+            if remaining:
+                self._listeners[key] = remaining
+            else:
+                del self._listeners[key]
+        return UStatus(code=UCode.OK)
@@ -29,11 +29,15 @@ from uprotocol.proto.uattributes_pb2 import (
     UMessageType,
     UPriority,
 )
-from uprotocol.proto.uri_pb2 import UUri
+from uprotocol.uri.validator.uriproperties import UriProperties, UriPropertiesCache
 from uprotocol.uri.validator.urivalidator import UriValidator
 from uprotocol.uuid.factory.uuidutils import UUIDUtils
 from uprotocol.validation.validationresult import ValidationResult
 
+_uri_properties = UriPropertiesCache()
+_VALID_RPC_METHOD = UriProperties.VALID | UriProperties.RPC_METHOD
+_VALID_RPC_RESPONSE = UriProperties.VALID | UriProperties.RPC_RESPONSE
+
 
 class UAttributesValidator:
     """
@@ -141,7 +145,9 @@ class UAttributesValidator:
         @return:Returns a  ValidationResult that is success or
         failed with a failure message.
         """
-        return UriValidator.validate(attr.sink) if attr.HasField("sink") else ValidationResult.success()
+        if not attr.HasField("sink") or _uri_properties.check(attr.sink, UriProperties.VALID):
+            return ValidationResult.success()
+        return UriValidator.validate(attr.sink)
 
     @staticmethod
     def validate_priority(attr: UAttributes):
@@ -274,11 +280,11 @@ class Request(UAttributesValidator):
         @return:Returns a  ValidationResult that is success or
         failed with a failure message.
         """
-        return (
-            UriValidator.validate_rpc_method(attributes_value.sink)
-            if attributes_value.HasField("sink")
-            else ValidationResult.failure("Missing Sink")
-        )
+        if not attributes_value.HasField("sink"):
+            return ValidationResult.failure("Missing Sink")
+        if _uri_properties.check(attributes_value.sink, _VALID_RPC_METHOD):
+            return ValidationResult.success()
+        return UriValidator.validate_rpc_method(attributes_value.sink)
 
     def validate_ttl(self, attributes_value: UAttributes) -> ValidationResult:
         """
@@ -329,10 +335,14 @@ class Response(UAttributesValidator):
         @return:Returns a  ValidationResult that is success or failed
         with a failure message.
         """
-        if not attributes_value.HasField("sink") or attributes_value.sink == UUri():
+        if not attributes_value.HasField("sink"):
             return ValidationResult.failure("Missing Sink")
-        result = UriValidator.validate_rpc_response(attributes_value.sink)
-        return result
+        properties = _uri_properties.get(attributes_value.sink)
+        if properties & UriProperties.EMPTY:
+            return ValidationResult.failure("Missing Sink")
+        if properties & _VALID_RPC_RESPONSE == _VALID_RPC_RESPONSE:
+            return ValidationResult.success()
+        return UriValidator.validate_rpc_response(attributes_value.sink)
 
     def validate_req_id(self, attributes_value: UAttributes) -> ValidationResult:
         """
@@ -386,7 +396,7 @@ class Notification(UAttributesValidator):
         """
         if attributes_value is None:
             return ValidationResult.failure("UAttributes cannot be null.")
-        if not attributes_value.HasField("sink") or attributes_value.sink == UUri():
+        if not attributes_value.HasField("sink") or _uri_properties.get(attributes_value.sink) & UriProperties.EMPTY:
             return ValidationResult.failure("Missing Sink")
         return ValidationResult.success()
 
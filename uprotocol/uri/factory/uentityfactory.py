@@ -20,6 +20,8 @@ SPDX-FileType: SOURCE
 SPDX-License-Identifier: Apache-2.0
 """
 
+from typing import Dict
+
 from google.protobuf.descriptor import ServiceDescriptor
 from google.protobuf.descriptor_pb2 import ServiceOptions
 
@@ -31,6 +33,9 @@ from uprotocol.proto.uprotocol_options_pb2 import (
 )
 from uprotocol.proto.uri_pb2 import UEntity
 
+# Descriptors live as long as their pool, the options of a service are read once
+_entities: Dict[ServiceDescriptor, UEntity] = {}
+
 
 class UEntityFactory:
     """
@@ -42,6 +47,15 @@ class UEntityFactory:
         if service_descriptor is None:
             return UEntity()
 
+        cached = _entities.get(service_descriptor)
+        if cached is None:
+            cached = _entities.setdefault(service_descriptor, UEntityFactory._build(service_descriptor))
+        uentity = UEntity()
+        uentity.MergeFrom(cached)
+        return uentity
+
+    @staticmethod
+    def _build(service_descriptor: ServiceDescriptor) -> UEntity:
         options: ServiceOptions = service_descriptor.GetOptions()
 
         name_ext: str = options.Extensions[name]
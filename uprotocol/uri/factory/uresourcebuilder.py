@@ -20,13 +20,17 @@ SPDX-FileType: SOURCE
 SPDX-License-Identifier: Apache-2.0
 """
 
-import re
 from typing import Union
 
-from multimethod import multimethod
+from google.protobuf.descriptor import MethodDescriptor
 
+from uprotocol.proto import uprotocol_options_pb2
 from uprotocol.proto.uri_pb2 import UResource
 
+# Method options extension holding the id of an RPC method, looked up by name since older options files do not
+# declare it
+_METHOD_ID = getattr(uprotocol_options_pb2, "method_id", None)
+
 
 class UResourceBuilder:
     MAX_RPC_ID = 1000
@@ -38,30 +42,43 @@ class UResourceBuilder:
     def for_rpc_response():
         return UResource(name="rpc", instance="response", id=0)
 
-    @multimethod
-    def for_rpc_request(method: Union[str, None], id: int = None):  # noqa: N805
-        uresource = UResource(name="rpc")
-        if method is not None:
-            uresource.instance = method
-        if id is not None:
-            uresource.id = id
-
-        return uresource
-
-    @multimethod
-    def for_rpc_request(id: int):  # noqa: N805
-        return UResourceBuilder.for_rpc_request(None, id)  # noqa: N805
+    @staticmethod
+    def for_rpc_request(method: Union[str, int, None] = None, id: int = None):
+        """
+        Build the UResource of an RPC method.<br><br>
+        @param method:The name of the method, or its id when it is the only argument.
+        @param id:The id of the method.
+        @return:Returns the UResource of the RPC method.
+        """
+        if isinstance(method, int):
+            method, id = None, method
+        return UResource(name="rpc", instance=method, id=id)
 
     @staticmethod
     def from_id(id):
         if id is None:
             raise ValueError("id cannot be None")
 
-        return (
-            UResourceBuilder.for_rpc_response()
-            if id == 0
-            else (UResourceBuilder.for_rpc_request(id) if id < UResourceBuilder.MIN_TOPIC_ID else UResource(id=id))
-        )
+        if id == 0:
+            return UResource(name="rpc", instance="response", id=0)
+        # Negative ids are rejected by the UResource, the same as any id out of range
+        if 0 < id < UResourceBuilder.MIN_TOPIC_ID:
+            return UResource(name="rpc", id=id)
+        return UResource(id=id)
+
+    @staticmethod
+    def from_rpc_method(method: MethodDescriptor) -> UResource:
+        """
+        Build the UResource of an RPC method declared in protos.<br><br>
+        @param method:The MethodDescriptor of the method, read from the generated protobuf module.
+        @return:Returns the UResource of the RPC method, with the id of its method_id option when it declares one.
+        """
+        if method is None:
+            raise ValueError("method cannot be None.")
+        method_id = method.GetOptions().Extensions[_METHOD_ID] if _METHOD_ID is not None else 0
+        if method_id:
+            return UResourceBuilder.for_rpc_request(method.name, method_id)
+        return UResourceBuilder.for_rpc_request(method.name)
 
     @staticmethod
     def from_uservice_topic(topic):
@@ -73,12 +90,9 @@ class UResourceBuilder:
         """
         if topic is None:
             raise ValueError("topic cannot be None.")
-        name_and_instance_parts = re.split(r"[\\.]", topic.name)
+        # The name and the instance of the resource are separated by a dot or a backslash
+        name_and_instance_parts = topic.name.replace("\\", ".").split(".", 2)
         resource_name = name_and_instance_parts[0]
         resource_instance = None if len(name_and_instance_parts) <= 1 else name_and_instance_parts[1]
 
-        resource = UResource(name=resource_name, id=topic.id, message=topic.message)
-        if resource_instance is not None:
-            resource.instance = resource_instance
-
-        return resource
+        return UResource(name=resource_name, instance=resource_instance, id=topic.id, message=topic.message)
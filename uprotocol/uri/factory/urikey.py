@@ -0,0 +1,75 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+from uprotocol.proto.uri_pb2 import UUri
+from uprotocol.uri.serializer.longuriserializer import LongUriSerializer
+from uprotocol.uri.serializer.microuriserializer import MicroUriSerializer
+
+
+class UriKey(bytes):
+    """
+    Immutable and hashable key identifying a UUri, to index dictionaries by URI since UUri messages are not
+    hashable.<br>
+    A UriKey holds the protobuf encoding of the UUri: deriving it takes a single SerializeToString() call, and it
+    is hashed and compared as bytes. Two equal UUris have the same key. It converts back to the UUri and to the
+    micro form.
+    """
+
+    __slots__ = ()
+
+    @staticmethod
+    def from_uri(uri: UUri) -> "UriKey":
+        """
+        Get the key of a UUri.<br><br>
+        @param uri:The UUri, None is keyed like an empty UUri.
+        @return:Returns the UriKey of the UUri.
+        """
+        return UriKey(uri.SerializeToString()) if uri is not None else _EMPTY
+
+    @staticmethod
+    def from_micro(micro_uri: bytes) -> "UriKey":
+        """
+        Get the key of a micro form URI.<br><br>
+        @param micro_uri:The micro form URI.
+        @return:Returns the UriKey of the deserialized UUri, the key of an empty UUri if the micro URI is invalid.
+        """
+        return UriKey.from_uri(MicroUriSerializer().deserialize(micro_uri))
+
+    def to_uri(self) -> UUri:
+        """
+        Rebuild the UUri of this key.<br><br>
+        @return:Returns a new UUri equal to the one the key was derived from.
+        """
+        return UUri.FromString(self)
+
+    def to_micro(self) -> bytes:
+        """
+        Serialize the UUri of this key in micro form.<br><br>
+        @return:Returns the micro form URI, empty if the UUri cannot be serialized in micro form.
+        """
+        return bytes(MicroUriSerializer().serialize(self.to_uri()))
+
+    def __repr__(self):
+        return f"UriKey({LongUriSerializer().serialize(self.to_uri())!r})"
+
+
+_EMPTY = UriKey()
@@ -0,0 +1,124 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import threading
+from typing import Dict, Union
+
+from uprotocol.proto.uri_pb2 import UAuthority, UEntity, UUri
+from uprotocol.uri.factory.urikey import UriKey
+
+
+class _Entry:
+    """
+    A canonical instance and the number of times it was interned and not released yet.
+    """
+
+    __slots__ = ("value", "references")
+
+    def __init__(self, value):
+        self.value = value
+        self.references = 0
+
+
+class UriPool:
+    """
+    Interning pool canonicalizing URIs, so that the many identical URIs of large routing and subscription
+    tables share a single instance and can be compared by identity.<br>
+    intern() returns the canonical instance of a UUri, UEntity or UAuthority equal to the given one, and
+    intern_key() the canonical UriKey of a UUri. Interned messages are shared and must not be modified.<br>
+    Neither protobuf messages nor UriKeys support weak references, so the pool counts its references
+    explicitly: every intern() or intern_key() call is balanced by a release() or release_key() call once the
+    caller drops the instance, typically when a route is removed from a table, and an instance is dropped from
+    the pool when its last reference is released.
+    """
+
+    def __init__(self):
+        self._tables: Dict[type, Dict[Union[bytes, UriKey], _Entry]] = {
+            UUri: {},
+            UEntity: {},
+            UAuthority: {},
+            UriKey: {},
+        }
+        self._lock = threading.Lock()
+
+    def intern(self, message: Union[UUri, UEntity, UAuthority]) -> Union[UUri, UEntity, UAuthority]:
+        """
+        Get the canonical instance of a URI message and take a reference on it.<br><br>
+        @param message:The UUri, UEntity or UAuthority.
+        @return:Returns the interned instance equal to the message, the message itself the first time it is seen.
+        """
+        return self._intern(self._message_table(message), message.SerializeToString(), message)
+
+    def intern_key(self, uri: Union[UUri, UriKey]) -> UriKey:
+        """
+        Get the canonical UriKey of a URI and take a reference on it.<br><br>
+        @param uri:The UUri, or a UriKey.
+        @return:Returns the interned UriKey, shared by all the callers interning an equal URI.
+        """
+        key = uri if isinstance(uri, UriKey) else UriKey.from_uri(uri)
+        return self._intern(self._tables[UriKey], key, key)
+
+    def release(self, message: Union[UUri, UEntity, UAuthority]) -> bool:
+        """
+        Release a reference taken by intern().<br><br>
+        @param message:The UUri, UEntity or UAuthority, or a message equal to it.
+        @return:Returns true if it was the last reference and the instance was dropped from the pool.
+        """
+        return self._release(self._message_table(message), message.SerializeToString())
+
+    def release_key(self, uri: Union[UUri, UriKey]) -> bool:
+        """
+        Release a reference taken by intern_key().<br><br>
+        @param uri:The UUri, or a UriKey.
+        @return:Returns true if it was the last reference and the UriKey was dropped from the pool.
+        """
+        return self._release(self._tables[UriKey], uri if isinstance(uri, UriKey) else UriKey.from_uri(uri))
+
+    def __len__(self):
+        return sum(len(table) for table in self._tables.values())
+
+    def _message_table(self, message) -> Dict[bytes, _Entry]:
+        if message is None:
+            raise ValueError("message cannot be None.")
+        table = self._tables.get(type(message))
+        if table is None or table is self._tables[UriKey]:
+            raise ValueError("Only UUri, UEntity and UAuthority messages can be interned.")
+        return table
+
+    def _intern(self, table: Dict[Union[bytes, UriKey], _Entry], key: Union[bytes, UriKey], value):
+        with self._lock:
+            entry = table.get(key)
+            if entry is None:
+                entry = table[key] = _Entry(value)
+            entry.references += 1
+            return entry.value
+
+    def _release(self, table: Dict[Union[bytes, UriKey], _Entry], key: Union[bytes, UriKey]) -> bool:
+        with self._lock:
+            entry = table.get(key)
+            if entry is None:
+                raise ValueError("The URI is not interned.")
+            entry.references -= 1
+            if entry.references > 0:
+                return False
+            del table[key]
+            return True
@@ -0,0 +1,156 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+from typing import Dict, List, Optional, Tuple, Union
+
+from google.protobuf.descriptor import FileDescriptor, ServiceDescriptor
+
+from uprotocol.proto.uprotocol_options_pb2 import notification_topic, publish_topic
+from uprotocol.proto.uri_pb2 import UEntity, UResource, UUri
+from uprotocol.uri.factory.uentityfactory import UEntityFactory
+from uprotocol.uri.factory.uresourcebuilder import UResourceBuilder
+
+
+class _ServiceIndex:
+    """
+    The UEntity of a service and its resources, indexed by name and instance and by id.
+    """
+
+    __slots__ = ("entity", "resources_by_name", "resources_by_id")
+
+    def __init__(self, entity: UEntity):
+        self.entity = entity
+        self.resources_by_name: Dict[Tuple[str, str], UResource] = {}
+        self.resources_by_id: Dict[int, UResource] = {}
+
+    def add(self, resource: UResource):
+        self.resources_by_name[(resource.name, resource.instance)] = resource
+        if resource.HasField("id"):
+            self.resources_by_id[resource.id] = resource
+
+
+class UriResolver:
+    """
+    Resolve the names and the ids of UUris from the uProtocol options of the services loaded from protos.<br>
+    Each registered service is indexed by its entity name and id (UEntityFactory.from_proto()), and its
+    resources by name and instance and by id: the publish and notification topics of the service
+    (UResourceBuilder.from_uservice_topic()), its RPC methods and the RPC response. resolve() then fills in the
+    missing half of a UUri, the ids of a long form UUri or the names of a micro form one, with dictionary
+    lookups, so that the UUri can be serialized in both forms. The authority is left as is.
+    """
+
+    def __init__(self):
+        self._by_name: Dict[Tuple[str, Optional[int]], _ServiceIndex] = {}
+        self._by_id: Dict[Tuple[int, Optional[int]], _ServiceIndex] = {}
+
+    def register_service(self, service_descriptor: ServiceDescriptor) -> UEntity:
+        """
+        Index a service and its resources.<br><br>
+        @param service_descriptor:The ServiceDescriptor of the service, read from the generated protobuf module.
+        @return:Returns the UEntity of the service.
+        """
+        if service_descriptor is None:
+            raise ValueError("service_descriptor cannot be None.")
+
+        index = _ServiceIndex(UEntityFactory.from_proto(service_descriptor))
+        options = service_descriptor.GetOptions()
+        for topic in list(options.Extensions[publish_topic]) + list(options.Extensions[notification_topic]):
+            index.add(UResourceBuilder.from_uservice_topic(topic))
+        for method in service_descriptor.methods:
+            index.add(UResourceBuilder.from_rpc_method(method))
+        index.add(UResourceBuilder.for_rpc_response())
+
+        self._add(self._by_name, index.entity.name, index)
+        self._add(self._by_id, index.entity.id, index)
+        return index.entity
+
+    def register_file(self, file_descriptor: FileDescriptor) -> List[UEntity]:
+        """
+        Index all the services of a proto file.<br><br>
+        @param file_descriptor:The FileDescriptor of the proto file, the DESCRIPTOR of the generated module.
+        @return:Returns the UEntities of the services.
+        """
+        if file_descriptor is None:
+            raise ValueError("file_descriptor cannot be None.")
+        return [self.register_service(service) for service in file_descriptor.services_by_name.values()]
+
+    def resolve(self, uri: UUri) -> UUri:
+        """
+        Fill in the missing names or ids of a UUri from the registered services.<br>
+        The entity is looked up by name, or by id when the name is missing, and by major version: a UUri without
+        major version resolves to the highest registered one. The resource is then looked up in the resources
+        of that service, by name and instance, or by id when the name is missing or unknown (micro form RPC
+        resources are named rpc without instance).<br><br>
+        @param uri:The UUri to resolve, it is not modified.
+        @return:Returns a copy of the UUri with the missing names and ids filled in as far as they are known.
+        UriValidator.is_resolved() tells whether the UUri was fully resolved.
+        """
+        if uri is None:
+            raise ValueError("uri cannot be None.")
+
+        resolved = UUri()
+        resolved.CopyFrom(uri)
+        entity = resolved.entity
+        version = entity.version_major if entity.version_major != 0 else None
+        if entity.name != "":
+            index = self._by_name.get((entity.name, version))
+        elif entity.HasField("id"):
+            index = self._by_id.get((entity.id, version))
+        else:
+            index = None
+        if index is None:
+            return resolved
+
+        if entity.name == "":
+            entity.name = index.entity.name
+        if not entity.HasField("id"):
+            entity.id = index.entity.id
+        if version is None:
+            entity.version_major = index.entity.version_major
+
+        if resolved.HasField("resource"):
+            resource = resolved.resource
+            known = index.resources_by_name.get((resource.name, resource.instance)) if resource.name != "" else None
+            if known is None and resource.HasField("id"):
+                known = index.resources_by_id.get(resource.id)
+            if known is not None:
+                UriResolver._fill(resource, known)
+        return resolved
+
+    @staticmethod
+    def _add(table: Dict[Tuple[Union[str, int], Optional[int]], _ServiceIndex], key, index: _ServiceIndex):
+        version = index.entity.version_major
+        table[(key, version)] = index
+        latest = table.get((key, None))
+        if latest is None or latest.entity.version_major <= version:
+            table[(key, None)] = index
+
+    @staticmethod
+    def _fill(resource: UResource, known: UResource):
+        if resource.name == "":
+            resource.name = known.name
+        if not resource.HasField("instance") and known.HasField("instance"):
+            resource.instance = known.instance
+        if not resource.HasField("message") and known.HasField("message"):
+            resource.message = known.message
+        if not resource.HasField("id") and known.HasField("id"):
+            resource.id = known.id
@@ -0,0 +1,148 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2024 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import threading
+from collections import OrderedDict
+
+from uprotocol.proto.uri_pb2 import UUri
+from uprotocol.uri.factory.urikey import UriKey
+from uprotocol.uri.serializer.uriserializer import UriSerializer
+
+
+class UriCacheStats:
+    """
+    Snapshot of the counters of a CachingUriSerializer.
+    """
+
+    def __init__(self, hits: int, misses: int, evictions: int, entries: int):
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+        self.entries = entries
+
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"UriCacheStats(hits={self.hits}, misses={self.misses}, evictions={self.evictions}, entries={self.entries})"
+        )
+
+
+class CachingUriSerializer(UriSerializer):
+    """
+    UriSerializer caching the results of another UriSerializer (long, short or micro) in a bounded least
+    recently used cache.<br>
+    Applications tend to serialize and deserialize the same few topics and methods over and over, a hit only
+    costs a dictionary lookup instead of parsing or formatting the URI. Long and short URIs are immutable
+    strings returned as is, while micro URIs (bytearray) and deserialized UUris are copied on every hit so
+    that callers are free to modify them. The cache is safe to share between threads.
+    """
+
+    def __init__(self, delegate: UriSerializer, max_entries: int = 1024):
+        """
+        @param delegate:The UriSerializer whose results are cached.
+        @param max_entries:The maximum number of URIs kept in each direction.
+        """
+        if delegate is None:
+            raise ValueError("delegate cannot be None.")
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive.")
+        self.delegate = delegate
+        self.max_entries = max_entries
+        self._uris = OrderedDict()
+        self._serialized = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def deserialize(self, uri) -> UUri:
+        """
+        Deserialize from the format to a UUri.<br><br>
+        @param uri:serialized UUri.
+        @return:Returns a UUri object from the serialized format from the wire, a copy of the cached one on a
+        hit.
+        """
+        if isinstance(uri, bytearray):
+            uri = bytes(uri)
+        elif not isinstance(uri, (str, bytes)):
+            return self.delegate.deserialize(uri)
+        cached = self._get(self._uris, uri)
+        if cached is None:
+            cached = self.delegate.deserialize(uri)
+            self._put(self._uris, uri, cached)
+        result = UUri()
+        result.CopyFrom(cached)
+        return result
+
+    def serialize(self, uri: UUri):
+        """
+        Serialize from a UUri to the format of the delegate.<br><br>
+        @param uri:UUri object to be serialized.
+        @return:Returns the UUri in the transport serialized format.
+        """
+        if uri is None:
+            return self.delegate.serialize(uri)
+        key = UriKey.from_uri(uri)
+        cached = self._get(self._serialized, key)
+        if cached is None:
+            cached = self.delegate.serialize(uri)
+            self._put(self._serialized, key, cached)
+        return bytearray(cached) if isinstance(cached, bytearray) else cached
+
+    def stats(self) -> UriCacheStats:
+        """
+        Get the counters of the cache.<br><br>
+        @return:Returns a snapshot of the UriCacheStats.
+        """
+        with self._lock:
+            return UriCacheStats(self._hits, self._misses, self._evictions, len(self._uris) + len(self._serialized))
+
+    def clear(self):
+        """
+        Drop every cached URI.
+        """
+        with self._lock:
+            self._uris.clear()
+            self._serialized.clear()
+
+    def _get(self, entries: OrderedDict, key):
+        with self._lock:
+            value = entries.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+            entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def _put(self, entries: OrderedDict, key, value):
+        if value is None:
+            return
+        with self._lock:
+            entries[key] = value
+            entries.move_to_end(key)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+                self._evictions += 1
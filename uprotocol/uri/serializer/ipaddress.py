@@ -21,28 +21,75 @@ SPDX-License-Identifier: Apache-2.0
 """
 
 import socket
+from functools import lru_cache
+from typing import Optional
+
+# Number of distinct addresses whose conversions are memoized, a node talks to a small set of authorities
+_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _pack(ip_address: str) -> Optional[bytes]:
+    # The family follows from the content: only IPv6 addresses contain ":", IPv4 addresses have 4 dotted parts
+    if ":" in ip_address:
+        family = socket.AF_INET6
+        if len(ip_address.split(":")) > 8:
+            return None
+    elif ip_address.count(".") == 3:
+        family = socket.AF_INET
+    else:
+        return None
+    try:
+        return socket.inet_pton(family, ip_address)
+    except (OSError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _unpack(packed_ip_address: bytes) -> Optional[str]:
+    # The family follows from the length
+    if len(packed_ip_address) == 4:
+        return socket.inet_ntop(socket.AF_INET, packed_ip_address)
+    if len(packed_ip_address) == 16:
+        return socket.inet_ntop(socket.AF_INET6, packed_ip_address)
+    return None
 
 
 class IpAddress:
+    @staticmethod
+    def pack(ip_address: str) -> Optional[bytes]:
+        """
+        Convert an IPv4 or IPv6 address to its packed form. Conversions are memoized.<br><br>
+        @param ip_address:The address in its standard string representation.
+        @return:Returns the 4 or 16 bytes of the address, None if the string is not an IP address.
+        """
+        if not ip_address:
+            return None
+        return _pack(ip_address)
+
+    @staticmethod
+    def unpack(packed_ip_address: bytes) -> Optional[str]:
+        """
+        Convert a packed IPv4 or IPv6 address to its standard string representation. Conversions are memoized.
+        <br><br>
+        @param packed_ip_address:The 4 bytes of an IPv4 address or the 16 bytes of an IPv6 address.
+        @return:Returns the address string, None if the length is not the one of an IP address.
+        """
+        if packed_ip_address is None:
+            return None
+        return _unpack(bytes(packed_ip_address))
+
     @staticmethod
     def to_bytes(ip_address):
         if ip_address is None or ip_address.strip() == "":
             return b""
 
-        if IpAddress.is_valid_ipv4_address(ip_address):
-            return IpAddress.convert_ipv4_to_byte_array(ip_address)
-        elif IpAddress.is_valid_ipv6_address(ip_address):
-            return IpAddress.convert_ipv6_to_byte_array(ip_address)
-        else:
-            return b""
+        packed = IpAddress.pack(ip_address)
+        return packed if packed is not None else b""
 
     @staticmethod
     def is_valid(ip_address):
-        return (
-            (ip_address is not None)
-            and not ip_address.strip() == ""
-            and (IpAddress.is_valid_ipv4_address(ip_address) or IpAddress.is_valid_ipv6_address(ip_address))
-        )
+        return ip_address is not None and ip_address.strip() != "" and IpAddress.pack(ip_address) is not None
 
     @staticmethod
     def is_valid_ipv4_address(ip_address):
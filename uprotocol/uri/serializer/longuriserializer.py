@@ -97,64 +97,57 @@ class LongUriSerializer(UriSerializer):
         @param u_protocol_uri:A long format uProtocol URI.
         @return:Returns an UUri data object.
         """
-        if u_protocol_uri is None or u_protocol_uri.strip() == "":
+        if u_protocol_uri is None or not u_protocol_uri or u_protocol_uri.isspace():
             return UUri()
-        uri = (
-            u_protocol_uri[u_protocol_uri.index(":") + 1 :]
-            if ":" in u_protocol_uri
-            else u_protocol_uri.replace("\\", "/")
-        )
-
-        is_local = not uri.startswith("//")
-        uri_parts = LongUriSerializer.remove_empty(uri.split("/"))
-        number_of_parts_in_uri = len(uri_parts)
-
-        if number_of_parts_in_uri == 0 or number_of_parts_in_uri == 1:
+        colon = u_protocol_uri.find(":")
+        uri = u_protocol_uri[colon + 1 :] if colon >= 0 else u_protocol_uri.replace("\\", "/")
+
+        # Trailing slashes delimit no part
+        end = len(uri)
+        while end > 0 and uri[end - 1] == "/":
+            end -= 1
+        slash = uri.find("/", 0, end)
+        if slash < 0:
             return UUri()
 
-        use_name = ""
-        use_version = ""
-        u_resource = None
-        u_authority = None
-
-        if is_local:
-            use_name = uri_parts[1]
-            if number_of_parts_in_uri > 2:
-                use_version = uri_parts[2]
-                if number_of_parts_in_uri > 3:
-                    u_resource = self.parse_from_string(uri_parts[3])
-
-        else:
-            if uri_parts[2].strip() == "":
+        authority = None
+        if uri.startswith("//"):
+            slash = uri.find("/", 2, end)
+            authority = uri[2:slash] if slash >= 0 else uri[2:end]
+            if not authority or authority.isspace():
                 return UUri()
-            u_authority = UAuthority(name=uri_parts[2])
-            if len(uri_parts) > 3:
-                use_name = uri_parts[3]
-                if number_of_parts_in_uri > 4:
-                    use_version = uri_parts[4]
-                    if number_of_parts_in_uri > 5:
-                        u_resource = self.parse_from_string(uri_parts[5])
+            if slash < 0:
+                return UUri(authority=UAuthority(name=authority))
+
+        # slash is the one before the entity name, each following one starts the next part
+        name_end = uri.find("/", slash + 1, end)
+        version = ""
+        new_uri = UUri()
+        if name_end < 0:
+            name = uri[slash + 1 : end]
+        else:
+            name = uri[slash + 1 : name_end]
+            version_end = uri.find("/", name_end + 1, end)
+            if version_end < 0:
+                version = uri[name_end + 1 : end]
             else:
-                return UUri(authority=u_authority)
-
-        use_version_int = None
-        try:
-            if use_version.strip() != "":
-                use_version_int = int(use_version)
-        except ValueError:
-            return UUri()
-
-        u_entity_builder = UEntity(name=use_name)
-        if use_version_int is not None:
-            u_entity_builder.version_major = use_version_int
-
-        new_uri = UUri(entity=u_entity_builder)
-        if u_authority is not None:
-            new_uri.authority.CopyFrom(u_authority)
-
-        if u_resource is not None:
-            new_uri.resource.CopyFrom(u_resource)
-
+                version = uri[name_end + 1 : version_end]
+                resource_end = uri.find("/", version_end + 1, end)
+                LongUriSerializer._parse_resource(
+                    new_uri.resource, uri[version_end + 1 : resource_end if resource_end >= 0 else end]
+                )
+
+        entity = new_uri.entity
+        entity.SetInParent()
+        entity.name = name
+        if version and not version.isspace():
+            try:
+                version_major = int(version)
+            except ValueError:
+                return UUri()
+            entity.version_major = version_major
+        if authority is not None:
+            new_uri.authority.name = authority
         return new_uri
 
     @staticmethod
@@ -165,27 +158,42 @@ class LongUriSerializer(UriSerializer):
         @param resource_string:String that contains the UResource information.
         @return:Returns a UResource object.
         """
-        if resource_string is None or resource_string.strip() == "":
-            raise ValueError("Resource must have a command name.")
-
-        parts = LongUriSerializer.remove_empty(resource_string.split("#"))
-        name_and_instance = parts[0]
+        u_resource = UResource()
+        LongUriSerializer._parse_resource(u_resource, resource_string)
+        return u_resource
 
-        name_and_instance_parts = LongUriSerializer.remove_empty(name_and_instance.split("."))
-        resource_name = name_and_instance_parts[0]
-        resource_instance = name_and_instance_parts[1] if len(name_and_instance_parts) > 1 else None
-        resource_message = parts[1] if len(parts) > 1 else None
+    @staticmethod
+    def _parse_resource(u_resource: UResource, resource_string: str):
+        # name[.instance][#message], an empty instance or message is only set when followed by another part
+        if resource_string is None or not resource_string or resource_string.isspace():
+            raise ValueError("Resource must have a command name.")
 
-        u_resource = UResource(name=resource_name)
-        if resource_instance is not None:
-            u_resource.instance = resource_instance
-        if resource_message is not None:
-            u_resource.message = resource_message
-        if "rpc" in resource_name and resource_instance is not None and "response" in resource_instance:
+        message_start = resource_string.find("#")
+        name_and_instance = resource_string if message_start < 0 else resource_string[:message_start]
+        instance_start = name_and_instance.find(".")
+        if instance_start < 0:
+            if not name_and_instance:
+                raise ValueError("Resource must have a command name.")
+            u_resource.name = name_and_instance
+            resource_instance = None
+        else:
+            resource_name = name_and_instance[:instance_start]
+            name_and_instance_end = len(name_and_instance.rstrip("."))
+            if name_and_instance_end == 0:
+                raise ValueError("Resource must have a command name.")
+            u_resource.name = resource_name
+            resource_instance = None
+            if name_and_instance_end > instance_start + 1:
+                instance_end = name_and_instance.find(".", instance_start + 1)
+                resource_instance = name_and_instance[instance_start + 1 : instance_end if instance_end >= 0 else None]
+                u_resource.instance = resource_instance
+
+        if message_start >= 0 and len(resource_string.rstrip("#")) > message_start + 1:
+            message_end = resource_string.find("#", message_start + 1)
+            u_resource.message = resource_string[message_start + 1 : message_end if message_end >= 0 else None]
+        if resource_instance is not None and "rpc" in u_resource.name and "response" in resource_instance:
             u_resource.id = 0
 
-        return u_resource
-
     @staticmethod
     def remove_empty(parts):
         result = parts[:]
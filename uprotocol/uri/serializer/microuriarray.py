@@ -0,0 +1,136 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+from uprotocol.uri.factory.uresourcebuilder import UResourceBuilder
+from uprotocol.uri.serializer.microuriserializer import AddressType, MicroUriSerializer
+
+_dtypes = None
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError("MicroUriArray requires NumPy, install it with 'pip install numpy'.") from error
+    return numpy
+
+
+def _get_dtypes(np):
+    global _dtypes
+    if _dtypes is None:
+        wire = np.dtype(
+            [
+                ("up_version", "u1"),
+                ("address_type", "u1"),
+                ("resource_id", ">u2"),
+                ("ue_id", ">u2"),
+                ("ue_version", "u1"),
+                ("unused", "u1"),
+            ]
+        )
+        fields = np.dtype([("ue_id", "u2"), ("ue_version", "u1"), ("resource_id", "u2"), ("address_type", "u1")])
+        _dtypes = wire, fields
+    return _dtypes
+
+
+class MicroUriArray:
+    """
+    Vectorized encoding and decoding of local micro URIs with NumPy, for buffers holding many 8 byte local micro
+    URIs back to back (as written by MicroUriSerializer.serialize_many()) that are analysed in bulk rather than
+    turned into UUri objects one by one.<br>
+    The micro URIs are decoded to a NumPy structured array with the fields ue_id, ue_version, resource_id and
+    address_type. NumPy is an optional dependency, it is only imported when one of these methods is called.
+    """
+
+    @staticmethod
+    def dtype():
+        """
+        Get the NumPy dtype of decoded micro URIs, to build arrays passed to encode().<br><br>
+        @return:Returns the structured dtype with the fields ue_id, ue_version, resource_id and address_type.
+        """
+        return _get_dtypes(_numpy())[1]
+
+    @staticmethod
+    def decode(buffer):
+        """
+        Decode a buffer of local micro URIs.<br><br>
+        @param buffer:The buffer, bytes, a bytearray or a memoryview, holding 8 byte local micro URIs.
+        @return:Returns the NumPy structured array with one row per micro URI.
+        """
+        np = _numpy()
+        wire_dtype, dtype = _get_dtypes(np)
+        data = np.frombuffer(buffer, dtype=np.uint8)
+        if data.size % MicroUriSerializer.LOCAL_MICRO_URI_LENGTH != 0:
+            raise ValueError("Buffer length must be a multiple of the local micro URI length.")
+        wire = data.view(wire_dtype)
+        invalid = np.flatnonzero(
+            (wire["up_version"] != MicroUriSerializer.UP_VERSION) | (wire["address_type"] != AddressType.LOCAL.value)
+        )
+        if invalid.size > 0:
+            raise ValueError(
+                f"Invalid local micro URI at offset {invalid[0] * MicroUriSerializer.LOCAL_MICRO_URI_LENGTH}."
+            )
+
+        array = np.empty(wire.size, dtype=dtype)
+        for field in dtype.names:
+            array[field] = wire[field]
+        return array
+
+    @staticmethod
+    def encode(array) -> bytearray:
+        """
+        Encode decoded micro URIs back to a buffer of local micro URIs.<br><br>
+        @param array:A NumPy structured array with the fields of dtype(), as returned by decode().
+        @return:Returns the buffer holding the 8 byte local micro URIs back to back.
+        """
+        np = _numpy()
+        wire_dtype, _ = _get_dtypes(np)
+        if np.any(array["address_type"] != AddressType.LOCAL.value):
+            raise ValueError("Only local micro URIs can be encoded.")
+
+        buffer = bytearray(len(array) * MicroUriSerializer.LOCAL_MICRO_URI_LENGTH)
+        wire = np.frombuffer(buffer, dtype=wire_dtype)
+        wire["up_version"] = MicroUriSerializer.UP_VERSION
+        wire["address_type"] = AddressType.LOCAL.value
+        wire["resource_id"] = array["resource_id"]
+        wire["ue_id"] = array["ue_id"]
+        wire["ue_version"] = array["ue_version"]
+        return buffer
+
+    @staticmethod
+    def is_rpc_method(array):
+        """
+        Vectorized UriValidator.is_rpc_method() for decoded micro URIs.<br><br>
+        @param array:The decoded micro URIs.
+        @return:Returns a boolean array, true for the URIs of RPC methods and responses, whose resource id is
+        below UResourceBuilder.MIN_TOPIC_ID.
+        """
+        return array["resource_id"] < UResourceBuilder.MIN_TOPIC_ID
+
+    @staticmethod
+    def is_rpc_response(array):
+        """
+        Vectorized UriValidator.is_rpc_response() for decoded micro URIs.<br><br>
+        @param array:The decoded micro URIs.
+        @return:Returns a boolean array, true for the URIs of RPC responses.
+        """
+        return array["resource_id"] == 0
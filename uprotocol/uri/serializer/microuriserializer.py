@@ -20,12 +20,14 @@ SPDX-FileType: SOURCE
 SPDX-License-Identifier: Apache-2.0
 """
 
+import struct
+from array import array
 from enum import Enum
+from typing import Iterable, Iterator, List, Optional, Tuple
 
-from uprotocol.proto.uri_pb2 import UAuthority, UEntity, UUri
+from uprotocol.proto.uri_pb2 import UUri
 from uprotocol.uri.factory.uresourcebuilder import UResourceBuilder
 from uprotocol.uri.serializer.uriserializer import UriSerializer
-from uprotocol.uri.validator.urivalidator import UriValidator
 
 
 class AddressType(Enum):
@@ -51,11 +53,24 @@ def keep_8_least_significant_bits(n: int):
     return n & 0xFF
 
 
+# UP_VERSION, address type, UResource id, UEntity id, UE_VERSION and the unused byte, in network order.
+_HEADER = struct.Struct("!BBHHBx")
+
+_LOCAL = AddressType.LOCAL.value
+_IPV4 = AddressType.IPv4.value
+_IPV6 = AddressType.IPv6.value
+_ID = AddressType.ID.value
+
+
 class MicroUriSerializer(UriSerializer):
     """
     UUri Serializer that serializes a UUri to a byte[] (micro format) per <a
     href="https://github.com/eclipse-uprotocol/uprotocol-spec/blob/main/basics/uri.adoc">
-    https://github.com/eclipse-uprotocol/uprotocol-spec/blob/main/basics/uri.adoc</a>
+    https://github.com/eclipse-uprotocol/uprotocol-spec/blob/main/basics/uri.adoc</a><br>
+    Besides serialize() and deserialize(), micro URIs can be written to and read from caller supplied buffers
+    with serialize_into() and deserialize_from(), and many micro URIs can be packed back to back in a single
+    buffer with serialize_many() and deserialize_many(). Such a buffer can be read as a stream with
+    iter_deserialize() and iter_fields(), or indexed with index() for random access.
     """
 
     LOCAL_MICRO_URI_LENGTH = 8
@@ -71,65 +86,50 @@ class MicroUriSerializer(UriSerializer):
         @param uri:The UUri data object.
         @return:Returns a byte[] representing the serialized UUri.
         """
-
-        if uri is None or UriValidator.is_empty(uri) or not UriValidator.is_micro_form(uri):
+        fields = self._encode(uri)
+        if fields is None:
             return bytearray()
+        micro_uri = bytearray(self._size(fields))
+        self._pack(fields, micro_uri, 0)
+        return micro_uri
 
-        maybe_ue_id: int = uri.entity.id
-        maybe_uresource_id: int = uri.resource.id
-
-        byte_arr: bytearray = bytearray()
-
-        byte_arr.append(self.UP_VERSION)
-
-        address_type: AddressType = AddressType.LOCAL
-        if uri.authority.HasField("ip"):
-            length: int = len(uri.authority.ip)
-            if length == 4:
-                address_type = AddressType.IPv4
-            elif length == 16:
-                address_type = AddressType.IPv6
-            else:
-                return bytearray()
-        elif uri.authority.HasField("id"):
-            address_type = AddressType.ID
-
-        byte_arr.append(address_type.value)
-
-        if maybe_uresource_id > 0xFFFF or maybe_ue_id > 0xFFFF:
-            return bytearray()
-
-        # URESOURCE_ID
-        byte_arr.append(keep_8_least_significant_bits(maybe_uresource_id >> 8))
-        byte_arr.append(keep_8_least_significant_bits(maybe_uresource_id))
-
-        # UENTITY_ID
-        byte_arr.append(keep_8_least_significant_bits(maybe_ue_id >> 8))
-        byte_arr.append(keep_8_least_significant_bits(maybe_ue_id))
-
-        # UE_VERSION
-        unsigned_value: int = uri.entity.version_major
-        byte_arr.append(keep_8_least_significant_bits(unsigned_value))
-
-        # UNUSED
-        byte_arr.append(0x0)
-
-        # Populating the UAuthority
-        if address_type != AddressType.LOCAL:
-            # Write the ID length if the type is ID
-            if address_type == AddressType.ID:
-                # If the ID length is greater than the maximum allowed, return an empty byte[]
-                if len(uri.authority.id) > self.MAX_ID_LENGTH:
-                    return bytearray()
-                byte_arr.append(keep_8_least_significant_bits(len(uri.authority.id)))
-            try:
-                if uri.authority.HasField("ip"):
-                    byte_arr.extend(bytearray(uri.authority.ip))
-                elif uri.authority.HasField("id"):
-                    byte_arr.extend(bytearray(uri.authority.id))
-            except Exception:
-                return bytearray()
-        return byte_arr
+    def serialize_into(self, uri: UUri, buffer: bytearray, offset: int = 0) -> int:
+        """
+        Serialize a UUri into a caller supplied buffer.<br><br>
+        @param uri:The UUri data object.
+        @param buffer:The writable buffer, a bytearray or a writable memoryview.
+        @param offset:The position in the buffer where the micro URI is written.
+        @return:Returns the number of bytes written, 0 if the UUri cannot be serialized into a micro URI.
+        """
+        fields = self._encode(uri)
+        if fields is None:
+            return 0
+        size = self._size(fields)
+        if offset < 0 or offset + size > len(buffer):
+            raise ValueError("Buffer too small for the micro URI.")
+        self._pack(fields, buffer, offset)
+        return size
+
+    def serialize_many(self, uris: Iterable[UUri]) -> bytearray:
+        """
+        Serialize UUris into a single buffer holding their micro URIs back to back.<br><br>
+        @param uris:The UUri data objects.
+        @return:Returns the buffer of the concatenated micro URIs.
+        """
+        encoded = []
+        size = 0
+        for index, uri in enumerate(uris):
+            fields = self._encode(uri)
+            if fields is None:
+                raise ValueError(f"UUri at index {index} cannot be serialized into a micro URI.")
+            encoded.append(fields)
+            size += self._size(fields)
+
+        buffer = bytearray(size)
+        offset = 0
+        for fields in encoded:
+            offset = self._pack(fields, buffer, offset)
+        return buffer
 
     def deserialize(self, micro_uri: bytes) -> UUri:
         """
@@ -138,49 +138,176 @@ class MicroUriSerializer(UriSerializer):
         @return:Returns an UUri data object from the serialized
         format of a microUri.
         """
-        if micro_uri is None or len(micro_uri) < self.LOCAL_MICRO_URI_LENGTH:
-            return UUri()
-
-        if micro_uri[0] != self.UP_VERSION:
-            return UUri()
-
-        u_resource_id = ((micro_uri[2] & 0xFF) << 8) | (micro_uri[3] & 0xFF)
-        addresstype = AddressType.from_value(micro_uri[1])
-
-        # Validate Type is found
-        if addresstype is None:
-            return UUri()
-
-        # Validate that the micro_uri is the correct length for the type
-        address_type = addresstype
-        if address_type == AddressType.LOCAL and len(micro_uri) != self.LOCAL_MICRO_URI_LENGTH:
+        if micro_uri is None:
             return UUri()
-        elif address_type == AddressType.IPv4 and len(micro_uri) != self.IPV4_MICRO_URI_LENGTH:
+        uri, size = self.deserialize_from(micro_uri)
+        if size != len(micro_uri):
             return UUri()
-        elif address_type == AddressType.IPv6 and len(micro_uri) != self.IPV6_MICRO_URI_LENGTH:
-            return UUri()
-
-        # UENTITY_ID
-        ue_id = ((micro_uri[4] & 0xFF) << 8) | (micro_uri[5] & 0xFF)
-
-        # UE_VERSION
-        ui_version = micro_uri[6]
-
-        u_authority = None
-        if address_type in (AddressType.IPv4, AddressType.IPv6):
-            length = 4 if address_type == AddressType.IPv4 else 16
-            data = micro_uri[8 : 8 + length]
-            u_authority = UAuthority(ip=bytes(data))
-        elif address_type == AddressType.ID:
-            length = micro_uri[8]
-            u_authority = UAuthority(id=bytes(micro_uri[9 : 9 + length]))
-
-        uri = UUri(
-            entity=UEntity(id=ue_id, version_major=ui_version),
-            resource=UResourceBuilder.from_id(u_resource_id),
-        )
+        return uri
 
-        if u_authority is not None:
-            uri.authority.CopyFrom(u_authority)
+    def deserialize_from(self, buffer: bytes, offset: int = 0) -> Tuple[UUri, int]:
+        """
+        Deserialize the micro URI starting at an offset of a buffer.<br><br>
+        @param buffer:The buffer, bytes, a bytearray or a memoryview.
+        @param offset:The position of the micro URI in the buffer.
+        @return:Returns the UUri and the number of bytes it spans, an empty UUri and 0 if the buffer does not
+        hold a valid micro URI at that offset.
+        """
+        header = self._read_header(buffer, offset)
+        if header is None:
+            return UUri(), 0
+        size, address_type, resource_id, ue_id, ue_version = header
+
+        uri = UUri()
+        if address_type == _IPV4 or address_type == _IPV6:
+            uri.authority.ip = bytes(buffer[offset + self.LOCAL_MICRO_URI_LENGTH : offset + size])
+        elif address_type == _ID:
+            uri.authority.id = bytes(buffer[offset + self.LOCAL_MICRO_URI_LENGTH + 1 : offset + size])
+
+        entity = uri.entity
+        entity.id = ue_id
+        entity.version_major = ue_version
+
+        # Same UResource as UResourceBuilder.from_id(), filled in place
+        resource = uri.resource
+        if resource_id < UResourceBuilder.MIN_TOPIC_ID:
+            resource.name = "rpc"
+            if resource_id == 0:
+                resource.instance = "response"
+        resource.id = resource_id
+        return uri, size
+
+    def deserialize_many(self, buffer: bytes) -> List[UUri]:
+        """
+        Deserialize a buffer holding micro URIs back to back, as written by serialize_many().<br><br>
+        @param buffer:The buffer, bytes, a bytearray or a memoryview.
+        @return:Returns the UUris in the order they appear in the buffer.
+        """
+        return [uri for _, uri in self.iter_deserialize(buffer)]
 
-        return uri
+    def iter_deserialize(self, buffer: bytes) -> Iterator[Tuple[int, UUri]]:
+        """
+        Deserialize a buffer holding micro URIs back to back one at a time, as they are consumed.<br><br>
+        @param buffer:The buffer, bytes, a bytearray or a memoryview.
+        @return:Returns an iterator of the offset of each micro URI in the buffer and its UUri. It raises a
+        ValueError when it reaches an invalid micro URI.
+        """
+        view = memoryview(buffer)
+        offset = 0
+        end = len(view)
+        while offset < end:
+            uri, size = self.deserialize_from(view, offset)
+            if size == 0:
+                raise ValueError(f"Invalid micro URI at offset {offset}.")
+            yield offset, uri
+            offset += size
+
+    def iter_fields(self, buffer: bytes) -> Iterator[Tuple[int, int, int, int, int, memoryview]]:
+        """
+        Read the fields of the micro URIs of a buffer holding them back to back, without building UUris nor
+        copying the authorities.<br><br>
+        @param buffer:The buffer, bytes, a bytearray or a memoryview.
+        @return:Returns an iterator of (offset, address_type, ue_id, ue_version, resource_id, address) tuples,
+        where address is a memoryview of the IP address or the id in the buffer, empty for a local micro URI. It
+        raises a ValueError when it reaches an invalid micro URI.
+        """
+        view = memoryview(buffer)
+        offset = 0
+        end = len(view)
+        while offset < end:
+            header = self._read_header(view, offset)
+            if header is None:
+                raise ValueError(f"Invalid micro URI at offset {offset}.")
+            size, address_type, resource_id, ue_id, ue_version = header
+            address_offset = offset + self.LOCAL_MICRO_URI_LENGTH + (1 if address_type == _ID else 0)
+            yield offset, address_type, ue_id, ue_version, resource_id, view[address_offset : offset + size]
+            offset += size
+
+    def index(self, buffer: bytes) -> array:
+        """
+        Build the table of the offsets of the micro URIs of a buffer holding them back to back. Micro URIs with an
+        id authority have a variable length, the table gives random access to them with deserialize_from().<br><br>
+        @param buffer:The buffer, bytes, a bytearray or a memoryview.
+        @return:Returns the array of the offsets of the micro URIs in the buffer.
+        """
+        view = memoryview(buffer)
+        offsets = array("Q")
+        offset = 0
+        end = len(view)
+        while offset < end:
+            header = self._read_header(view, offset)
+            if header is None:
+                raise ValueError(f"Invalid micro URI at offset {offset}.")
+            offsets.append(offset)
+            offset += header[0]
+        return offsets
+
+    def _read_header(self, buffer: bytes, offset: int) -> Optional[Tuple[int, int, int, int, int]]:
+        length = len(buffer) - offset
+        if offset < 0 or length < self.LOCAL_MICRO_URI_LENGTH:
+            return None
+
+        version, address_type, resource_id, ue_id, ue_version = _HEADER.unpack_from(buffer, offset)
+        if version != self.UP_VERSION:
+            return None
+
+        if address_type == _LOCAL:
+            size = self.LOCAL_MICRO_URI_LENGTH
+        elif address_type == _IPV4:
+            size = self.IPV4_MICRO_URI_LENGTH
+        elif address_type == _IPV6:
+            size = self.IPV6_MICRO_URI_LENGTH
+        elif address_type == _ID and length > self.LOCAL_MICRO_URI_LENGTH:
+            size = self.LOCAL_MICRO_URI_LENGTH + 1 + buffer[offset + self.LOCAL_MICRO_URI_LENGTH]
+        else:
+            return None
+        if size > length:
+            return None
+        return size, address_type, resource_id, ue_id, ue_version
+
+    def _encode(self, uri: UUri) -> Optional[Tuple[int, int, int, int, bytes]]:
+        # Same checks as UriValidator.is_micro_form(), inlined on the serialization path
+        if uri is None or not uri.entity.HasField("id") or not uri.resource.HasField("id"):
+            return None
+
+        ue_id = uri.entity.id
+        resource_id = uri.resource.id
+        if resource_id > 0xFFFF or ue_id > 0xFFFF:
+            return None
+
+        authority = uri.authority
+        if authority.HasField("ip"):
+            address = authority.ip
+            if len(address) == 4:
+                address_type = _IPV4
+            elif len(address) == 16:
+                address_type = _IPV6
+            else:
+                return None
+        elif authority.HasField("id"):
+            address = authority.id
+            if len(address) > self.MAX_ID_LENGTH:
+                return None
+            address_type = _ID
+        elif authority.HasField("name"):
+            return None
+        else:
+            address = b""
+            address_type = _LOCAL
+
+        return address_type, resource_id, ue_id, uri.entity.version_major & 0xFF, address
+
+    def _size(self, fields: Tuple[int, int, int, int, bytes]) -> int:
+        address_type, _, _, _, address = fields
+        return self.LOCAL_MICRO_URI_LENGTH + len(address) + (1 if address_type == _ID else 0)
+
+    def _pack(self, fields: Tuple[int, int, int, int, bytes], buffer: bytearray, offset: int) -> int:
+        address_type, resource_id, ue_id, ue_version, address = fields
+        _HEADER.pack_into(buffer, offset, self.UP_VERSION, address_type, resource_id, ue_id, ue_version)
+        offset += self.LOCAL_MICRO_URI_LENGTH
+        if address_type == _ID:
+            buffer[offset] = len(address)
+            offset += 1
+        end = offset + len(address)
+        buffer[offset:end] = address
+        return end
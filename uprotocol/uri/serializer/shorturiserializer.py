@@ -20,11 +20,9 @@ SPDX-FileType: SOURCE
 SPDX-License-Identifier: Apache-2.0
 """
 
-import re
-import socket
 from typing import List
 
-from uprotocol.proto.uri_pb2 import UAuthority, UEntity, UResource, UUri
+from uprotocol.proto.uri_pb2 import UAuthority, UResource, UUri
 from uprotocol.uri.factory.uresourcebuilder import UResourceBuilder
 from uprotocol.uri.serializer.ipaddress import IpAddress
 from uprotocol.uri.serializer.uriserializer import UriSerializer
@@ -32,23 +30,13 @@ from uprotocol.uri.validator.urivalidator import UriValidator
 
 
 def convert_packed_ipaddr_to_string(packed_ipaddr: bytes):
-    for address_type in [socket.AF_INET, socket.AF_INET6]:
-        try:
-            """
-            socket.inet_ntop():
-            Convert a packed IP address (a bytes-like object
-            of some number of bytes)
-            to its standard, family-specific string representation
-            (for example, '7.10.0.5' or '5aef:2b::8')
-            """
-            return socket.inet_ntop(address_type, packed_ipaddr)
-        except ValueError:
-            pass
-
-    raise Exception(
-        "Could not find correct address family to unpack ip address",
-        "from bytes to str",
-    )
+    ip_address = IpAddress.unpack(packed_ipaddr)
+    if ip_address is None:
+        raise Exception(
+            "Could not find correct address family to unpack ip address",
+            "from bytes to str",
+        )
+    return ip_address
 
 
 class ShortUriSerializer(UriSerializer):
@@ -64,11 +52,11 @@ class ShortUriSerializer(UriSerializer):
         if uri.HasField("authority"):
             authority: UAuthority = uri.authority
             if uri.authority.HasField("ip"):
-                try:
-                    string_builder.append("//")
-                    string_builder.append(convert_packed_ipaddr_to_string(authority.ip))
-                except Exception:
+                ip_address = IpAddress.unpack(authority.ip)
+                if ip_address is None:
                     return ""
+                string_builder.append("//")
+                string_builder.append(ip_address)
             elif uri.authority.HasField("id"):
                 string_builder.append("//")
                 string_builder.append(authority.id.decode("utf-8"))
@@ -79,7 +67,7 @@ class ShortUriSerializer(UriSerializer):
         string_builder.append(self.build_software_entity_part_of_uri(uri.entity))
         string_builder.append(self.build_resource_part_of_uri(uri))
 
-        return re.sub("/+$", "", "".join(string_builder))
+        return "".join(string_builder).rstrip("/")
 
     @staticmethod
     def build_resource_part_of_uri(uri: UUri):
@@ -147,8 +135,9 @@ class ShortUriSerializer(UriSerializer):
         else:
             if uri_parts[2].strip() == "":
                 return UUri()
-            if IpAddress.is_valid(uri_parts[2]):
-                authority = UAuthority(ip=IpAddress.to_bytes(uri_parts[2]))
+            packed_ip_address = IpAddress.pack(uri_parts[2])
+            if packed_ip_address is not None:
+                authority = UAuthority(ip=packed_ip_address)
             else:
                 authority = UAuthority(id=bytes(uri_parts[2], "utf-8"))
 
@@ -174,14 +163,11 @@ class ShortUriSerializer(UriSerializer):
         except Exception:
             return UUri()
 
-        entity = UEntity()
         new_uri = UUri()
         if ue_id_int is not None:
-            entity.id = ue_id_int
-            new_uri.entity.CopyFrom(entity)
+            new_uri.entity.id = ue_id_int
         if ue_version_int is not None:
-            entity.version_major = ue_version_int
-            new_uri.entity.CopyFrom(entity)
+            new_uri.entity.version_major = ue_version_int
 
         if authority is not None:
             new_uri.authority.CopyFrom(authority)
@@ -0,0 +1,157 @@
+"""
+SPDX-FileCopyrightText: Copyright (c) 2023 Contributors to the
+Eclipse Foundation
+
+See the NOTICE file(s) distributed with this work for additional
+information regarding copyright ownership.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+SPDX-FileType: SOURCE
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Union
+
+from uprotocol.proto.uri_pb2 import UUri
+from uprotocol.uri.factory.urikey import UriKey
+from uprotocol.uri.serializer.cachinguriserializer import UriCacheStats
+from uprotocol.uri.serializer.longuriserializer import LongUriSerializer
+from uprotocol.uri.serializer.uriserializer import UriSerializer
+from uprotocol.uri.validator.urivalidator import UriValidator
+
+
+class UriProperties:
+    """
+    Bits of the bitmask summarizing what UriValidator reports about a UUri.
+    """
+
+    EMPTY = 1 << 0
+    LOCAL = 1 << 1
+    REMOTE = 1 << 2
+    MICRO_FORM = 1 << 3
+    LONG_FORM = 1 << 4
+    RPC_METHOD = 1 << 5
+    RPC_RESPONSE = 1 << 6
+    # UriValidator.validate() succeeds
+    VALID = 1 << 7
+    # The resource has a name and a message, as required from a topic
+    TOPIC = 1 << 8
+
+    @staticmethod
+    def of(uri: UUri) -> int:
+        """
+        Compute the properties of a UUri.<br><br>
+        @param uri:The UUri, None is empty.
+        @return:Returns the bitmask of the UriProperties of the UUri.
+        """
+        if uri is None:
+            uri = UUri()
+        properties = UriProperties.LOCAL if UriValidator.is_local(uri.authority) else UriProperties.REMOTE
+        if UriValidator.is_empty(uri):
+            properties |= UriProperties.EMPTY
+        if UriValidator.is_micro_form(uri):
+            properties |= UriProperties.MICRO_FORM
+        if UriValidator.is_long_form(uri):
+            properties |= UriProperties.LONG_FORM
+        if UriValidator.is_rpc_method(uri):
+            properties |= UriProperties.RPC_METHOD
+        if UriValidator.is_rpc_response(uri):
+            properties |= UriProperties.RPC_RESPONSE
+        if UriValidator.validate(uri).is_success():
+            properties |= UriProperties.VALID
+        if uri.resource.name and uri.resource.message:
+            properties |= UriProperties.TOPIC
+        return properties
+
+
+class UriPropertiesCache:
+    """
+    Bounded least recently used cache of the UriProperties of URIs.<br>
+    Validators check the same few sources and sinks on every message. The properties of a URI are computed once,
+    afterwards all the checks of a URI cost a single dictionary lookup. UUris are looked up by their UriKey and
+    serialized URIs by their string, deserialized with the given serializer on a miss. The cache is safe to share
+    between threads.
+    """
+
+    def __init__(self, max_entries: int = 1024, serializer: UriSerializer = None):
+        """
+        @param max_entries:The maximum number of URIs kept.
+        @param serializer:The UriSerializer of the string URIs, long URIs by default.
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive.")
+        self.max_entries = max_entries
+        self.serializer = serializer if serializer is not None else LongUriSerializer()
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, uri: Union[UUri, UriKey, str]) -> int:
+        """
+        Get the properties of a URI.<br><br>
+        @param uri:The UUri, its UriKey, or a URI string in the format of the serializer. None is empty.
+        @return:Returns the bitmask of the UriProperties of the URI.
+        """
+        # The encoding of a UUri is hashed and compared like its UriKey, without building one
+        if isinstance(uri, UUri):
+            key = uri.SerializeToString()
+        else:
+            key = uri if uri is not None else b""
+        with self._lock:
+            properties = self._entries.get(key)
+            if properties is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return properties
+            self._misses += 1
+
+        if isinstance(uri, UUri):
+            properties = UriProperties.of(uri)
+        elif isinstance(key, str):
+            properties = UriProperties.of(self.serializer.deserialize(key))
+        else:
+            properties = UriProperties.of(UUri.FromString(key))
+        with self._lock:
+            self._entries[key] = properties
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return properties
+
+    def check(self, uri: Union[UUri, UriKey, str], properties: int) -> bool:
+        """
+        Check that a URI has all the given properties.<br><br>
+        @param uri:The UUri, its UriKey, or a URI string in the format of the serializer.
+        @param properties:The bitmask of the required UriProperties.
+        @return:Returns true if every property of the bitmask is set for the URI.
+        """
+        return self.get(uri) & properties == properties
+
+    def stats(self) -> UriCacheStats:
+        """
+        Get the counters of the cache.<br><br>
+        @return:Returns a snapshot of the UriCacheStats.
+        """
+        with self._lock:
+            return UriCacheStats(self._hits, self._misses, self._evictions, len(self._entries))
+
+    def clear(self):
+        """
+        Drop every cached URI.
+        """
+        with self._lock:
+            self._entries.clear()
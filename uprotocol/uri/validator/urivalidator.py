@@ -20,12 +20,23 @@ SPDX-FileType: SOURCE
 SPDX-License-Identifier: Apache-2.0
 """
 
-from multimethod import multimethod
+from typing import Union
 
 from uprotocol.proto.uri_pb2 import UAuthority, UResource, UUri
 from uprotocol.uri.factory.uresourcebuilder import UResourceBuilder
 from uprotocol.validation.validationresult import ValidationResult
 
+# Compared against, never modified
+_RPC_RESPONSE = UResourceBuilder.for_rpc_response()
+
+
+def _is_micro_authority(authority: UAuthority) -> bool:
+    return authority.HasField("ip") or authority.HasField("id") or authority.ByteSize() == 0
+
+
+def _is_long_authority(authority: UAuthority) -> bool:
+    return (authority.HasField("name") and authority.name.strip() != "") or authority.ByteSize() == 0
+
 
 class UriValidator:
     """
@@ -101,44 +112,26 @@ class UriValidator:
         @return Returns true if this  URI is an empty container and has
         no valuable information in building uProtocol sinks or sources.
         """
-        return uri is None or uri == UUri()
+        # A UUri with an entity is never empty, otherwise an empty UUri has nothing to serialize
+        return uri is None or (not uri.HasField("entity") and uri.ByteSize() == 0)
 
-    @multimethod
-    def is_rpc_method(uri: UUri) -> bool:  # noqa: N805
+    @staticmethod
+    def is_rpc_method(uri: Union[UUri, UResource, None]) -> bool:
         """
         Returns true if URI is of type RPC. A UUri is of type RPC if it
         contains the word rpc in the resource name
         and has an instance name and/or the id is less than MIN_TOPIC_ID.
-        @param uri: UUri to check if it is of type RPC
+        @param uri: UUri or UResource to check if it is of type RPC, may be None
         @return: Returns true if this resource specifies an RPC method
         call or RPC response.
         """
-        return uri is not None and UriValidator.is_rpc_method(uri.resource)
-
-    @multimethod
-    def is_rpc_method(uri: None) -> bool:  # noqa: N805
-        """
-        Returns false if input is None.
-        @param uri: None
-        @return Returns false.
-        """
-        return False
-
-    @multimethod
-    def is_rpc_method(resource: UResource) -> bool:  # noqa: N805
-        """
-        Returns true if Uresource is of type RPC.
-        @param resource: UResource to check if it is of type RPC method
-        @return Returns true if URI is of type RPC.
-        """
-        return (
-            resource is not None
-            and resource.name == "rpc"
-            and (
-                resource.HasField("instance")
-                and resource.instance.strip() != ""
-                or (resource.HasField("id") and resource.id < UResourceBuilder.MIN_TOPIC_ID)
-            )
+        if uri is None:
+            return False
+        resource = uri if isinstance(uri, UResource) else uri.resource
+        return resource.name == "rpc" and (
+            resource.HasField("instance")
+            and resource.instance.strip() != ""
+            or (resource.HasField("id") and resource.id < UResourceBuilder.MIN_TOPIC_ID)
         )
 
     @staticmethod
@@ -147,67 +140,49 @@ class UriValidator:
 
     @staticmethod
     def is_rpc_response(uri: UUri) -> bool:
-        return uri is not None and uri.resource == UResourceBuilder.for_rpc_response()
+        return uri is not None and uri.resource == _RPC_RESPONSE
 
-    @multimethod
-    def is_micro_form(uri: UUri) -> bool:  # noqa: N805
+    @staticmethod
+    def is_micro_form(uri: Union[UUri, UAuthority]) -> bool:
         """
         Determines if this UUri can be serialized into
-        a micro form UUri.<br><br>
-        @param uuri: An UUri proto message object
+        a micro form UUri, or if this UAuthority can be represented in micro format.
+        Micro UAuthorities are local or ones
+        that contain IP address or IDs.<br><br>
+        @param uri: An UUri or UAuthority proto message object
         @return:Returns true if this UUri can be serialized into
         a micro form UUri.
         """
+        if isinstance(uri, UAuthority):
+            return _is_micro_authority(uri)
 
+        # A UUri with an entity id is not empty
         return (
             uri is not None
-            and not UriValidator.is_empty(uri)
             and uri.entity.HasField("id")
             and uri.resource.HasField("id")
-            and UriValidator.is_micro_form(uri.authority)
+            and _is_micro_authority(uri.authority)
         )
 
-    @multimethod
-    def is_micro_form(authority: UAuthority) -> bool:  # noqa: N805
-        """
-        check if UAuthority can be represented in micro format.
-        Micro UAuthorities are local or ones
-        that contain IP address or IDs.
-        @param authority UAuthority to check
-        @return Returns true if UAuthority can be represented in micro format
-        """
-
-        return UriValidator.is_local(authority) or (authority.HasField("ip") or (authority.HasField("id")))
-
-    @multimethod
-    def is_long_form(uri: UUri) -> bool:  # noqa: N805
+    @staticmethod
+    def is_long_form(uri: Union[UUri, UAuthority]) -> bool:
         """
         Determines if this UUri can be serialized into
-        a long form UUri.<br><br>
-        @param uuri: An UUri proto message object
+        a long form UUri, or if this UAuthority is local or contains a name so that
+        it can be serialized into long format.<br><br>
+        @param uri: An UUri or UAuthority proto message object
         @return:Returns true if this UUri can be serialized into
         a long form UUri.
         """
+        if isinstance(uri, UAuthority):
+            return _is_long_authority(uri)
 
+        # A UUri with an entity name is not empty
         return (
             uri is not None
-            and not UriValidator.is_empty(uri)
-            and UriValidator.is_long_form(uri.authority)
             and uri.entity.name.strip() != ""
             and uri.resource.name.strip() != ""
-        )
-
-    @multimethod
-    def is_long_form(authority: UAuthority) -> bool:  # noqa: N805
-        """
-        Returns true if UAuthority is local contains names so
-        that it can be serialized into long format.
-        @param authority UAuthority to check
-        @return Returns true if URI contains names so that
-        it can be serialized into long format.
-        """
-        return authority is not None and (
-            UriValidator.is_local(authority) or (authority.HasField("name") and authority.name.strip() != "")
+            and _is_long_authority(uri.authority)
         )
 
     @staticmethod
@@ -219,7 +194,7 @@ class UriValidator:
         @return Returns true if UAuthority is local meaning the
         Authority is not populated with name, ip and id
         """
-        return (authority is not None) and (authority == UAuthority())
+        return authority is not None and authority.ByteSize() == 0
 
     @staticmethod
     def is_remote(authority: UAuthority) -> bool:
@@ -230,7 +205,7 @@ class UriValidator:
         @return Returns true if UAuthority is remote meaning
         the name and/or ip/id is populated.
         """
-        return (authority is not None) and (not authority == UAuthority())
+        return authority is not None and authority.ByteSize() != 0
 
     @staticmethod
     def is_short_form(uri: UUri) -> bool:
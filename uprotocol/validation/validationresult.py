@@ -53,7 +53,7 @@ class ValidationResult(ABC):
 
     @staticmethod
     def success():
-        return Success()
+        return _SUCCESS
 
     @staticmethod
     def failure(message):
@@ -103,3 +103,7 @@ class Success(ValidationResult):
         if isinstance(other, Success):
             return self.to_status() == other.to_status()
         return False
+
+
+# Success holds no state, a single instance is shared
+_SUCCESS = Success()